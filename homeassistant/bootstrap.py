@@ -34,6 +34,7 @@ from .helpers import (
     issue_registry,
     recorder,
     restore_state,
+    storage,
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
@@ -245,6 +246,10 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         """
         platform.uname().processor  # pylint: disable=expression-not-assigned
 
+    # The core config is only loaded once the core integrations are set up,
+    # read it in the background while the registries load
+    storage.async_preload(hass, core.CORE_STORAGE_KEY)
+
     # Load the registries and cache the result of platform.uname().processor
     entity.async_setup(hass)
     template.async_setup(hass)
@@ -551,7 +556,7 @@ async def _async_set_up_integrations(
 ) -> None:
     """Set up all the integrations."""
     hass.data[DATA_SETUP_STARTED] = {}
-    setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
+    hass.data.setdefault(DATA_SETUP_TIME, {})
 
     watch_task = asyncio.create_task(_async_watch_pending_setups(hass))
 
@@ -614,6 +619,13 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import the integrations and the platforms they provide for the other
+    # integrations in the executor so the imports do not block the event
+    # loop when the integrations are set up
+    loader.async_pre_import_integrations(
+        hass, integration_cache.values(), domains_to_setup
+    )
+
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
     # We do not wait for this since its an optimization only
@@ -715,12 +727,35 @@ async def _async_set_up_integrations(
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATIONS, {})
 
+    # All integrations we need at startup have been loaded by now
+    await loader.async_save_manifest_cache(hass)
+    storage.async_clear_preload(hass)
+
     _LOGGER.debug(
-        "Integration setup times: %s",
-        {
-            integration: timedelta.total_seconds()
-            for integration, timedelta in sorted(
-                setup_time.items(), key=lambda item: item[1].total_seconds()
-            )
-        },
+        "Integration import and setup times: %s",
+        async_get_integration_startup_report(hass),
+    )
+
+
+@core.callback
+def async_get_integration_startup_report(
+    hass: core.HomeAssistant,
+) -> dict[str, dict[str, float]]:
+    """Return the seconds each integration took to import and to set up.
+
+    The integrations are sorted by the total time they took.
+    """
+    import_time: dict[str, float] = hass.data.get(loader.DATA_IMPORT_TIME, {})
+    setup_time: dict[str, timedelta] = hass.data.get(DATA_SETUP_TIME, {})
+    report = {
+        integration: {
+            "import": import_time.get(integration, 0.0),
+            "setup": setup_time[integration].total_seconds()
+            if integration in setup_time
+            else 0.0,
+        }
+        for integration in import_time.keys() | setup_time.keys()
+    }
+    return dict(
+        sorted(report.items(), key=lambda item: item[1]["import"] + item[1]["setup"])
     )
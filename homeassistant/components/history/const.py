@@ -1,7 +1,14 @@
 """History integration constants."""
 
+from datetime import timedelta
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The states of a chunked history_during_period response are sent
+# in chunks of at most this many entities and this time window
+HISTORY_CHUNK_MAX_ENTITIES = 50
+HISTORY_CHUNK_TIME_WINDOW = timedelta(hours=6)
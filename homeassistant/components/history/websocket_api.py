@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Iterable, MutableMapping
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
 import logging
 from typing import Any, cast
 
@@ -38,7 +38,12 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_MAX_ENTITIES,
+    HISTORY_CHUNK_TIME_WINDOW,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,6 +77,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
     return JSON_DUMP(
@@ -88,6 +94,7 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
@@ -103,6 +110,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
@@ -154,6 +163,35 @@ async def ws_get_history_during_period(
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
+
+    if msg["chunked"]:
+        msg_id: int = msg["id"]
+        # The chunks are sent from a task so it is cancelled
+        # when the connection is closed
+        task = asyncio.create_task(
+            _async_send_history_chunks(
+                hass,
+                connection,
+                msg_id,
+                start_time,
+                end_time or dt_util.utcnow(),
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                max_points,
+            )
+        )
+        connection.subscriptions[msg_id] = cancel = task.cancel
+        connection.send_result(msg_id)
+        try:
+            await task
+        finally:
+            if connection.subscriptions.get(msg_id) is cancel:
+                del connection.subscriptions[msg_id]
+        return
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
@@ -167,10 +205,158 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
+        )
+    )
+
+
+def _generate_history_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> str | None:
+    """Fetch a chunk of history significant_states and convert it to json."""
+    if not (
+        states := history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+            max_points,
         )
+    ):
+        return None
+    return _generate_websocket_response(
+        msg_id,
+        start_time,
+        end_time,
+        cast(MutableMapping[str, list[dict[str, Any]]], states),
     )
 
 
+async def _async_send_history_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> None:
+    """Send the history during a period in chunks.
+
+    The states are fetched in time windows of up to HISTORY_CHUNK_MAX_ENTITIES
+    entities and each chunk is sent as an event message in the same format
+    as history/stream. The next chunk is only fetched once the previous one
+    has been written to the client, so the memory used does not grow with
+    the requested period. A final event with "complete" set ends the response.
+
+    The result of the command is sent before the first chunk, so an error
+    is sent with the final event instead of as an error result.
+    """
+    error: dict[str, str] | None = None
+    try:
+        if not await _async_send_history_windows(
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            max_points,
+        ):
+            return
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Error fetching the history chunks of message %s", msg_id)
+        error = {
+            "code": websocket_api.ERR_UNKNOWN_ERROR,
+            "message": "Unknown error",
+        }
+    final_event: dict[str, Any] = {
+        **_generate_stream_message({}, start_time, end_time),
+        "complete": True,
+    }
+    if error is not None:
+        final_event["error"] = error
+    connection.send_message(JSON_DUMP(messages.event_message(msg_id, final_event)))
+
+
+async def _async_send_history_windows(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> bool:
+    """Send the chunks of the history during a period window by window.
+
+    If max_points is given, it is split between the windows by their duration.
+
+    Returns False if the connection was closed.
+    """
+    instance = get_instance(hass)
+    window_start = start_time
+    while window_start < end_time:
+        window_end = min(window_start + HISTORY_CHUNK_TIME_WINDOW, end_time)
+        window_max_points = max_points and max(
+            2, round(max_points * (window_end - window_start) / (end_time - start_time))
+        )
+        # The history queries exclude states updated exactly at the start time
+        # so the following windows start just before the end of the previous one
+        query_start = (
+            window_start
+            if window_start == start_time
+            else window_start - timedelta.resolution
+        )
+        for idx in range(0, len(entity_ids), HISTORY_CHUNK_MAX_ENTITIES):
+            if payload := await instance.async_add_executor_job(
+                _generate_history_chunk,
+                hass,
+                msg_id,
+                query_start,
+                window_end,
+                entity_ids[idx : idx + HISTORY_CHUNK_MAX_ENTITIES],
+                include_start_time_state and window_start == start_time,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                window_max_points,
+            ):
+                connection.send_message(payload)
+                await connection.async_drain()
+                if connection.closed:
+                    return False
+        window_start = window_end
+    return True
+
+
 def _generate_stream_message(
     states: MutableMapping[str, list[dict[str, Any]]],
     start_day: dt,
@@ -6,7 +6,7 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM
+from homeassistant.const import ATTR_ENTITY_ID, CONF_EVENT_DATA, CONF_PLATFORM
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
@@ -50,6 +50,7 @@ async def async_attach_trigger(
     )
     event_data_schema: vol.Schema | None = None
     event_data_items: ItemsView | None = None
+    event_entity_id: str | None = None
     if CONF_EVENT_DATA in config:
         # Render the schema input
         template.attach(hass, config[CONF_EVENT_DATA])
@@ -57,6 +58,8 @@ async def async_attach_trigger(
         event_data.update(
             template.render_complex(config[CONF_EVENT_DATA], variables, limited=True)
         )
+        if isinstance(entity_id := event_data.get(ATTR_ENTITY_ID), str):
+            event_entity_id = entity_id
         # Build the schema or a an items view if the schema is simple
         # and does not contain sub-dicts. We explicitly do not check for
         # list like the context data below since lists are a special case
@@ -145,12 +148,31 @@ async def async_attach_trigger(
             event.context,
         )
 
-    removes = [
-        hass.bus.async_listen(
-            event_type, handle_event, event_filter=filter_event, run_immediately=True
-        )
-        for event_type in event_types
-    ]
+    @callback
+    def handle_keyed_event(event: Event) -> None:
+        """Filter the events of the entity_id and call the action on matches."""
+        if filter_event(event):
+            handle_event(event)
+
+    if event_entity_id is not None:
+        # Only events with the entity_id can match, so they are
+        # routed with a dict lookup on the bus instead of a filter
+        removes = [
+            hass.bus.async_listen_keyed(
+                event_type, event_entity_id, handle_keyed_event, run_immediately=True
+            )
+            for event_type in event_types
+        ]
+    else:
+        removes = [
+            hass.bus.async_listen(
+                event_type,
+                handle_event,
+                event_filter=filter_event,
+                run_immediately=True,
+            )
+            for event_type in event_types
+        ]
 
     @callback
     def remove_listen_events() -> None:
@@ -134,6 +134,7 @@ class EventProcessor:
         self.logbook_run.event_cache.clear()
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
+        self.context_augmenter.clear()
 
     def get_events(
         self,
@@ -200,6 +201,9 @@ def _humanify(
     format_time = logbook_run.format_time
     memoize_new_contexts = logbook_run.memoize_new_contexts
     memoize_context = context_lookup.setdefault
+    augment = context_augmenter.augment
+    get_entity_name = entity_name_cache.get
+    get_event = event_cache.get
 
     # Process rows
     for row in rows:
@@ -230,17 +234,17 @@ def _humanify(
                 LOGBOOK_ENTRY_ENTITY_ID: entity_id,
             }
             if include_entity_name:
-                data[LOGBOOK_ENTRY_NAME] = entity_name_cache.get(entity_id)
+                data[LOGBOOK_ENTRY_NAME] = get_entity_name(entity_id)
             if icon := row.icon:
                 data[LOGBOOK_ENTRY_ICON] = icon
 
-            context_augmenter.augment(data, row, context_id_bin)
+            augment(data, row, context_id_bin)
             yield data
 
         elif event_type in external_events:
             domain, describe_event = external_events[event_type]
             try:
-                data = describe_event(event_cache.get(row))
+                data = describe_event(get_event(row))
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception(
                     "Error with %s describe event for %s", domain, event_type
@@ -248,11 +252,11 @@ def _humanify(
                 continue
             data[LOGBOOK_ENTRY_WHEN] = format_time(row)
             data[LOGBOOK_ENTRY_DOMAIN] = domain
-            context_augmenter.augment(data, row, context_id_bin)
+            augment(data, row, context_id_bin)
             yield data
 
         elif event_type == EVENT_LOGBOOK_ENTRY:
-            event = event_cache.get(row)
+            event = get_event(row)
             if not (event_data := event.data):
                 continue
             entry_domain = event_data.get(ATTR_DOMAIN)
@@ -267,16 +271,22 @@ def _humanify(
                 LOGBOOK_ENTRY_DOMAIN: entry_domain,
                 LOGBOOK_ENTRY_ENTITY_ID: entry_entity_id,
             }
-            context_augmenter.augment(data, row, context_id_bin)
+            augment(data, row, context_id_bin)
             yield data
 
 
 class ContextAugmenter:
-    """Augment data with context trace."""
+    """Augment data with context trace.
+
+    The data describing the origin of a context is the same for every
+    row of the context, so it is only built once per context from the
+    context lookup and kept until the logbook run switches to live.
+    """
 
     def __init__(self, logbook_run: LogbookRun) -> None:
         """Init the augmenter."""
         self.context_lookup = logbook_run.context_lookup
+        self.context_origins: dict[bytes, dict[str, Any]] = {}
         self.entity_name_cache = logbook_run.entity_name_cache
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
@@ -306,6 +316,7 @@ class ContextAugmenter:
         if not (context_row := self._get_context_row(context_id_bin, row)):
             return
 
+        origin_id_bin = context_id_bin
         if _rows_match(row, context_row):
             # This is the first event with the given ID. Was it directly caused by
             # a parent event?
@@ -324,50 +335,71 @@ class ContextAugmenter:
             # this log entry.
             if _rows_match(row, context_row):
                 return
+            origin_id_bin = context_parent_id_bin
+
+        if origin_id_bin is None:
+            data.update(self._describe_origin(context_row))
+            return
+        if (origin := self.context_origins.get(origin_id_bin)) is None:
+            origin = self._describe_origin(context_row)
+            # Rows built from live events are not cached since they
+            # are not kept in the context lookup
+            if self.context_lookup.get(origin_id_bin) is context_row:
+                self.context_origins[origin_id_bin] = origin
+        data.update(origin)
+
+    def _describe_origin(self, context_row: Row | EventAsRow) -> dict[str, Any]:
+        """Describe the row that started a context."""
+        origin: dict[str, Any] = {}
         event_type = context_row.event_type
         # State change
         if context_entity_id := context_row.entity_id:
-            data[CONTEXT_STATE] = context_row.state
-            data[CONTEXT_ENTITY_ID] = context_entity_id
+            origin[CONTEXT_STATE] = context_row.state
+            origin[CONTEXT_ENTITY_ID] = context_entity_id
             if self.include_entity_name:
-                data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(
+                origin[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(
                     context_entity_id
                 )
-            return
+            return origin
 
         # Call service
         if event_type == EVENT_CALL_SERVICE:
             event = self.event_cache.get(context_row)
             event_data = event.data
-            data[CONTEXT_DOMAIN] = event_data.get(ATTR_DOMAIN)
-            data[CONTEXT_SERVICE] = event_data.get(ATTR_SERVICE)
-            data[CONTEXT_EVENT_TYPE] = event_type
-            return
+            origin[CONTEXT_DOMAIN] = event_data.get(ATTR_DOMAIN)
+            origin[CONTEXT_SERVICE] = event_data.get(ATTR_SERVICE)
+            origin[CONTEXT_EVENT_TYPE] = event_type
+            return origin
 
         if event_type not in self.external_events:
-            return
+            return origin
 
         domain, describe_event = self.external_events[event_type]
-        data[CONTEXT_EVENT_TYPE] = event_type
-        data[CONTEXT_DOMAIN] = domain
+        origin[CONTEXT_EVENT_TYPE] = event_type
+        origin[CONTEXT_DOMAIN] = domain
         event = self.event_cache.get(context_row)
         try:
             described = describe_event(event)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error with %s describe event for %s", domain, event_type)
-            return
+            return origin
         if name := described.get(LOGBOOK_ENTRY_NAME):
-            data[CONTEXT_NAME] = name
+            origin[CONTEXT_NAME] = name
         if message := described.get(LOGBOOK_ENTRY_MESSAGE):
-            data[CONTEXT_MESSAGE] = message
+            origin[CONTEXT_MESSAGE] = message
         # In 2022.12 and later drop `CONTEXT_MESSAGE` if `CONTEXT_SOURCE` is available
         if source := described.get(LOGBOOK_ENTRY_SOURCE):
-            data[CONTEXT_SOURCE] = source
+            origin[CONTEXT_SOURCE] = source
         if not (attr_entity_id := described.get(LOGBOOK_ENTRY_ENTITY_ID)):
-            return
-        data[CONTEXT_ENTITY_ID] = attr_entity_id
+            return origin
+        origin[CONTEXT_ENTITY_ID] = attr_entity_id
         if self.include_entity_name:
-            data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
+            origin[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
+        return origin
+
+    def clear(self) -> None:
+        """Clear the described context origins."""
+        self.context_origins.clear()
 
 
 def _rows_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
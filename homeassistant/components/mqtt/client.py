@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
 from dataclasses import dataclass
-from functools import lru_cache
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any
 import uuid
 
 import certifi
+from lru import LRU
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -91,6 +92,9 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+# Received messages handled before yielding to other jobs on the event loop
+RECEIVE_BATCH_SIZE = 100
 
 SubscribePayloadType = str | bytes  # Only bytes if encoding is None
 
@@ -226,7 +230,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -298,6 +301,114 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+def _topic_matches_filter(topic_filter: str, topic: str) -> bool:
+    """Return if a topic matches a topic filter with wildcards."""
+    levels = topic.split("/")
+    # Topics starting with $ are not matched by a wildcard at the first level
+    normal = not topic.startswith("$")
+    for idx, filter_level in enumerate(topic_filter.split("/")):
+        if filter_level == "#":
+            return normal or idx > 0
+        if idx >= len(levels):
+            return False
+        if filter_level == "+":
+            if not normal and idx == 0:
+                return False
+        elif filter_level != levels[idx]:
+            return False
+    return len(levels) == idx + 1
+
+
+class _SubscriptionTrieNode:
+    """A level of the topic filters in a SubscriptionTrie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """A trie of subscriptions by the levels of their topic filter.
+
+    Matching a topic follows the exact, + and # levels of the topic
+    so the cost depends on the depth of the topic and not on the
+    number of subscriptions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if there is a subscription for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError or ValueError if the subscription is not in the trie.
+        """
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Prune the levels which are no longer used
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching the topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Topics starting with $ are not matched by a wildcard at the first level
+        normal = not topic.startswith("$")
+        subscriptions: list[Subscription] = []
+        nodes = [(self._root, 0)]
+        while nodes:
+            node, idx = nodes.pop()
+            children = node.children
+            if (normal or idx > 0) and (multi_level := children.get("#")):
+                subscriptions.extend(multi_level.subscriptions)
+            if idx == depth:
+                subscriptions.extend(node.subscriptions)
+                continue
+            if (normal or idx > 0) and (single_level := children.get("+")):
+                nodes.append((single_level, idx + 1))
+            if child := children.get(levels[idx]):
+                nodes.append((child, idx + 1))
+        return subscriptions
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -390,7 +501,12 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
+        # The subscriptions matching the most recently received topics,
+        # kept up to date when subscriptions are tracked and untracked
+        self._matching_subscriptions_cache: LRU[str, list[Subscription]] = LRU(
+            MATCHING_SUBSCRIPTIONS_CACHE_SIZE
+        )
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -412,6 +528,10 @@ class MQTT:
             UNSUBSCRIBE_COOLDOWN, self._async_perform_unsubscribes
         )
         self._pending_unsubscribes: set[str] = set()  # topic
+        # Messages are handed over from the paho thread in a deque so the
+        # event loop only needs to be woken up once for a burst of messages
+        self._received_messages: deque[mqtt.MQTTMessage] = deque()
+        self._received_messages_scheduled = False
 
         if self.hass.state == CoreState.running:
             self._ha_started.set()
@@ -473,8 +593,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions or topic in self._wildcard_subscriptions
         )
 
     async def async_publish(
@@ -555,42 +675,52 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
-        if _is_simple_match(subscription.topic):
-            self._simple_subscriptions.setdefault(subscription.topic, []).append(
-                subscription
-            )
-        else:
-            self._wildcard_subscriptions.append(subscription)
+        topic = subscription.topic
+        cache = self._matching_subscriptions_cache
+        if _is_simple_match(topic):
+            self._simple_subscriptions.setdefault(topic, []).append(subscription)
+            if (matching := cache.get(topic)) is not None:
+                cache[topic] = [*matching, subscription]
+            return
+        self._wildcard_subscriptions.add(subscription)
+        for cached_topic, matching in cache.items():
+            if _topic_matches_filter(topic, cached_topic):
+                cache[cached_topic] = [*matching, subscription]
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
+        cache = self._matching_subscriptions_cache
         try:
             if _is_simple_match(topic):
                 simple_subscriptions = self._simple_subscriptions
                 simple_subscriptions[topic].remove(subscription)
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
+                cached_topics: Iterable[str] = (topic,) if topic in cache else ()
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                cached_topics = cache.keys()
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
+        # The cached lists are replaced since messages may be
+        # dispatched from one of them right now
+        for cached_topic in cached_topics:
+            if subscription in (matching := cache[cached_topic]):
+                matching = matching.copy()
+                matching.remove(subscription)
+                cache[cached_topic] = matching
 
     @callback
     def _async_queue_subscriptions(
@@ -623,11 +753,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -637,7 +764,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -796,16 +922,46 @@ class MQTT:
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
         """Message received callback."""
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        # The flag is shared with the event loop without a lock. The message
+        # is appended before the flag is read, and the event loop resets the
+        # flag before it drains the deque, so a message is never left behind:
+        # either the flag is still set by a scheduled handler that will see
+        # the message, or it was reset and the handler is scheduled here.
+        # A race only schedules the handler once more, which then finds the
+        # deque empty or handles the next batch.
+        self._received_messages.append(msg)
+        if not self._received_messages_scheduled:
+            self._received_messages_scheduled = True
+            self.loop.call_soon_threadsafe(self._async_handle_received_messages)
+
+    @callback
+    def _async_handle_received_messages(self) -> None:
+        """Handle a batch of the messages received by the paho thread."""
+        # Reset before handling the messages, messages received from now
+        # on will schedule handling them again if they are not in this batch
+        self._received_messages_scheduled = False
+        received_messages = self._received_messages
+        try:
+            for _ in range(RECEIVE_BATCH_SIZE):
+                if not received_messages:
+                    return
+                self._mqtt_handle_message(received_messages.popleft())
+        finally:
+            # Let other jobs run before handling the next batch
+            if received_messages and not self._received_messages_scheduled:
+                self._received_messages_scheduled = True
+                self.loop.call_soon(self._async_handle_received_messages)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+        """Return the subscriptions matching a topic."""
+        cache = self._matching_subscriptions_cache
+        if (subscriptions := cache.get(topic)) is not None:
+            return subscriptions
+        subscriptions = [
+            *self._simple_subscriptions.get(topic, ()),
+            *self._wildcard_subscriptions.matches(topic),
+        ]
+        cache[topic] = subscriptions
         return subscriptions
 
     @callback
@@ -950,13 +1106,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -258,6 +258,15 @@ async def async_start(  # noqa: C901
 
         if discovery_hash in mqtt_data.discovery_pending_discovered:
             pending = mqtt_data.discovery_pending_discovered[discovery_hash]["pending"]
+            if pending and pending[0] == discovery_payload:
+                # Brokers can send the same retained message again,
+                # e.g. when the discovery topics are subscribed again
+                _LOGGER.debug(
+                    "Ignoring duplicate update for component: %s %s",
+                    component,
+                    discovery_id,
+                )
+                return
             pending.appendleft(discovery_payload)
             _LOGGER.debug(
                 "Component has already been discovered: %s %s, queuing update",
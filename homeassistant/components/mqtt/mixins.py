@@ -350,6 +350,16 @@ async def async_setup_entity_entry_helper(
 ) -> None:
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = get_mqtt_data(hass)
+    # Entities discovered in the same iteration of the event loop,
+    # e.g. from a burst of retained discovery messages
+    discovered_entities: list[Entity] = []
+
+    @callback
+    def _async_add_discovered_entities() -> None:
+        """Add the discovered entities to the platform at once."""
+        entities = discovered_entities.copy()
+        discovered_entities.clear()
+        async_add_entities(entities)
 
     @callback
     def async_setup_from_discovery(
@@ -362,8 +372,10 @@ async def async_setup_entity_entry_helper(
             entity_class = schema_class_mapping[config[CONF_SCHEMA]]
         if TYPE_CHECKING:
             assert entity_class is not None
-        async_add_entities(
-            [entity_class(hass, config, entry, discovery_payload.discovery_data)]
+        if not discovered_entities:
+            hass.loop.call_soon(_async_add_discovered_entities)
+        discovered_entities.append(
+            entity_class(hass, config, entry, discovery_payload.discovery_data)
         )
 
     mqtt_data.reload_dispatchers.append(
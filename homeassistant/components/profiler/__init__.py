@@ -22,6 +22,7 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import render_cache_info
 
 from .const import DOMAIN
 
@@ -207,6 +208,10 @@ async def async_setup_entry(  # noqa: C901
                             maybe_lru.get_stats(),
                         )
 
+        _LOGGER.critical(
+            "Cache stats for template render cache: %s", render_cache_info()
+        )
+
         for lru in objgraph.by_type(_SQLALCHEMY_LRU_OBJECT):
             if (data := getattr(lru, "_data", None)) and isinstance(data, dict):
                 for key, value in dict(data).items():
@@ -25,6 +25,14 @@ MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 ESTIMATED_QUEUE_ITEM_SIZE = 10240
 QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY = 0.65
 
+# Events that cannot be written while the database is unreachable
+# are kept in memory up to this size and are then spooled to disk
+SPOOL_FILENAME = "recorder.spool"
+SPOOL_MAX_BUFFER_SIZE = 4 * 1024 * 1024
+# The oldest spooled events are dropped once the spool would grow past this size
+SPOOL_MAX_SIZE = 512 * 1024 * 1024
+SPOOL_REPLAY_BATCH_SIZE = 1000
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
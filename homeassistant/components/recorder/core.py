@@ -55,6 +55,10 @@ from .const import (
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
+    SPOOL_FILENAME,
+    SPOOL_MAX_BUFFER_SIZE,
+    SPOOL_MAX_SIZE,
+    SPOOL_REPLAY_BATCH_SIZE,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
@@ -85,6 +89,7 @@ from .queries import (
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
 )
+from .spool import RecorderSpool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -214,6 +219,15 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Set once the schema is current if the dialect can return
+        # the ids of a multi-row INSERT so States can be bulk inserted
+        self._bulk_insert_states = False
+        # Events written to the event session since the last commit
+        # so they can be spooled if the database becomes unreachable
+        self._uncommitted_events: list[Event] = []
+        self._spool = RecorderSpool(
+            hass.config.path(SPOOL_FILENAME), SPOOL_MAX_BUFFER_SIZE, SPOOL_MAX_SIZE
+        )
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -769,6 +783,12 @@ class Recorder(threading.Thread):
         if not database_was_ready:
             self._activate_and_set_db_ready()
 
+        assert self.engine is not None
+        self._bulk_insert_states = (
+            self.schema_version == SCHEMA_VERSION
+            and self.engine.dialect.insert_executemany_returning
+        )
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -851,6 +871,12 @@ class Recorder(threading.Thread):
 
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
+        # Replay the events spooled before the last shutdown
+        # since they are older than anything in the queue
+        self._spool.load()
+        if self._spool.pending and not self._replay_spool():
+            self._spool_and_replay_when_database_is_reachable()
+
         # Use a session for the event read loop
         # with a commit every time the event time
         # has changed. This reduces the disk io.
@@ -926,6 +952,10 @@ class Recorder(threading.Thread):
         except exc.DatabaseError as err:
             if self._handle_database_error(err):
                 return
+            if isinstance(
+                err, exc.OperationalError
+            ) and self._spool_if_database_is_unreachable(err):
+                return
             _LOGGER.exception(
                 "Unhandled database error while processing task %s: %s", task, err
             )
@@ -1029,6 +1059,7 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event: Event) -> None:
         if not self.enabled:
             return
+        self._uncommitted_events.append(event)
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
@@ -1154,7 +1185,11 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self._bulk_insert_states:
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_insert(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1166,6 +1201,115 @@ class Recorder(threading.Thread):
             return True
         return False
 
+    def _database_is_reachable(self) -> bool:
+        """Check if a new connection can be made to the database."""
+        assert self.engine is not None
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(select(1))
+        except SQLAlchemyError:
+            return False
+        return True
+
+    def _spool_if_database_is_unreachable(self, err: exc.OperationalError) -> bool:
+        """Spool events to disk while the database is unreachable.
+
+        Returns False if the database is reachable.
+        """
+        uncommitted_events = self._uncommitted_events
+        self._uncommitted_events = []
+        # Release the connection of the failed session before checking
+        self._reopen_event_session()
+        if self._database_is_reachable():
+            return False
+        _LOGGER.error(
+            "The database is unreachable: %s; events will be spooled to %s "
+            "and written once it is reachable again",
+            err,
+            self._spool.path,
+        )
+        spool = self._spool
+        for event in uncommitted_events:
+            spool.append(event)
+        self._spool_and_replay_when_database_is_reachable()
+        return True
+
+    def _spool_and_replay_when_database_is_reachable(self) -> None:
+        """Spool events until the database is reachable and replay them."""
+        deferred_tasks: list[RecorderTask] = []
+        while self._spool_until_database_is_reachable(deferred_tasks):
+            if self._replay_spool():
+                _LOGGER.info("Finished writing the spooled events to the database")
+                break
+        for task in deferred_tasks:
+            self.queue_task(task)
+
+    def _spool_until_database_is_reachable(
+        self, deferred_tasks: list[RecorderTask]
+    ) -> bool:
+        """Spool events from the queue until the database is reachable.
+
+        Tasks that need the database are added to deferred_tasks
+        to run once the spooled events have been written.
+
+        Returns False if the recorder is stopping.
+        """
+        spool = self._spool
+        queue_ = self._queue
+        next_check = time.monotonic() + self.db_retry_wait
+        while True:
+            if (timeout := next_check - time.monotonic()) <= 0:
+                if self._database_is_reachable():
+                    return True
+                next_check = time.monotonic() + self.db_retry_wait
+                continue
+            try:
+                task = queue_.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            if type(task) is Event:  # noqa: E721
+                if self.enabled:
+                    spool.append(task)
+                continue
+            if TYPE_CHECKING:
+                assert isinstance(task, RecorderTask)
+            if isinstance(task, StopTask):
+                # Keep the spooled events on disk to be
+                # replayed the next time the recorder starts
+                spool.flush()
+                task.run(self)
+                return False
+            elif isinstance(task, WaitTask):
+                task.run(self)
+            elif not isinstance(task, (CommitTask, KeepAliveTask)):
+                deferred_tasks.append(task)
+
+    def _replay_spool(self) -> bool:
+        """Write the spooled events to the database in batches.
+
+        Returns False if the database became unreachable again.
+        """
+        spool = self._spool
+        while events := spool.read_batch(SPOOL_REPLAY_BATCH_SIZE):
+            try:
+                for event in events:
+                    if event.event_type == EVENT_STATE_CHANGED:
+                        self._process_state_changed_event_into_session(event)
+                    else:
+                        self._process_non_state_changed_event_into_session(event)
+                self._commit_event_session_or_retry()
+            except SQLAlchemyError as err:
+                self._reopen_event_session()
+                if not self._database_is_reachable():
+                    return False
+                _LOGGER.exception(
+                    "Error writing %s spooled events, they will be skipped: %s",
+                    len(events),
+                    err,
+                )
+            spool.ack()
+        return True
+
     def _commit_event_session_or_retry(self) -> None:
         """Commit the event session if there is work to do."""
         if not self._event_session_has_pending_writes:
@@ -1187,14 +1331,25 @@ class Recorder(threading.Thread):
 
                 tries += 1
                 time.sleep(self.db_retry_wait)
+                if self._bulk_insert_states:
+                    self._readd_uncommitted_events()
 
     def _commit_event_session(self) -> None:
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
 
-        session.commit()
+        if self._bulk_insert_states:
+            try:
+                self.states_manager.insert_pending(session)
+                session.commit()
+            except BaseException:
+                self._rollback_event_session()
+                raise
+        else:
+            session.commit()
         self._event_session_has_pending_writes = False
+        self._uncommitted_events.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1212,6 +1367,32 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _rollback_event_session(self) -> None:
+        """Roll back the event session after a failed bulk insert of States.
+
+        Some of the states may have been inserted before the failure, so
+        the whole session is rolled back for all of them to be inserted
+        again by the next commit.
+        """
+        assert self.event_session is not None
+        try:
+            self.event_session.rollback()
+        except SQLAlchemyError as err:
+            _LOGGER.exception("Error while rolling back the event session: %s", err)
+        self.states_manager.rollback_pending()
+        self.state_attributes_manager.reset()
+        self.event_data_manager.reset()
+        self.event_type_manager.reset()
+        self.states_meta_manager.reset()
+
+    def _readd_uncommitted_events(self) -> None:
+        """Add the events of a rolled back event session to it again."""
+        for event in self._uncommitted_events:
+            if event.event_type == EVENT_STATE_CHANGED:
+                self._process_state_changed_event_into_session(event)
+            else:
+                self._process_non_state_changed_event_into_session(event)
+
     def _handle_sqlite_corruption(self) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1225,12 +1406,14 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._uncommitted_events.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        statistics.get_statistics_rollup_cache(self.hass).clear()
 
         if not self.event_session:
             return
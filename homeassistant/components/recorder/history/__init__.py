@@ -91,17 +91,31 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    max_points is ignored until the states have been migrated
+    to the new schema.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states as _legacy_get_significant_states,
         )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+        return _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -112,6 +126,7 @@ def get_significant_states(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        max_points,
     )
 
 
@@ -127,17 +142,32 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    max_points is ignored until the states have been migrated
+    to the new schema.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states_with_session as _legacy_get_significant_states_with_session,
         )
 
-        _target = _legacy_get_significant_states_with_session
-    else:
-        _target = _modern_get_significant_states_with_session
-    return _target(
+        return _legacy_get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states_with_session(
         hass,
         session,
         start_time,
@@ -149,6 +179,7 @@ def get_significant_states_with_session(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        max_points,
     )
 
 
@@ -102,6 +102,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -117,6 +118,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -195,6 +197,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -206,6 +209,9 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    If max_points is given, numeric states are downsampled to about
+    max_points states per entity, see _downsample_rows.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
@@ -257,6 +263,12 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
+    downsample_interval: float | None = None
+    if max_points:
+        # Each bucket keeps the lowest and the highest state
+        downsample_interval = (
+            (end_time_ts or dt_util.utcnow().timestamp()) - start_time_ts
+        ) / max(max_points // 2, 1)
     return _sorted_states_to_dict(
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
         start_time_ts if include_start_time_state else None,
@@ -265,6 +277,7 @@ def get_significant_states_with_session(
         minimal_response,
         compressed_state_format,
         no_attributes=no_attributes,
+        downsample_interval=downsample_interval,
     )
 
 
@@ -642,6 +655,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    downsample_interval: float | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -653,6 +667,9 @@ def _sorted_states_to_dict(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    If downsample_interval is given, the states are downsampled to
+    buckets of downsample_interval seconds with _downsample_rows.
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -693,6 +710,10 @@ def _sorted_states_to_dict(
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
+        if downsample_interval:
+            group = _downsample_rows(
+                group, downsample_interval, state_idx, last_updated_ts_idx
+            )
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
         if (
@@ -770,3 +791,63 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _downsample_rows(
+    rows: Iterator[Row],
+    interval: float,
+    state_idx: int,
+    last_updated_ts_idx: int,
+) -> Iterator[Row]:
+    """Downsample the rows of an entity to min/max buckets.
+
+    Of the rows with a numeric state only the ones with the lowest
+    and highest state in each bucket of interval seconds are kept, so
+    the peaks are still visible in graphs. The first and last rows and
+    rows with a non-numeric state, such as unavailable, are always kept.
+
+    Rows must be sorted by last_updated and are yielded in the same order.
+    """
+    if (row := next(rows, None)) is None:
+        return
+    yield row
+    bucket: int | None = None
+    low_row = high_row = last_row = row
+    low = high = 0.0
+    for row in rows:
+        last_row = row
+        try:
+            value = float(row[state_idx])
+        except (TypeError, ValueError):
+            if bucket is not None:
+                yield from _min_max_rows(low_row, high_row, last_updated_ts_idx)
+                bucket = None
+            yield row
+            continue
+        if (row_bucket := int(row[last_updated_ts_idx] // interval)) != bucket:
+            if bucket is not None:
+                yield from _min_max_rows(low_row, high_row, last_updated_ts_idx)
+            bucket = row_bucket
+            low_row = high_row = row
+            low = high = value
+        elif value < low:
+            low_row = row
+            low = value
+        elif value > high:
+            high_row = row
+            high = value
+    if bucket is not None:
+        yield from _min_max_rows(low_row, high_row, last_updated_ts_idx)
+        if last_row is not low_row and last_row is not high_row:
+            yield last_row
+
+
+def _min_max_rows(
+    low_row: Row, high_row: Row, last_updated_ts_idx: int
+) -> tuple[Row, ...]:
+    """Return the lowest and highest rows of a bucket in time order."""
+    if low_row is high_row:
+        return (low_row,)
+    if low_row[last_updated_ts_idx] > high_row[last_updated_ts_idx]:
+        return (high_row, low_row)
+    return (low_row, high_row)
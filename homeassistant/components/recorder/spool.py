@@ -0,0 +1,294 @@
+"""Spool recorder events to disk while the database is unreachable."""
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import shutil
+import struct
+from typing import Any
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import (
+    JSON_DECODE_EXCEPTIONS,
+    JSON_ENCODE_EXCEPTIONS,
+    json_loads_object,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# The file starts with the offset of the next record to replay
+# followed by records of a length prefix and the JSON encoded event
+_HEADER = struct.Struct(">Q")
+_LENGTH = struct.Struct(">I")
+
+
+class RecorderSpool:
+    """A write-ahead spool of events that could not be written to the database.
+
+    Events are kept in memory until the encoded events exceed
+    max_buffer_size bytes and are then appended to the spool file.
+    Once the spool file would grow past max_size bytes, the oldest
+    events are dropped until it is at most half that size.
+
+    State changed events are stored in the State.as_compressed_state form
+    with the unrecorded attributes already removed, since the state_info
+    is not available when the event is replayed.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread.
+    """
+
+    def __init__(self, path: str, max_buffer_size: int, max_size: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self._max_buffer_size = max_buffer_size
+        self._max_size = max_size
+        self._buffer: list[bytes] = []
+        self._buffer_size = 0
+        self._file_size = 0
+        self._offset = _HEADER.size
+        self._next_offset = _HEADER.size
+
+    @property
+    def pending(self) -> bool:
+        """Return if there are events waiting to be replayed."""
+        return bool(self._buffer) or self._offset < self._file_size
+
+    def load(self) -> None:
+        """Load the state of a spool file left behind by a previous run."""
+        try:
+            with open(self.path, "rb") as spool_file:
+                header = spool_file.read(_HEADER.size)
+                self._file_size = spool_file.seek(0, os.SEEK_END)
+        except FileNotFoundError:
+            return
+        if len(header) != _HEADER.size:
+            self.clear()
+            return
+        (self._offset,) = _HEADER.unpack(header)
+        self._next_offset = self._offset
+        _LOGGER.info("Found a recorder spool with events to replay at %s", self.path)
+
+    def append(self, event: Event) -> None:
+        """Add an event to the spool."""
+        try:
+            record = json_bytes(_event_to_spool_dict(event))
+        except JSON_ENCODE_EXCEPTIONS as ex:
+            _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+            return
+        self._buffer.append(_LENGTH.pack(len(record)))
+        self._buffer.append(record)
+        self._buffer_size += _LENGTH.size + len(record)
+        if self._buffer_size >= self._max_buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the events held in memory to the spool file."""
+        if not self._buffer:
+            return
+        if not self._file_size:
+            with open(self.path, "wb") as spool_file:
+                spool_file.write(_HEADER.pack(self._offset))
+            self._file_size = _HEADER.size
+        elif self._file_size + self._buffer_size > self._max_size:
+            self._drop_oldest_events()
+        with open(self.path, "ab") as spool_file:
+            spool_file.writelines(self._buffer)
+        self._file_size += self._buffer_size
+        self._buffer.clear()
+        self._buffer_size = 0
+
+    def read_batch(self, max_events: int) -> list[Event]:
+        """Read the next events to replay.
+
+        The events are returned again until they are acknowledged
+        with ack once they have been committed.
+        """
+        self.flush()
+        events: list[Event] = []
+        offset = self._offset
+        if offset >= self._file_size:
+            return events
+        with open(self.path, "rb") as spool_file:
+            spool_file.seek(offset)
+            while len(events) < max_events and offset < self._file_size:
+                length_bytes = spool_file.read(_LENGTH.size)
+                if len(length_bytes) != _LENGTH.size:
+                    break
+                (length,) = _LENGTH.unpack(length_bytes)
+                record = spool_file.read(length)
+                if len(record) != length:
+                    break
+                offset += _LENGTH.size + length
+                try:
+                    events.append(_event_from_spool_dict(json_loads_object(record)))
+                except (*JSON_DECODE_EXCEPTIONS, KeyError, TypeError, ValueError):
+                    _LOGGER.exception("Skipping invalid record in the recorder spool")
+        if offset < self._file_size and len(events) < max_events:
+            # A truncated record at the end of the file
+            # was never completely written
+            _LOGGER.warning("Skipping truncated record in the recorder spool")
+            offset = self._file_size
+        self._next_offset = offset
+        return events
+
+    def _drop_oldest_events(self) -> None:
+        """Drop the oldest events from the spool file to stay below max_size.
+
+        The events held in memory are kept.
+        """
+        # Drop down to half the maximum size so this does not run on every flush
+        max_file_size = self._max_size // 2 - self._buffer_size
+        offset = self._offset
+        dropped = 0
+        tmp_path = f"{self.path}.tmp"
+        with open(self.path, "rb") as spool_file:
+            spool_file.seek(offset)
+            while (
+                offset < self._file_size
+                and _HEADER.size + self._file_size - offset > max_file_size
+            ):
+                length_bytes = spool_file.read(_LENGTH.size)
+                if len(length_bytes) != _LENGTH.size:
+                    offset = self._file_size
+                    break
+                (length,) = _LENGTH.unpack(length_bytes)
+                spool_file.seek(length, os.SEEK_CUR)
+                offset = min(offset + _LENGTH.size + length, self._file_size)
+                dropped += 1
+            spool_file.seek(offset)
+            with open(tmp_path, "wb") as new_file:
+                new_file.write(_HEADER.pack(_HEADER.size))
+                shutil.copyfileobj(spool_file, new_file)
+        os.replace(tmp_path, self.path)
+        removed_size = offset - _HEADER.size
+        self._file_size -= removed_size
+        self._offset = _HEADER.size
+        self._next_offset = max(self._next_offset - removed_size, _HEADER.size)
+        _LOGGER.warning(
+            "The recorder spool %s reached its maximum size of %s bytes; "
+            "dropped the %s oldest events",
+            self.path,
+            self._max_size,
+            dropped,
+        )
+
+    def ack(self) -> None:
+        """Acknowledge the events returned by read_batch were committed."""
+        self._offset = self._next_offset
+        if self._offset >= self._file_size:
+            self.clear()
+            return
+        with open(self.path, "r+b") as spool_file:
+            spool_file.write(_HEADER.pack(self._offset))
+
+    def clear(self) -> None:
+        """Remove all events from the spool."""
+        self._buffer.clear()
+        self._buffer_size = 0
+        self._file_size = 0
+        self._offset = self._next_offset = _HEADER.size
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+
+
+def _context_to_spool(context: Context) -> dict[str, Any] | str:
+    """Return the compressed form of a context."""
+    if context.parent_id is None and context.user_id is None:
+        return context.id
+    return context._as_dict  # pylint: disable=protected-access
+
+
+def _context_from_spool(context: dict[str, Any] | str) -> Context:
+    """Return a context from its compressed form."""
+    if isinstance(context, str):
+        return Context(id=context)
+    return Context(
+        id=context["id"],
+        user_id=context["user_id"],
+        parent_id=context["parent_id"],
+    )
+
+
+def _event_to_spool_dict(event: Event) -> dict[str, Any]:
+    """Return the dict to spool for an event."""
+    spool_dict: dict[str, Any] = {
+        "t": event.event_type,
+        "o": event.origin.value,
+        "f": dt_util.utc_to_timestamp(event.time_fired),
+    }
+    if event.event_type != EVENT_STATE_CHANGED:
+        spool_dict["c"] = _context_to_spool(event.context)
+        spool_dict["d"] = event.data
+        return spool_dict
+    spool_dict["e"] = event.data["entity_id"]
+    state: State | None = event.data.get("new_state")
+    if state is None:
+        spool_dict["c"] = _context_to_spool(event.context)
+        return spool_dict
+    # The event has the context of the new state
+    compressed_state = state.as_compressed_state
+    if (state_info := state.state_info) and (
+        exclude_attrs := state_info["unrecorded_attributes"]
+    ):
+        compressed_state = {
+            **compressed_state,
+            COMPRESSED_STATE_ATTRIBUTES: {
+                key: value
+                for key, value in state.attributes.items()
+                if key not in exclude_attrs
+            },
+        }
+    spool_dict["s"] = compressed_state
+    return spool_dict
+
+
+def _event_from_spool_dict(spool_dict: dict[str, Any]) -> Event:
+    """Return the event for a spooled dict."""
+    event_type: str = spool_dict["t"]
+    if event_type != EVENT_STATE_CHANGED:
+        data = spool_dict["d"]
+        context = _context_from_spool(spool_dict["c"])
+    elif (compressed_state := spool_dict.get("s")) is None:
+        data = {"entity_id": spool_dict["e"], "old_state": None, "new_state": None}
+        context = _context_from_spool(spool_dict["c"])
+    else:
+        entity_id = spool_dict["e"]
+        context = _context_from_spool(compressed_state[COMPRESSED_STATE_CONTEXT])
+        last_changed = dt_util.utc_from_timestamp(
+            compressed_state[COMPRESSED_STATE_LAST_CHANGED]
+        )
+        if (
+            last_updated_ts := compressed_state.get(COMPRESSED_STATE_LAST_UPDATED)
+        ) is None:
+            last_updated = last_changed
+        else:
+            last_updated = dt_util.utc_from_timestamp(last_updated_ts)
+        new_state = State(
+            entity_id,
+            compressed_state[COMPRESSED_STATE_STATE],
+            compressed_state[COMPRESSED_STATE_ATTRIBUTES],
+            last_changed,
+            last_updated,
+            context,
+            validate_entity_id=False,
+        )
+        data = {"entity_id": entity_id, "old_state": None, "new_state": new_state}
+    return Event(
+        event_type,
+        data,
+        EventOrigin(spool_dict["o"]),
+        dt_util.utc_from_timestamp(spool_dict["f"]),
+        context,
+    )
@@ -11,9 +11,11 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import threading
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from lru import LRU
+from sqlalchemy import Select, and_, bindparam, event, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.orm.session import Session
@@ -142,6 +144,8 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_ROLLUP_CACHE = "recorder_statistics_rollup_cache"
+STATISTICS_ROLLUP_CACHE_SIZE = 2048
 
 
 def mean(values: list[float]) -> float | None:
@@ -185,6 +189,126 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class StatisticsRollup:
+    """Hourly statistics of one statistic reduced to days, weeks or months.
+
+    rows holds the reduced statistics of all periods in start_ts - end_ts
+    which have hourly statistics, in the unit the statistics are stored in.
+    """
+
+    start_ts: float
+    end_ts: float
+    rows: list[StatisticsRow]
+
+
+_RollupKey = tuple[int, str, frozenset[str], Any]
+
+
+class StatisticsRollupCache:
+    """Cache for hourly statistics reduced to days, weeks or months.
+
+    Only periods which have ended are cached. The cached periods of a
+    statistic are dropped when hourly statistics in them are changed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        # Bumped when statistics are changed so rollups which were
+        # reduced from the database before the change are not cached
+        self._generation = 0
+        self._rollups: LRU[_RollupKey, StatisticsRollup] = LRU(
+            STATISTICS_ROLLUP_CACHE_SIZE
+        )
+
+    @property
+    def generation(self) -> int:
+        """Return the generation to pass to set_rollup."""
+        return self._generation
+
+    def get_rollup(
+        self,
+        metadata_id: int,
+        period: str,
+        types: frozenset[str],
+        start_ts: float,
+    ) -> StatisticsRollup | None:
+        """Return the cached rollup if it covers the periods from start_ts.
+
+        A rollup which ends before start_ts is not returned since extending
+        it with the periods from start_ts would leave a gap in it.
+        """
+        with self._lock:
+            rollup = self._rollups.get(_rollup_key(metadata_id, period, types))
+        if rollup is None or not rollup.start_ts <= start_ts <= rollup.end_ts:
+            return None
+        return rollup
+
+    def set_rollup(
+        self,
+        generation: int,
+        metadata_id: int,
+        period: str,
+        types: frozenset[str],
+        rollup: StatisticsRollup,
+    ) -> None:
+        """Cache a rollup unless statistics were changed since generation."""
+        key = _rollup_key(metadata_id, period, types)
+        with self._lock:
+            if generation != self._generation:
+                return
+            if (cached := self._rollups.get(key)) is not None and (
+                rollup.start_ts > cached.start_ts or rollup.end_ts < cached.end_ts
+            ):
+                return
+            self._rollups[key] = rollup
+
+    def invalidate(
+        self, session: Session, start_ts: float, metadata_ids: Iterable[int] | None
+    ) -> None:
+        """Drop the rollups of periods ending after start_ts.
+
+        Call when the hourly statistics of metadata_ids, or of all statistics
+        if metadata_ids is None, from start_ts are changed in the session.
+
+        The rollups are dropped again once the session is committed in case
+        the old statistics were reduced and cached before the commit.
+        """
+        metadata_id_set = None if metadata_ids is None else set(metadata_ids)
+        self._invalidate(start_ts, metadata_id_set)
+        event.listen(
+            session,
+            "after_commit",
+            lambda _: self._invalidate(start_ts, metadata_id_set),
+            once=True,
+        )
+
+    def _invalidate(self, start_ts: float, metadata_ids: set[int] | None) -> None:
+        """Drop the rollups of periods ending after start_ts."""
+        with self._lock:
+            self._generation += 1
+            for key, rollup in self._rollups.items():
+                if rollup.end_ts > start_ts and (
+                    metadata_ids is None or key[0] in metadata_ids
+                ):
+                    del self._rollups[key]
+
+    def clear(self) -> None:
+        """Drop all rollups."""
+        with self._lock:
+            self._generation += 1
+            self._rollups.clear()
+
+
+def _rollup_key(metadata_id: int, period: str, types: frozenset[str]) -> _RollupKey:
+    """Return the cache key of a rollup.
+
+    The periods depend on the time zone, so it is part of the key.
+    """
+    return (metadata_id, period, types, dt_util.DEFAULT_TIME_ZONE)
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -569,6 +693,9 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        get_statistics_rollup_cache(instance.hass).invalidate(
+            session, start.replace(minute=0).timestamp(), None
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -714,6 +841,12 @@ def get_metadata(
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
+        metadata = instance.statistics_meta_manager.get_many(
+            session, statistic_ids=set(statistic_ids)
+        )
+        get_statistics_rollup_cache(instance.hass).invalidate(
+            session, 0, (metadata_id for metadata_id, _ in metadata.values())
+        )
         instance.statistics_meta_manager.delete(session, statistic_ids)
 
 
@@ -1080,6 +1213,164 @@ def _reduce_statistics_per_month(
     )
 
 
+_REDUCE_PERIODS = {
+    "day": (reduce_day_ts_factory, _reduce_statistics_per_day),
+    "week": (reduce_week_ts_factory, _reduce_statistics_per_week),
+    "month": (reduce_month_ts_factory, _reduce_statistics_per_month),
+}
+
+
+def _reduced_statistics_during_period_with_rollups(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int],
+    period: str,
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return hourly statistics reduced to days, weeks or months.
+
+    The periods which have ended are taken from the StatisticsRollupCache
+    when possible, so only the hourly statistics after the cached periods,
+    typically only those of the current period, are fetched and reduced.
+
+    start_time and end_time must be aligned with the period.
+    """
+    rollup_cache = get_statistics_rollup_cache(hass)
+    generation = rollup_cache.generation
+    rollup_types = frozenset(types)
+    ts_factory, reduce_statistics = _REDUCE_PERIODS[period]
+    _, period_start_end_ts = ts_factory()
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp() if end_time is not None else None
+    # The periods before the current period have ended
+    closed_end_ts = period_start_end_ts(dt_util.utcnow().timestamp())[0]
+    if end_time_ts is not None:
+        closed_end_ts = min(closed_end_ts, end_time_ts)
+
+    rollups: dict[int, StatisticsRollup] = {}
+    metadata_ids_by_query_start_ts: dict[float, list[int]] = defaultdict(list)
+    for metadata_id in metadata_ids:
+        query_start_ts = start_time_ts
+        if rollup := rollup_cache.get_rollup(
+            metadata_id, period, rollup_types, start_time_ts
+        ):
+            rollups[metadata_id] = rollup
+            query_start_ts = max(rollup.end_ts, start_time_ts)
+        if end_time_ts is None or query_start_ts < end_time_ts:
+            metadata_ids_by_query_start_ts[query_start_ts].append(metadata_id)
+
+    # Fetch and reduce the hourly statistics after the cached periods
+    stats: list[Row] = []
+    for query_start_ts, query_metadata_ids in metadata_ids_by_query_start_ts.items():
+        stmt = _generate_statistics_during_period_stmt(
+            dt_util.utc_from_timestamp(query_start_ts),
+            end_time,
+            query_metadata_ids,
+            Statistics,
+            types,
+        )
+        stats.extend(execute_stmt_lambda_element(session, stmt, orm_rows=False))
+    reduced: dict[str, list[StatisticsRow]] = {}
+    if stats:
+        reduced = reduce_statistics(
+            _sorted_statistics_to_dict(
+                hass,
+                session,
+                stats,
+                None,
+                metadata,
+                False,
+                Statistics,
+                start_time,
+                None,
+                types,
+            ),
+            types,
+        )
+
+    result: dict[str, list[StatisticsRow]] = {}
+    for statistic_id in statistic_ids or metadata:
+        if statistic_id not in metadata:
+            continue
+        metadata_id, stats_metadata = metadata[statistic_id]
+        rows = reduced.get(statistic_id, [])
+        if rollup := rollups.get(metadata_id):
+            rows = [
+                row
+                for row in rollup.rows
+                if row["start"] >= start_time_ts
+                and (end_time_ts is None or row["start"] < end_time_ts)
+            ] + rows
+        # Cache the periods which have ended
+        rollup_start_ts = rollup.start_ts if rollup else start_time_ts
+        if closed_end_ts > (rollup.end_ts if rollup else rollup_start_ts):
+            rollup_cache.set_rollup(
+                generation,
+                metadata_id,
+                period,
+                rollup_types,
+                StatisticsRollup(
+                    rollup_start_ts,
+                    closed_end_ts,
+                    (rollup.rows if rollup else [])
+                    + [
+                        row
+                        for row in reduced.get(statistic_id, [])
+                        if row["end"] <= closed_end_ts
+                    ],
+                ),
+            )
+        if not rows:
+            continue
+        result[statistic_id] = _convert_statistics_rows(
+            rows,
+            _get_statistic_to_display_unit_converter(
+                stats_metadata["unit_of_measurement"],
+                _get_state_unit(hass, statistic_id, stats_metadata),
+                units,
+            ),
+        )
+    return result
+
+
+def _get_state_unit(
+    hass: HomeAssistant, statistic_id: str, stats_metadata: StatisticMetaData
+) -> str | None:
+    """Return the unit of the state of a statistic."""
+    if state := hass.states.get(statistic_id):
+        return state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    return stats_metadata["unit_of_measurement"]
+
+
+def _convert_statistics_rows(
+    rows: list[StatisticsRow],
+    convert: Callable[[float | None], float | None] | None,
+) -> list[StatisticsRow]:
+    """Return copies of cached statistics rows converted to the display unit."""
+    if convert is None:
+        return [row.copy() for row in rows]
+    converted_rows: list[StatisticsRow] = []
+    for row in rows:
+        converted_row = row.copy()
+        if "mean" in row:
+            converted_row["mean"] = convert(row["mean"])
+        if "min" in row:
+            converted_row["min"] = convert(row["min"])
+        if "max" in row:
+            converted_row["max"] = convert(row["max"])
+        if "state" in row:
+            converted_row["state"] = convert(row["state"])
+        if "sum" in row:
+            converted_row["sum"] = convert(row["sum"])
+        converted_rows.append(converted_row)
+    return converted_rows
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1702,37 +1993,48 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
-        hass,
-        session,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        start_time,
-        units,
-        types,
-    )
+    result: dict[str, list[StatisticsRow]]
+    if metadata_ids and period in _REDUCE_PERIODS:
+        result = _reduced_statistics_during_period_with_rollups(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period,
+            units,
+            types,
+        )
+        if not result:
+            return {}
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if not stats:
+            return {}
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            units,
+            types,
+        )
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period in _REDUCE_PERIODS:
+            result = _REDUCE_PERIODS[period][1](result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2305,13 +2607,20 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    first_start: datetime | None = None
     for stat in statistics:
+        if first_start is None or stat["start"] < first_start:
+            first_start = stat["start"]
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
 
     if table != StatisticsShortTerm:
+        if first_start is not None:
+            get_statistics_rollup_cache(instance.hass).invalidate(
+                session, first_start.timestamp(), [metadata_id]
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2332,6 +2641,12 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_ROLLUP_CACHE)
+def get_statistics_rollup_cache(hass: HomeAssistant) -> StatisticsRollupCache:
+    """Get the statistics rollup cache."""
+    return StatisticsRollupCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2438,6 +2753,11 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        get_statistics_rollup_cache(instance.hass).invalidate(
+            session,
+            start_time.replace(minute=0).timestamp(),
+            [metadata[statistic_id][0]],
+        )
 
     return True
 
@@ -2502,6 +2822,7 @@ def change_statistics_unit(
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        get_statistics_rollup_cache(instance.hass).invalidate(session, 0, [metadata_id])
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
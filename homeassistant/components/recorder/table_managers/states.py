@@ -1,8 +1,24 @@
 """Support managing States."""
 from __future__ import annotations
 
+from operator import attrgetter
+from typing import Any, cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
 
+_STATES_TABLE = cast(Table, States.__table__)
+_INSERT_STATES_RETURNING_IDS = insert(_STATES_TABLE).returning(
+    _STATES_TABLE.c.state_id, _STATES_TABLE.c.metadata_id, _STATES_TABLE.c.entity_id
+)
+# Every column but the state_id the database assigns
+_INSERT_COLUMNS = tuple(
+    column.key for column in _STATES_TABLE.columns if not column.primary_key
+)
+_get_insert_values = attrgetter(*_INSERT_COLUMNS)
+
 
 class StatesManager:
     """Manage the states table."""
@@ -10,7 +26,13 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_inserts: list[States] = []
+        # The states given a state_id by insert_pending since the last commit
+        self._inserting: list[States] = []
         self._last_committed_id: dict[str, int] = {}
+        # The committed state_ids popped since the last commit, restored
+        # by rollback_pending so the retried states link to them again
+        self._popped_committed_id: dict[str, int] = {}
 
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
@@ -31,7 +53,9 @@ class StatesManager:
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        return self._last_committed_id.pop(entity_id, None)
+        if (state_id := self._last_committed_id.pop(entity_id, None)) is not None:
+            self._popped_committed_id[entity_id] = state_id
+        return state_id
 
     def add_pending(self, entity_id: str, state: States) -> None:
         """Add a pending state.
@@ -43,6 +67,73 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state to be inserted with insert_pending.
+
+        States added here are not added to the session and
+        are written by insert_pending right before the commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def insert_pending(self, session: Session) -> None:
+        """Insert the states added with add_pending_insert.
+
+        The ORM unit of work inserts States one row at a time because
+        old_state references another row of the same table. Instead we
+        insert the states in generations with multi-row INSERT ... RETURNING
+        statements. A state is only inserted once the state it links to
+        with old_state has a state_id, and each generation has at most
+        one state per entity so the returned rows can be matched back to
+        their States by metadata_id or entity_id.
+
+        The dialect must support RETURNING with executemany.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        pending: list[States] = []
+        scheduled: set[int] = set()
+        for db_state in self._pending_inserts:
+            # Like the ORM cascade, also insert an old_state that
+            # was linked to but not added itself
+            while (
+                cast(int | None, db_state.state_id) is None
+                and id(db_state) not in scheduled
+            ):
+                scheduled.add(id(db_state))
+                pending.append(db_state)
+                if (old_state := db_state.old_state) is None:
+                    break
+                db_state = old_state
+        if not pending:
+            return
+        self._inserting.extend(pending)
+        # Flush the new StatesMeta and StateAttributes rows
+        # so their ids are known before linking them.
+        session.flush()
+        while pending:
+            generation: dict[int | str | None, States] = {}
+            deferred: list[States] = []
+            for db_state in pending:
+                if (
+                    (old_state := db_state.old_state) is not None
+                    and cast(int | None, old_state.state_id) is None
+                ) or (key := _resolve_ids(db_state)) in generation:
+                    deferred.append(db_state)
+                    continue
+                generation[key] = db_state
+            for state_id, metadata_id, entity_id in session.execute(
+                _INSERT_STATES_RETURNING_IDS,
+                [_insert_params(db_state) for db_state in generation.values()],
+            ):
+                generation[
+                    metadata_id if metadata_id is not None else entity_id
+                ].state_id = state_id
+            pending = deferred
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
@@ -51,7 +142,31 @@ class StatesManager:
         """
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
+        self._popped_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
+        self._inserting.clear()
+
+    def rollback_pending(self) -> None:
+        """Discard the pending states after the session was rolled back.
+
+        The rows inserted by insert_pending were rolled back, so the
+        state_id and old_state_id they were given are reset. The committed
+        state_ids popped by pop_committed are restored so the states added
+        again link to them.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for db_state in self._inserting:
+            db_state.state_id = None  # type: ignore[assignment]
+            if db_state.old_state is not None:
+                db_state.old_state_id = None
+        self._inserting.clear()
+        self._last_committed_id.update(self._popped_committed_id)
+        self._popped_committed_id.clear()
+        self._pending.clear()
+        self._pending_inserts.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -60,7 +175,8 @@ class StatesManager:
         recorder thread.
         """
         self._last_committed_id.clear()
-        self._pending.clear()
+        self._popped_committed_id.clear()
+        self.rollback_pending()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -68,17 +184,23 @@ class StatesManager:
         When we purge states we need to make sure the next call to record a state
         does not link the old_state_id to the purged state.
         """
-        # Make a map from the committed state_id to the entity_id
-        last_committed_ids = self._last_committed_id
-        last_committed_ids_reversed = {
-            state_id: entity_id for entity_id, state_id in last_committed_ids.items()
-        }
-
-        # Evict any purged state from the old states cache
-        for purged_state_id in purged_state_ids.intersection(
-            last_committed_ids_reversed
+        for last_committed_ids in (
+            self._last_committed_id,
+            self._popped_committed_id,
         ):
-            last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
+            # Make a map from the committed state_id to the entity_id
+            last_committed_ids_reversed = {
+                state_id: entity_id
+                for entity_id, state_id in last_committed_ids.items()
+            }
+
+            # Evict any purged state from the old states cache
+            for purged_state_id in purged_state_ids.intersection(
+                last_committed_ids_reversed
+            ):
+                last_committed_ids.pop(
+                    last_committed_ids_reversed[purged_state_id], None
+                )
 
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
@@ -87,5 +209,28 @@ class StatesManager:
         does not link the old_state_id to the purged state.
         """
         last_committed_ids = self._last_committed_id
+        popped_committed_ids = self._popped_committed_id
         for entity_id in purged_entity_ids:
             last_committed_ids.pop(entity_id, None)
+            popped_committed_ids.pop(entity_id, None)
+
+
+def _resolve_ids(db_state: States) -> int | str | None:
+    """Copy the ids of the related rows to a state about to be inserted.
+
+    Returns the metadata_id or the entity_id if there is no metadata_id.
+    """
+    if (old_state := db_state.old_state) is not None:
+        db_state.old_state_id = old_state.state_id
+    if (state_attributes := db_state.state_attributes) is not None:
+        db_state.attributes_id = state_attributes.attributes_id
+    if (states_meta := db_state.states_meta_rel) is not None:
+        db_state.metadata_id = states_meta.metadata_id
+    if (metadata_id := db_state.metadata_id) is not None:
+        return metadata_id
+    return db_state.entity_id
+
+
+def _insert_params(db_state: States) -> dict[str, Any]:
+    """Return the parameters to insert a state."""
+    return dict(zip(_INSERT_COLUMNS, _get_insert_values(db_state)))
@@ -1,12 +1,15 @@
 """Statistics helper for sensor."""
 from __future__ import annotations
 
+import bisect
 from collections import defaultdict
 from collections.abc import Callable, Iterable, MutableMapping
 import datetime
 import itertools
 import logging
 import math
+from operator import attrgetter
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -24,12 +27,21 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.loader import async_suggest_report_issue
@@ -64,6 +76,170 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Keep track of the sensor states of the current statistics period
+DATA_STATE_ACCUMULATOR = "sensor_recorder_state_accumulator"
+# States are kept for two statistics periods so the states of the last
+# period are still complete if compiling the statistics is delayed
+MAX_ACCUMULATED_STATES_AGE = datetime.timedelta(minutes=10)
+
+_last_updated = attrgetter("last_updated")
+
+
+class _StateAccumulator:
+    """Accumulate the sensor states of the recent statistics periods.
+
+    The states are fed from state_changed events so compile_statistics
+    does not have to read them back from the database. The database is
+    still used for periods which started before the accumulator was
+    started, or which are too old to still be accumulated.
+
+    Only the states of sensors with a state class are accumulated, since
+    statistics are not compiled for the other sensors.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator."""
+        self.hass = hass
+        self._lock = threading.Lock()
+        # All states updated since this time have been accumulated
+        self._accumulated_since: datetime.datetime | None = None
+        self._states: dict[str, list[State]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start accumulating the sensor states until the recorder stops."""
+        accumulated_since = dt_util.utcnow()
+        with self._lock:
+            for state in self.hass.states.async_all(DOMAIN):
+                if ATTR_STATE_CLASS not in state.attributes:
+                    continue
+                self._states[state.entity_id] = [state]
+                # Older states of the sensor are not known
+                accumulated_since = max(accumulated_since, state.last_updated)
+            self._accumulated_since = accumulated_since
+        self._unsub = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_state_changed_filter,
+            run_immediately=True,
+        )
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_stop
+        )
+
+    @callback
+    def _async_stop(self, event: Event) -> None:
+        """Stop accumulating the sensor states when the recorder stops."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        with self._lock:
+            self._accumulated_since = None
+            self._states.clear()
+
+    @callback
+    def _async_state_changed_filter(self, event: Event) -> bool:
+        """Filter state changed events of sensors with a state class.
+
+        Sensors already accumulated are kept until they are removed.
+        """
+        entity_id: str = event.data["entity_id"]
+        if split_entity_id(entity_id)[0] != DOMAIN:
+            return False
+        if entity_id in self._states:
+            return True
+        new_state: State | None = event.data["new_state"]
+        return new_state is not None and ATTR_STATE_CLASS in new_state.attributes
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add a new state of a sensor."""
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        with self._lock:
+            if new_state is None:
+                self._states.pop(entity_id, None)
+                return
+            if not (states := self._states.get(entity_id)):
+                self._states[entity_id] = [new_state]
+                return
+            if new_state.last_updated >= states[-1].last_updated:
+                states.append(new_state)
+            else:
+                bisect.insort(states, new_state, key=_last_updated)
+            # Drop the expired states but keep the last one
+            # before the cutoff as the state at its start
+            cutoff = new_state.last_updated - MAX_ACCUMULATED_STATES_AGE
+            expired = 0
+            while (
+                expired + 1 < len(states) and states[expired + 1].last_updated < cutoff
+            ):
+                expired += 1
+            if expired:
+                del states[:expired]
+
+    def get_states_during_period(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        entities_full_history: list[str],
+        entities_significant_history: list[str],
+    ) -> dict[str, list[State]] | None:
+        """Return the states during start-end like the history queries do.
+
+        Returns None if the states during the period are not accumulated.
+        """
+        with self._lock:
+            if (
+                self._accumulated_since is None
+                or start < self._accumulated_since
+                or start < dt_util.utcnow() - MAX_ACCUMULATED_STATES_AGE
+            ):
+                return None
+            history_list: dict[str, list[State]] = {}
+            for entity_ids, significant_changes_only in (
+                (entities_full_history, False),
+                (entities_significant_history, True),
+            ):
+                for entity_id in entity_ids:
+                    if (states := self._states.get(entity_id)) and (
+                        period_states := _states_during_period(
+                            states, start, end, significant_changes_only
+                        )
+                    ):
+                        history_list[entity_id] = period_states
+        return history_list
+
+
+def _states_during_period(
+    states: list[State],
+    start: datetime.datetime,
+    end: datetime.datetime,
+    significant_changes_only: bool,
+) -> list[State]:
+    """Return the state at start followed by the states during start-end."""
+    start_state: State | None = None
+    period_states: list[State] = []
+    for state in states:
+        last_updated = state.last_updated
+        if last_updated < start:
+            start_state = state
+        elif last_updated >= end:
+            break
+        elif not significant_changes_only or state.last_changed == last_updated:
+            period_states.append(state)
+    if start_state is not None:
+        period_states.insert(0, start_state)
+    return period_states
+
+
+def _get_state_accumulator(hass: HomeAssistant) -> _StateAccumulator:
+    """Return the sensor state accumulator and start it if needed."""
+    if (accumulator := hass.data.get(DATA_STATE_ACCUMULATOR)) is None:
+        accumulator = hass.data[DATA_STATE_ACCUMULATOR] = _StateAccumulator(hass)
+        hass.add_job(accumulator.async_start)
+    return accumulator
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -394,30 +570,35 @@ def compile_statistics(  # noqa: C901
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
-    history_list: MutableMapping[str, list[State]] = {}
-    if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
-        )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
-    if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
-        )
-        history_list = {**history_list, **_history_list}
+    history_list: MutableMapping[str, list[State]] | None
+    history_list = _get_state_accumulator(hass).get_states_during_period(
+        start, end, entities_full_history, entities_significant_history
+    )
+    if history_list is None:
+        history_list = {}
+        if entities_full_history:
+            history_list = history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            )
+        if entities_significant_history:
+            _history_list = history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+            )
+            history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -1,7 +1,7 @@
 """Handle the auth of a connection."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Final
 
 from aiohttp.web import Request
@@ -57,9 +57,10 @@ class AuthPhase:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
+        drain: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         """Initialize the authentiated connection."""
         self._hass = hass
@@ -67,6 +68,7 @@ class AuthPhase:
         self._cancel_ws = cancel_ws
         self._logger = logger
         self._request = request
+        self._drain = drain
 
     async def async_handle(self, msg: JsonValueType) -> ActiveConnection:
         """Handle authentication."""
@@ -106,5 +108,10 @@ class AuthPhase:
         process_success_login(self._request)
         self._send_message(auth_ok_message())
         return ActiveConnection(
-            self._logger, self._hass, self._send_message, user, refresh_token
+            self._logger,
+            self._hass,
+            self._send_message,
+            user,
+            refresh_token,
+            self._drain,
         )
@@ -1,16 +1,16 @@
 """Commands part of Websocket API."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 import datetime as dt
 from functools import lru_cache, partial
 import json
 import logging
-from typing import Any, cast
+import math
+from typing import TYPE_CHECKING, Any, cast
 
 import voluptuous as vol
 
-from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     HomeAssistant,
@@ -35,6 +36,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, entity, template
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import async_get_polling_scheduler
 from homeassistant.helpers.event import (
     EventStateChangedData,
     TrackTemplate,
@@ -83,6 +85,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_poll_latency)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -102,32 +105,123 @@ def pong_message(iden: int) -> dict[str, Any]:
     return {"id": iden, "type": "pong"}
 
 
-@callback
-def _forward_events_check_permissions(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward state changed events to websocket."""
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_event_message(msg_id, event))
+class _SharedSubscription:
+    """A bus listener shared by identical subscriptions of all connections.
+
+    The message is serialized once per event by the cached message
+    builder and only the subscription id differs for each member.
+    """
+
+    __slots__ = (
+        "members",
+        "message_builder",
+        "batch_message_builder",
+        "check_permissions",
+        "unsub",
+    )
+
+    def __init__(
+        self,
+        message_builder: Callable[[int, Event], bytes],
+        batch_message_builder: Callable[[int, list[Event]], bytes] | None,
+        check_permissions: bool,
+    ) -> None:
+        """Initialize the shared subscription."""
+        self.members: dict[tuple[ActiveConnection, int], None] = {}
+        self.message_builder = message_builder
+        self.batch_message_builder = batch_message_builder
+        self.check_permissions = check_permissions
+        self.unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_forward(self, event: Event) -> None:
+        """Forward an event to all member subscriptions."""
+        message_builder = self.message_builder
+        if not self.check_permissions:
+            for connection, msg_id in self.members:
+                connection.send_message(message_builder(msg_id, event))
+            return
+        entity_id = event.data["entity_id"]
+        for connection, msg_id in self.members:
+            # We have to lookup the permissions again because the user might
+            # have changed since the subscription was created.
+            permissions = connection.user.permissions
+            if not permissions.access_all_entities(
+                POLICY_READ
+            ) and not permissions.check_entity(entity_id, POLICY_READ):
+                continue
+            connection.send_message(message_builder(msg_id, event))
+
+    @callback
+    def async_forward_batch(self, events: list[Event]) -> None:
+        """Forward a batch of events to all member subscriptions as one message."""
+        batch_message_builder = self.batch_message_builder
+        if TYPE_CHECKING:
+            assert batch_message_builder is not None
+        if not self.check_permissions:
+            for connection, msg_id in self.members:
+                connection.send_message(batch_message_builder(msg_id, events))
+            return
+        for connection, msg_id in self.members:
+            permissions = connection.user.permissions
+            if permissions.access_all_entities(POLICY_READ):
+                connection.send_message(batch_message_builder(msg_id, events))
+                continue
+            if allowed_events := [
+                event
+                for event in events
+                if permissions.check_entity(event.data["entity_id"], POLICY_READ)
+            ]:
+                connection.send_message(batch_message_builder(msg_id, allowed_events))
 
 
 @callback
-def _forward_events_unconditional(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+def _async_subscribe_shared(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
-    event: Event,
-) -> None:
-    """Forward events to websocket."""
-    send_message(messages.cached_event_message(msg_id, event))
+    key: Hashable,
+    message_builder: Callable[[int, Event], bytes],
+    check_permissions: bool,
+    listen: Callable[..., CALLBACK_TYPE],
+    batch_message_builder: Callable[[int, list[Event]], bytes] | None = None,
+) -> CALLBACK_TYPE:
+    """Subscribe a connection to the bus listener shared by identical subscriptions.
+
+    The bus listener is created with listen for the first member
+    and removed again when the last member unsubscribes. If a
+    batch_message_builder is passed, events fired in a batch are
+    forwarded as one message built with it.
+    """
+    shared_subscriptions: dict[Hashable, _SharedSubscription] = hass.data.setdefault(
+        const.DATA_SHARED_SUBSCRIPTIONS, {}
+    )
+    if (shared := shared_subscriptions.get(key)) is None:
+        shared = _SharedSubscription(
+            message_builder, batch_message_builder, check_permissions
+        )
+        if batch_message_builder is None:
+            shared.unsub = listen(shared.async_forward)
+        else:
+            shared.unsub = listen(
+                shared.async_forward, batch_listener=shared.async_forward_batch
+            )
+        shared_subscriptions[key] = shared
+    member = (connection, msg_id)
+    shared.members[member] = None
+
+    @callback
+    def _async_unsubscribe() -> None:
+        """Remove the member and the bus listener once it is unused."""
+        del shared.members[member]
+        if shared.members:
+            return
+        del shared_subscriptions[key]
+        if TYPE_CHECKING:
+            assert shared.unsub is not None
+        shared.unsub()
+
+    return _async_unsubscribe
 
 
 @callback
@@ -151,20 +245,14 @@ def handle_subscribe_events(
         )
         raise Unauthorized(user_id=connection.user.id)
 
-    if event_type == EVENT_STATE_CHANGED:
-        forward_events = partial(
-            _forward_events_check_permissions,
-            connection.send_message,
-            connection.user,
-            msg["id"],
-        )
-    else:
-        forward_events = partial(
-            _forward_events_unconditional, connection.send_message, msg["id"]
-        )
-
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events, run_immediately=True
+    connection.subscriptions[msg["id"]] = _async_subscribe_shared(
+        hass,
+        connection,
+        msg["id"],
+        ("subscribe_events", event_type),
+        messages.cached_event_message,
+        event_type == EVENT_STATE_CHANGED,
+        partial(hass.bus.async_listen, event_type, run_immediately=True),
     )
 
     connection.send_result(msg["id"])
@@ -322,6 +410,19 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    if connection.user.permissions.access_all_entities(POLICY_READ):
+        # The state machine keeps a snapshot of the serialized states
+        # so only the domains that changed are serialized again.
+        try:
+            serialized_states_json = hass.states.async_all_json()
+        except (ValueError, TypeError):
+            pass
+        else:
+            _send_handle_get_states_response(
+                connection, msg["id"], serialized_states_json
+            )
+            return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -329,7 +430,9 @@ def handle_get_states(
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_get_states_response(connection, msg["id"], serialized_states)
+        _send_handle_get_states_response(
+            connection, msg["id"], f'[{",".join(serialized_states)}]'
+        )
         return
 
     # If we can't serialize, we'll filter out unserializable states
@@ -345,38 +448,16 @@ def handle_get_states(
                 ),
             )
 
-    _send_handle_get_states_response(connection, msg["id"], serialized_states)
+    _send_handle_get_states_response(
+        connection, msg["id"], f'[{",".join(serialized_states)}]'
+    )
 
 
 def _send_handle_get_states_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[str]
+    connection: ActiveConnection, msg_id: int, serialized_states_json: str
 ) -> None:
     """Send handle get states response."""
-    connection.send_message(
-        construct_result_message(msg_id, f'[{",".join(serialized_states)}]')
-    )
-
-
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    connection.send_message(construct_result_message(msg_id, serialized_states_json))
 
 
 @callback
@@ -394,20 +475,48 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
+    if entity_ids:
+        # Route by entity_id on the bus so we do not have to
+        # look at every state change when only a few entities
+        # are subscribed.
+        listen = partial(
+            hass.bus.async_listen_keyed,
+            EVENT_STATE_CHANGED,
             entity_ids,
-            connection.user,
-            msg["id"],
-        ),
-        run_immediately=True,
+            run_immediately=True,
+        )
+    else:
+        listen = partial(
+            hass.bus.async_listen, EVENT_STATE_CHANGED, run_immediately=True
+        )
+    # Connections subscribing to the same entities share one bus listener
+    connection.subscriptions[msg["id"]] = _async_subscribe_shared(
+        hass,
+        connection,
+        msg["id"],
+        ("subscribe_entities", frozenset(entity_ids)),
+        messages.cached_state_diff_message,
+        True,
+        listen,
+        messages.state_diff_batch_message,
     )
     connection.send_result(msg["id"])
 
+    if not entity_ids and connection.user.permissions.access_all_entities(POLICY_READ):
+        # The state machine keeps a snapshot of the serialized states
+        # so only the domains that changed are serialized again.
+        try:
+            compressed_states_json = hass.states.async_all_compressed_json()
+        except (ValueError, TypeError):
+            pass
+        else:
+            _send_handle_entities_init_response(
+                connection, msg["id"], compressed_states_json
+            )
+            return
+
+    states = _async_get_allowed_states(hass, connection)
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -420,7 +529,9 @@ def handle_subscribe_entities(
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+        _send_handle_entities_init_response(
+            connection, msg["id"], f'{{{",".join(serialized_states)}}}'
+        )
         return
 
     serialized_states = []
@@ -435,15 +546,17 @@ def handle_subscribe_entities(
                 ),
             )
 
-    _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+    _send_handle_entities_init_response(
+        connection, msg["id"], f'{{{",".join(serialized_states)}}}'
+    )
 
 
 def _send_handle_entities_init_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[str]
+    connection: ActiveConnection, msg_id: int, compressed_states_json: str
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
-        f'{{"id":{msg_id},"type":"event","event":{{"a":{{{",".join(serialized_states)}}}}}}}'
+        f'{{"id":{msg_id},"type":"event","event":{{"a":{compressed_states_json}}}}}'
     )
 
 
@@ -536,6 +649,32 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/poll_latency"})
+def handle_integration_poll_latency(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle poll latency command.
+
+    The last bucket has no upper bound and is reported as None.
+    """
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "platform": platform,
+                "buckets": [
+                    {"seconds": None if bound == math.inf else bound, "count": count}
+                    for bound, count in histogram.items()
+                ],
+            }
+            for platform, histogram in async_get_polling_scheduler(hass)
+            .async_latency_histograms()
+            .items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
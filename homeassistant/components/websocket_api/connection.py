@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
@@ -45,15 +45,18 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "closed",
+        "_drain",
     )
 
     def __init__(
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        drain: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -69,6 +72,8 @@ class ActiveConnection:
             const.DOMAIN
         ]
         self.binary_handlers: list[BinaryHandler | None] = []
+        self.closed = False
+        self._drain = drain
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -123,6 +128,15 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    async def async_drain(self) -> None:
+        """Wait until the messages sent so far have been written to the client.
+
+        Commands sending many large messages should wait for the messages to
+        be written before generating the next ones to keep memory bounded.
+        """
+        if self._drain is not None:
+            await self._drain()
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -229,6 +243,7 @@ class ActiveConnection:
     @callback
     def async_handle_close(self) -> None:
         """Handle closing down connection."""
+        self.closed = True
         for unsub in self.subscriptions.values():
             try:
                 unsub()
@@ -244,7 +259,7 @@ class ActiveConnection:
 
     @callback
     def _connect_closed_error(
-        self, msg: str | dict[str, Any] | Callable[[], str]
+        self, msg: str | bytes | dict[str, Any] | Callable[[], str]
     ) -> None:
         """Send a message when the connection is closed."""
         self.logger.debug("Tried to send message %s on closed connection", msg)
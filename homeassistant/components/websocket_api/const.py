@@ -49,4 +49,7 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
+# Data used to store the bus listeners shared by identical subscriptions
+DATA_SHARED_SUBSCRIPTIONS: Final = f"{DOMAIN}.shared_subscriptions"
+
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
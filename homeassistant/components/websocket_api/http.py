@@ -5,6 +5,7 @@ import asyncio
 from collections import deque
 from collections.abc import Callable
 import datetime as dt
+from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
 
@@ -28,7 +29,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import message_to_json_bytes
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -75,6 +76,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_drained_future",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -94,8 +96,10 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[bytes | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # Set when the message queue has been written to the websocket
+        self._drained_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -121,7 +125,13 @@ class WebSocketHandler:
         message_queue = self._message_queue
         logger = self._logger
         wsock = self._wsock
-        send_str = wsock.send_str
+        writer = wsock._writer  # pylint: disable=protected-access
+        if TYPE_CHECKING:
+            assert writer is not None
+        # The messages are already encoded so they are sent as text
+        # frames with the writer, send_str only accepts str and would
+        # encode them again, send_bytes would send binary frames
+        send_bytes_text = partial(writer.send, binary=False)
         loop = self._hass.loop
         debug = logger.debug
         is_enabled_for = logger.isEnabledFor
@@ -130,6 +140,7 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if (messages_remaining := len(message_queue)) == 0:
+                    self._release_drain_waiters()
                     self._ready_future = loop.create_future()
                     await self._ready_future
                     messages_remaining = len(message_queue)
@@ -148,10 +159,10 @@ class WebSocketHandler:
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_str(message)
+                    await send_bytes_text(message)
                     continue
 
-                messages: list[str] = [message]
+                messages: list[bytes] = [message]
                 while messages_remaining:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
@@ -159,10 +170,10 @@ class WebSocketHandler:
                     messages.append(message)
                     messages_remaining -= 1
 
-                coalesced_messages = f'[{",".join(messages)}]'
+                coalesced_messages = b"".join((b"[", b",".join(messages), b"]"))
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_str(coalesced_messages)
+                await send_bytes_text(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -172,6 +183,32 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drain_waiters()
+
+    @callback
+    def _release_drain_waiters(self) -> None:
+        """Release the callers waiting in _async_drain."""
+        if (drained_future := self._drained_future) is not None:
+            self._drained_future = None
+            if not drained_future.done():
+                drained_future.set_result(None)
+
+    async def _async_drain(self) -> None:
+        """Wait until the queued messages have been written to the websocket.
+
+        This allows senders of a large volume of messages to apply
+        back-pressure instead of filling the queue up to MAX_PENDING_MSG.
+        """
+        if (
+            not self._message_queue
+            or self._closing
+            or (writer_task := self._writer_task) is None
+            or writer_task.done()
+        ):
+            return
+        if self._drained_future is None:
+            self._drained_future = self._hass.loop.create_future()
+        await self._drained_future
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -181,7 +218,7 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -194,7 +231,9 @@ class WebSocketHandler:
             return
 
         if isinstance(message, dict):
-            message = message_to_json(message)
+            message = message_to_json_bytes(message)
+        elif isinstance(message, str):
+            message = message.encode("utf-8")
 
         message_queue = self._message_queue
         queue_size_before_add = len(message_queue)
@@ -291,7 +330,9 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(logger, hass, self._send_message, self._cancel, request)
+        auth = AuthPhase(
+            logger, hass, self._send_message, self._cancel, request, self._async_drain
+        )
         connection = None
         disconnect_warn = None
 
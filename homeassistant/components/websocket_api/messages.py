@@ -16,7 +16,11 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.json import JSON_DUMP, find_paths_unserializable_data
+from homeassistant.helpers.json import (
+    JSON_DUMP,
+    find_paths_unserializable_data,
+    json_bytes,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const
@@ -44,7 +48,7 @@ BASE_ERROR_MESSAGE = {
     "success": False,
 }
 
-INVALID_JSON_PARTIAL_MESSAGE = JSON_DUMP(
+INVALID_JSON_PARTIAL_MESSAGE = json_bytes(
     {
         **BASE_ERROR_MESSAGE,
         "error": {
@@ -96,7 +100,7 @@ def event_message(iden: int, event: Any) -> dict[str, Any]:
     return {"id": iden, "type": "event", "event": event}
 
 
-def cached_event_message(iden: int, event: Event) -> str:
+def cached_event_message(iden: int, event: Event) -> bytes:
     """Return an event message.
 
     Serialize to json once per message.
@@ -105,23 +109,23 @@ def cached_event_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return f'{_partial_cached_event_message(event)[:-1]},"id":{iden}}}'
+    return b'%s,"id":%d}' % (_partial_cached_event_message(event)[:-1], iden)
 
 
 @lru_cache(maxsize=128)
-def _partial_cached_event_message(event: Event) -> str:
+def _partial_cached_event_message(event: Event) -> bytes:
     """Cache and serialize the event to json.
 
     The message is constructed without the id which appended
     in cached_event_message.
     """
     return (
-        _message_to_json_or_none({"type": "event", "event": event.json_fragment})
+        _message_to_json_bytes_or_none({"type": "event", "event": event.json_fragment})
         or INVALID_JSON_PARTIAL_MESSAGE
     )
 
 
-def cached_state_diff_message(iden: int, event: Event) -> str:
+def cached_state_diff_message(iden: int, event: Event) -> bytes:
     """Return an event message.
 
     Serialize to json once per message.
@@ -130,18 +134,52 @@ def cached_state_diff_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return f'{_partial_cached_state_diff_message(event)[:-1]},"id":{iden}}}'
+    return b'%s,"id":%d}' % (_partial_cached_state_diff_message(event)[:-1], iden)
 
 
 @lru_cache(maxsize=128)
-def _partial_cached_state_diff_message(event: Event) -> str:
+def _partial_cached_state_diff_message(event: Event) -> bytes:
     """Cache and serialize the event to json.
 
     The message is constructed without the id which
     will be appended in cached_state_diff_message
     """
     return (
-        _message_to_json_or_none({"type": "event", "event": _state_diff_event(event)})
+        _message_to_json_bytes_or_none(
+            {"type": "event", "event": _state_diff_event(event)}
+        )
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
+def state_diff_batch_message(iden: int, events: list[Event]) -> bytes:
+    """Return an event message with the state diffs of a batch of events.
+
+    The diffs of all entities are merged into one event
+    which is serialized once for all connections.
+    """
+    return b'%s,"id":%d}' % (
+        _partial_state_diff_batch_message(tuple(events))[:-1],
+        iden,
+    )
+
+
+@lru_cache(maxsize=16)
+def _partial_state_diff_batch_message(events: tuple[Event, ...]) -> bytes:
+    """Cache and serialize the merged state diffs of a batch of events to json.
+
+    The message is constructed without the id which
+    will be appended in state_diff_batch_message
+    """
+    diff: dict[str, Any] = {}
+    for event in events:
+        for key, value in _state_diff_event(event).items():
+            if key == ENTITY_EVENT_REMOVE:
+                diff.setdefault(key, []).extend(value)
+            else:
+                diff.setdefault(key, {}).update(value)
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": diff})
         or INVALID_JSON_PARTIAL_MESSAGE
     )
 
@@ -212,10 +250,10 @@ def _state_diff(
     return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
-def _message_to_json_or_none(message: dict[str, Any]) -> str | None:
-    """Serialize a websocket message to json or return None."""
+def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
+    """Serialize a websocket message to json bytes or return None."""
     try:
-        return JSON_DUMP(message)
+        return json_bytes(message)
     except (ValueError, TypeError):
         _LOGGER.error(
             "Unable to serialize to JSON. Bad data found at %s",
@@ -226,10 +264,15 @@ def _message_to_json_or_none(message: dict[str, Any]) -> str | None:
     return None
 
 
-def message_to_json(message: dict[str, Any]) -> str:
-    """Serialize a websocket message to json or return an error."""
-    return _message_to_json_or_none(message) or JSON_DUMP(
+def message_to_json_bytes(message: dict[str, Any]) -> bytes:
+    """Serialize a websocket message to json bytes or return an error."""
+    return _message_to_json_bytes_or_none(message) or json_bytes(
         error_message(
             message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
         )
     )
+
+
+def message_to_json(message: dict[str, Any]) -> str:
+    """Serialize a websocket message to json or return an error."""
+    return message_to_json_bytes(message).decode("utf-8")
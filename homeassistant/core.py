@@ -11,13 +11,14 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 import datetime
 import enum
@@ -49,6 +50,7 @@ from . import block_async_io, util
 from .backports.functools import cached_property
 from .const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
@@ -1142,13 +1144,23 @@ _FilterableJobType = tuple[
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_match_all_listeners",
+        "_keyed_listeners",
+        "_batch_listeners",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._keyed_listeners: dict[str, dict[str, list[_FilterableJobType]]] = {}
+        self._batch_listeners: dict[
+            _FilterableJobType, Callable[[list[Event]], None]
+        ] = {}
         self._hass = hass
 
     @callback
@@ -1157,7 +1169,17 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            # A listener for multiple keys is only counted once
+            listeners[event_type] = listeners.get(event_type, 0) + len(
+                {
+                    filterable_job
+                    for key_listeners in keyed_listeners.values()
+                    for filterable_job in key_listeners
+                }
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1193,10 +1215,81 @@ class EventBus:
             raise MaxLengthExceeded(
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
+        self._async_fire(event_type, event_data, origin, context, time_fired, None)
+
+    @callback
+    def async_fire_batch(
+        self,
+        event_type: str,
+        batch: Iterable[
+            tuple[dict[str, Any], Context | None, datetime.datetime | None]
+        ],
+        origin: EventOrigin = EventOrigin.local,
+    ) -> None:
+        """Fire an event for each (event_data, context, time_fired) of a batch.
+
+        Listeners registered with a batch_listener are called once with
+        all events of the batch they match instead of once per event.
+        All other listeners are called for each event like with async_fire.
 
+        This method must be run in the event loop.
+        """
+        if len(event_type) > MAX_LENGTH_EVENT_EVENT_TYPE:
+            raise MaxLengthExceeded(
+                event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
+            )
+        if not self._batch_listeners:
+            for event_data, context, time_fired in batch:
+                self._async_fire(
+                    event_type, event_data, origin, context, time_fired, None
+                )
+            return
+
+        batched: dict[_FilterableJobType, list[Event]] = {}
+        for event_data, context, time_fired in batch:
+            self._async_fire(
+                event_type, event_data, origin, context, time_fired, batched
+            )
+        batch_listeners = self._batch_listeners
+        for filterable_job, events in batched.items():
+            # The listener may have been removed by another listener
+            if (batch_listener := batch_listeners.get(filterable_job)) is None:
+                continue
+            try:
+                batch_listener(events)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running batch listener: %s", batch_listener)
+
+    @callback
+    def _async_fire(
+        self,
+        event_type: str,
+        event_data: dict[str, Any] | None,
+        origin: EventOrigin,
+        context: Context | None,
+        time_fired: datetime.datetime | None,
+        batched: dict[_FilterableJobType, list[Event]] | None,
+    ) -> None:
+        """Fire an event.
+
+        If batched is passed, the events for listeners with a batch_listener
+        are collected in it instead of calling the listeners.
+
+        This method must be run in the event loop.
+        """
         listeners = self._listeners.get(event_type, [])
         match_all_listeners = self._match_all_listeners
 
+        # Keyed listeners are routed with a dict lookup on the entity_id
+        # of the event so they do not need to be filtered one by one.
+        if (
+            event_data
+            and (keyed_listeners := self._keyed_listeners.get(event_type))
+            and type(key := event_data.get(ATTR_ENTITY_ID)) is str  # noqa: E721
+            and (key_listeners := keyed_listeners.get(key))
+        ):
+            listeners = listeners + key_listeners
+
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -1209,7 +1302,8 @@ class EventBus:
         if event_type != EVENT_HOMEASSISTANT_CLOSE:
             listeners = match_all_listeners + listeners
 
-        for job, event_filter, run_immediately in listeners:
+        for filterable_job in listeners:
+            job, event_filter, run_immediately = filterable_job
             if event_filter is not None:
                 try:
                     if not event_filter(event):
@@ -1217,6 +1311,9 @@ class EventBus:
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception("Error in event filter")
                     continue
+            if batched is not None and filterable_job in self._batch_listeners:
+                batched.setdefault(filterable_job, []).append(event)
+                continue
             if run_immediately:
                 try:
                     job.target(event)
@@ -1252,6 +1349,7 @@ class EventBus:
         listener: Callable[[Event], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[Event], bool] | None = None,
         run_immediately: bool = False,
+        batch_listener: Callable[[list[Event]], None] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1266,6 +1364,11 @@ class EventBus:
         right away instead of using call_soon. Only use this if
         the callback results in scheduling another task.
 
+        An optional batch_listener, which must be a callable decorated with
+        @callback, is called right away with all matching events fired
+        together with async_fire_batch instead of calling the listener
+        for each of them.
+
         This method must be run in the event loop.
         """
         job_type: HassJobType | None = None
@@ -1275,14 +1378,28 @@ class EventBus:
             if not is_callback_check_partial(listener):
                 raise HomeAssistantError(f"Event listener {listener} is not a callback")
             job_type = HassJobType.Callback
-        return self._async_listen_filterable_job(
-            event_type,
-            (
-                HassJob(listener, f"listen {event_type}", job_type=job_type),
-                event_filter,
-                run_immediately,
-            ),
+        filterable_job: _FilterableJobType = (
+            HassJob(listener, f"listen {event_type}", job_type=job_type),
+            event_filter,
+            run_immediately,
         )
+        self._async_add_batch_listener(filterable_job, batch_listener)
+        return self._async_listen_filterable_job(event_type, filterable_job)
+
+    @callback
+    def _async_add_batch_listener(
+        self,
+        filterable_job: _FilterableJobType,
+        batch_listener: Callable[[list[Event]], None] | None,
+    ) -> None:
+        """Add the batch listener of a filterable job."""
+        if batch_listener is None:
+            return
+        if not is_callback_check_partial(batch_listener):
+            raise HomeAssistantError(
+                f"Batch listener {batch_listener} is not a callback"
+            )
+        self._batch_listeners[filterable_job] = batch_listener
 
     @callback
     def _async_listen_filterable_job(
@@ -1293,6 +1410,54 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        keys: str | Iterable[str],
+        listener: Callable[[Event], Coroutine[Any, Any, None] | None],
+        run_immediately: bool = False,
+        batch_listener: Callable[[list[Event]], None] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a specific entity_id.
+
+        keys is an entity_id or an iterable of entity_ids. The listener is
+        only called for events where event.data["entity_id"] matches one
+        of the keys. Matching listeners are found with a dict lookup which
+        is much faster than an event_filter when there are many listeners
+        for the same event type.
+
+        If run_immediately is passed, the callback will be run
+        right away instead of using call_soon. Only use this if
+        the callback results in scheduling another task.
+
+        An optional batch_listener is called like with async_listen.
+
+        This method must be run in the event loop.
+        """
+        job_type: HassJobType | None = None
+        if run_immediately:
+            if not is_callback_check_partial(listener):
+                raise HomeAssistantError(f"Event listener {listener} is not a callback")
+            job_type = HassJobType.Callback
+        if isinstance(keys, str):
+            keys = (keys,)
+        else:
+            # Each key is only dispatched once
+            keys = tuple(dict.fromkeys(keys))
+        filterable_job: _FilterableJobType = (
+            HassJob(listener, f"listen {event_type} {keys}", job_type=job_type),
+            None,
+            run_immediately,
+        )
+        self._async_add_batch_listener(filterable_job, batch_listener)
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+        for key in keys:
+            keyed_listeners.setdefault(key, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, keys, filterable_job
+        )
+
     def listen_once(
         self,
         event_type: str,
@@ -1372,6 +1537,7 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        self._batch_listeners.pop(filterable_job, None)
         try:
             self._listeners[event_type].remove(filterable_job)
 
@@ -1385,6 +1551,36 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: str,
+        keys: tuple[str, ...],
+        filterable_job: _FilterableJobType,
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        self._batch_listeners.pop(filterable_job, None)
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            for key in keys:
+                key_listeners = keyed_listeners[key]
+                key_listeners.remove(filterable_job)
+                # delete key list if empty
+                if not key_listeners:
+                    del keyed_listeners[key]
+            # delete event_type dict if empty
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+        except (KeyError, ValueError):
+            # KeyError is key event_type or key listener did not exist
+            # ValueError if listener did not exist within key
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -1608,12 +1804,24 @@ class States(UserDict[str, State]):
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    And a snapshot of the serialized states per domain which
+    is invalidated when a state in the domain changes:
+    - domain -> JSON of the states
+    - domain -> JSON of the compressed states
+
+    And a version counter that increases with every change
+    as well as the version of the last change of each domain.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._domain_json: dict[str, str] = {}
+        self._domain_compressed_json: dict[str, str] = {}
+        self._version = 0
+        self._domain_version: dict[str, int] = {}
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -1622,14 +1830,68 @@ class States(UserDict[str, State]):
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
         self.data[key] = entry
-        self._domain_index[entry.domain][entry.entity_id] = entry
+        domain = entry.domain
+        self._domain_index[domain][entry.entity_id] = entry
+        self._domain_json.pop(domain, None)
+        self._domain_compressed_json.pop(domain, None)
+        self._version += 1
+        self._domain_version[domain] = self._version
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
-        del self._domain_index[entry.domain][entry.entity_id]
+        domain = entry.domain
+        del self._domain_index[domain][entry.entity_id]
+        self._domain_json.pop(domain, None)
+        self._domain_compressed_json.pop(domain, None)
+        self._version += 1
+        self._domain_version[domain] = self._version
         super().__delitem__(key)
 
+    def as_dict_json(self) -> str:
+        """Return a JSON array of all states grouped by domain.
+
+        Only domains that changed since the last call are serialized again.
+
+        Raises ValueError or TypeError if a state cannot be serialized.
+        """
+        domain_json = self._domain_json
+        fragments: list[str] = []
+        for domain, domain_states in self._domain_index.items():
+            if not domain_states:
+                continue
+            if (fragment := domain_json.get(domain)) is None:
+                fragment = domain_json[domain] = ",".join(
+                    state.as_dict_json for state in domain_states.values()
+                )
+            fragments.append(fragment)
+        return f'[{",".join(fragments)}]'
+
+    def as_compressed_state_json(self) -> str:
+        """Return a JSON object of all compressed states keyed by entity_id.
+
+        Only domains that changed since the last call are serialized again.
+
+        Raises ValueError or TypeError if a state cannot be serialized.
+        """
+        domain_compressed_json = self._domain_compressed_json
+        fragments: list[str] = []
+        for domain, domain_states in self._domain_index.items():
+            if not domain_states:
+                continue
+            if (fragment := domain_compressed_json.get(domain)) is None:
+                fragment = domain_compressed_json[domain] = ",".join(
+                    state.as_compressed_state_json for state in domain_states.values()
+                )
+            fragments.append(fragment)
+        return f'{{{",".join(fragments)}}}'
+
+    def version(self, domain: str | None = None) -> int:
+        """Return the version of the last change of all states or a domain."""
+        if domain is None:
+            return self._version
+        return self._domain_version.get(domain, 0)
+
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
         # Avoid polluting _domain_index with non-existing domains
@@ -1648,7 +1910,14 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_batch",
+        "_bus",
+        "_loop",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -1657,6 +1926,8 @@ class StateMachine:
         # up read operations
         self._states_data = self._states.data
         self._reservations: set[str] = set()
+        # The changes collected by async_batch by entity_id
+        self._batch: dict[str, dict[str, Any]] | None = None
         self._bus = bus
         self._loop = loop
 
@@ -1729,6 +2000,43 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_all_json(self) -> str:
+        """Return a JSON array of all states.
+
+        The states are grouped by domain and the serialized states of
+        domains that did not change since the last call are reused.
+
+        Raises ValueError or TypeError if a state cannot be serialized.
+
+        This method must be run in the event loop.
+        """
+        return self._states.as_dict_json()
+
+    @callback
+    def async_all_compressed_json(self) -> str:
+        """Return a JSON object of all compressed states keyed by entity_id.
+
+        The serialized states of domains that did not change since the
+        last call are reused.
+
+        Raises ValueError or TypeError if a state cannot be serialized.
+
+        This method must be run in the event loop.
+        """
+        return self._states.as_compressed_state_json()
+
+    @callback
+    def async_version(self, domain: str | None = None) -> int:
+        """Return a version that increases whenever a state is set or removed.
+
+        If domain is passed, only changes of states in the domain
+        increase the returned version.
+
+        This method must be run in the event loop.
+        """
+        return self._states.version(domain)
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -1762,11 +2070,15 @@ class StateMachine:
         This method must be run in the event loop.
         """
         entity_id = entity_id.lower()
+        # A state set in a batch is discarded without ever being written
+        batched = (
+            self._batch is not None and self._batch.pop(entity_id, None) is not None
+        )
         old_state = self._states.pop(entity_id, None)
         self._reservations.discard(entity_id)
 
         if old_state is None:
-            return False
+            return batched
 
         old_state.expire()
         self._bus.async_fire(
@@ -1848,9 +2160,220 @@ class StateMachine:
         This method must be run in the event loop.
         """
         entity_id = entity_id.lower()
+        if (batch := self._batch) is not None:
+            self._async_set_batched(
+                batch,
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                state_info,
+                None,
+            )
+            return
+        old_state = self._states_data.get(entity_id)
+        if (
+            state := self._async_create_state(
+                entity_id,
+                old_state,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                state_info,
+                None,
+            )
+        ) is None:
+            return
+
+        if old_state is not None:
+            old_state.expire()
+        self._states[entity_id] = state
+        self._bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
+            EventOrigin.local,
+            state.context,
+            time_fired=state.last_updated,
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        states is an iterable of (entity_id, state, attributes) tuples. If
+        an entity_id appears more than once, the last one wins.
+
+        The batch is applied atomically: every new state is validated before
+        any of them are written, and all of them are written before the
+        first state_changed event fires. One state_changed event is still
+        fired per changed entity, and listeners registered with a
+        batch_listener are called once with all of them.
+
+        This method must be run in the event loop.
+        """
+        pending: dict[str, tuple[str, Mapping[str, Any] | None]] = {
+            entity_id.lower(): (new_state, attributes)
+            for entity_id, new_state, attributes in states
+        }
+        if not pending:
+            return
+
+        timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
+        if self._batch is not None:
+            # Validate all states before adding any of them to the batch
+            batch: dict[str, dict[str, Any]] = {}
+            for entity_id, (new_state, attributes) in pending.items():
+                self._async_set_batched(
+                    batch,
+                    entity_id,
+                    new_state,
+                    attributes,
+                    force_update,
+                    context,
+                    None,
+                    now,
+                )
+            self._batch.update(batch)
+            return
+
+        states_data = self._states_data
+        changes: list[dict[str, Any]] = []
+        for entity_id, (new_state, attributes) in pending.items():
+            old_state = states_data.get(entity_id)
+            if (
+                state := self._async_create_state(
+                    entity_id,
+                    old_state,
+                    new_state,
+                    attributes,
+                    force_update,
+                    context,
+                    None,
+                    now,
+                )
+            ) is not None:
+                changes.append(
+                    {"entity_id": entity_id, "old_state": old_state, "new_state": state}
+                )
+
+        self._async_write_changes(changes)
+
+    @contextmanager
+    def async_batch(self) -> Generator[None, None, None]:
+        """Write the states set inside the block with one batch.
+
+        The states set with async_set and async_set_many are validated
+        right away, but they are only written to the state machine when
+        the outermost block exits. Until then get returns the states from
+        before the block. The state_changed events are fired like with
+        async_set_many, so listeners registered with a batch_listener are
+        called once for the whole block.
+
+        The block must not await. This method must be run in the event loop.
+        """
+        if self._batch is not None:
+            yield
+            return
+        batch: dict[str, dict[str, Any]] = {}
+        self._batch = batch
+        try:
+            yield
+        finally:
+            self._batch = None
+            self._async_write_changes(list(batch.values()))
+
+    @callback
+    def _async_set_batched(
+        self,
+        batch: dict[str, dict[str, Any]],
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        state_info: StateInfo | None,
+        now: datetime.datetime | None,
+    ) -> None:
+        """Create the new state of an entity and add it to a batch.
+
+        The state is created from the state set earlier in the active
+        batch, if any.
+        """
+        if TYPE_CHECKING:
+            assert self._batch is not None
+        if (change := self._batch.get(entity_id)) is not None:
+            old_state = change["new_state"]
+        else:
+            old_state = self._states_data.get(entity_id)
+        if (
+            state := self._async_create_state(
+                entity_id,
+                old_state,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                state_info,
+                now,
+            )
+        ) is None:
+            return
+        batch[entity_id] = {
+            "entity_id": entity_id,
+            # The event has the state from before the batch as old_state
+            "old_state": old_state if change is None else change["old_state"],
+            "new_state": state,
+        }
+
+    @callback
+    def _async_write_changes(self, changes: list[dict[str, Any]]) -> None:
+        """Write the new states of a batch and fire their state_changed events."""
+        if not changes:
+            return
+
+        for change in changes:
+            if (old_state := change["old_state"]) is not None:
+                old_state.expire()
+            self._states[change["entity_id"]] = change["new_state"]
+
+        self._bus.async_fire_batch(
+            EVENT_STATE_CHANGED,
+            (
+                (change, change["new_state"].context, change["new_state"].last_updated)
+                for change in changes
+            ),
+        )
+
+    @callback
+    def _async_create_state(
+        self,
+        entity_id: str,
+        old_state: State | None,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        state_info: StateInfo | None,
+        now: datetime.datetime | None,
+    ) -> State | None:
+        """Create the new state of an entity.
+
+        Returns None if the state and attributes did not change.
+        """
         new_state = str(new_state)
         attributes = attributes or {}
-        if (old_state := self._states_data.get(entity_id)) is None:
+        if old_state is None:
             same_state = False
             same_attr = False
             last_changed = None
@@ -1860,9 +2383,9 @@ class StateMachine:
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
-            return
+            return None
 
-        if context is None:
+        if now is None and context is None:
             # It is much faster to convert a timestamp to a utc datetime object
             # than converting a utc datetime object to a timestamp since cpython
             # does not have a fast path for handling the UTC timezone and has to do
@@ -1877,7 +2400,7 @@ class StateMachine:
             timestamp = time.time()
             now = dt_util.utc_from_timestamp(timestamp)
             context = Context(id=ulid_at_time(timestamp))
-        else:
+        elif now is None:
             now = dt_util.utcnow()
 
         if same_attr:
@@ -1885,7 +2408,7 @@ class StateMachine:
                 assert old_state is not None
             attributes = old_state.attributes
 
-        state = State(
+        return State(
             entity_id,
             new_state,
             attributes,
@@ -1895,16 +2418,6 @@ class StateMachine:
             old_state is None,
             state_info,
         )
-        if old_state is not None:
-            old_state.expire()
-        self._states[entity_id] = state
-        self._bus.async_fire(
-            EVENT_STATE_CHANGED,
-            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
-            EventOrigin.local,
-            context,
-            time_fired=now,
-        )
 
 
 class SupportsResponse(enum.StrEnum):
@@ -1,7 +1,7 @@
 """Provide a way to connect entities belonging to one device."""
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Coroutine, ValuesView
 from enum import StrEnum
 from functools import partial
@@ -387,6 +387,27 @@ class DeviceRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 _EntryTypeT = TypeVar("_EntryTypeT", DeviceEntry, DeletedDeviceEntry)
 
 
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+def remove_from_index(
+    index: RegistryIndexType,
+    index_key: str | None,
+    key: str,
+    new_index_key: str | None = None,
+) -> None:
+    """Remove a key from an index unless it stays under the same index key.
+
+    Keeping the key keeps the order of the lookups.
+    """
+    if index_key is None or index_key == new_index_key:
+        return
+    keys = index[index_key]
+    del keys[key]
+    if not keys:
+        del index[index_key]
+
+
 class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
     """Container for device registry items, maps device id -> entry.
 
@@ -409,25 +430,30 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         """Add an item."""
         data = self.data
         if key in data:
-            old_entry = data[key]
-            for connection in old_entry.connections:
-                del self._connections[connection]
-            for identifier in old_entry.identifiers:
-                del self._identifiers[identifier]
+            self._unindex_entry(key, data[key], entry)
         data[key] = entry
+        self._index_entry(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._unindex_entry(key, self[key])
+        super().__delitem__(key)
+
+    def _index_entry(self, key: str, entry: _EntryTypeT) -> None:
+        """Add an entry to the indexes."""
         for connection in entry.connections:
             self._connections[connection] = entry
         for identifier in entry.identifiers:
             self._identifiers[identifier] = entry
 
-    def __delitem__(self, key: str) -> None:
-        """Remove an item."""
-        entry = self[key]
+    def _unindex_entry(
+        self, key: str, entry: _EntryTypeT, replacement_entry: _EntryTypeT | None = None
+    ) -> None:
+        """Remove an entry, which may be replaced by another one, from the indexes."""
         for connection in entry.connections:
             del self._connections[connection]
         for identifier in entry.identifiers:
             del self._identifiers[identifier]
-        super().__delitem__(key)
 
     def get_entry(
         self,
@@ -447,10 +473,61 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry items.
+
+    Maintains two additional indexes:
+    - area_id -> device ids
+    - config_entry_id -> device ids
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: RegistryIndexType = defaultdict(dict)
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
+
+    def _index_entry(self, key: str, entry: DeviceEntry) -> None:
+        """Add an entry to the indexes."""
+        super()._index_entry(key, entry)
+        if (area_id := entry.area_id) is not None:
+            self._area_id_index[area_id][key] = True
+        for config_entry_id in entry.config_entries:
+            self._config_entry_id_index[config_entry_id][key] = True
+
+    def _unindex_entry(
+        self, key: str, entry: DeviceEntry, replacement_entry: DeviceEntry | None = None
+    ) -> None:
+        """Remove an entry, which may be replaced by another one, from the indexes."""
+        super()._unindex_entry(key, entry, replacement_entry)
+        new_config_entries: set[str] = set()
+        new_area_id = None
+        if replacement_entry is not None:
+            new_config_entries = replacement_entry.config_entries
+            new_area_id = replacement_entry.area_id
+        remove_from_index(self._area_id_index, entry.area_id, key, new_area_id)
+        for config_entry_id in entry.config_entries - new_config_entries:
+            remove_from_index(self._config_entry_id_index, config_entry_id, key)
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
 
@@ -463,6 +540,7 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
 
     @callback
@@ -796,7 +874,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -954,7 +1032,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -962,11 +1040,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
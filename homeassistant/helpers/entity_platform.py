@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import partial
+import itertools
 from logging import Logger, getLogger
+import math
 from typing import TYPE_CHECKING, Any, Protocol
 
 import voluptuous as vol
@@ -43,6 +46,7 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later, async_track_time_interval
 from .issue_registry import IssueSeverity, async_create_issue
+from .singleton import singleton
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -58,6 +62,16 @@ PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 DATA_DOMAIN_ENTITIES = "domain_entities"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+DATA_POLLING_SCHEDULER = "entity_platform_polling_scheduler"
+
+# Upper bounds in seconds of the buckets of the poll latency histograms
+POLL_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf)
+# Polling slows down to at most this multiple of the scan interval
+# while the updates take longer than the interval
+MAX_POLL_BACKOFF = 8
+# Fraction of the golden ratio, which spreads the phases of any number
+# of platforms evenly over an interval
+_GOLDEN_RATIO_FRACTION = (math.sqrt(5) - 1) / 2
 
 _LOGGER = getLogger(__name__)
 
@@ -101,6 +115,89 @@ class EntityPlatformModule(Protocol):
         """Set up an integration platform from a config entry."""
 
 
+class PollingScheduler:
+    """Schedule the polling of all entity platforms.
+
+    Platforms that poll at the same interval are mostly set up together
+    at startup. Each one is given a different phase of the interval so
+    they do not all poll at the same moment.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        # The phases in use of each interval, a phase is given back when
+        # its platform stops polling
+        self._phases: dict[float, set[int]] = {}
+        self._latency: dict[str, list[int]] = {}
+
+    @callback
+    def async_schedule(
+        self,
+        action: Callable[[datetime], Coroutine[Any, Any, None]],
+        interval: timedelta,
+        name: str,
+    ) -> CALLBACK_TYPE:
+        """Call an action every interval, starting at the next free phase."""
+        interval_seconds = interval.total_seconds()
+        phases = self._phases.setdefault(interval_seconds, set())
+        slot = next(slot for slot in itertools.count() if slot not in phases)
+        phases.add(slot)
+        unsub: CALLBACK_TYPE
+
+        if not (phase := (slot * _GOLDEN_RATIO_FRACTION) % 1):
+            unsub = async_track_time_interval(self.hass, action, interval, name=name)
+        else:
+            job = HassJob(action, name)
+
+            @callback
+            def _async_start(now: datetime) -> None:
+                """Poll and keep polling every interval."""
+                nonlocal unsub
+                unsub = async_track_time_interval(
+                    self.hass, action, interval, name=name
+                )
+                self.hass.async_run_hass_job(job, now)
+
+            unsub = async_call_later(
+                self.hass, interval_seconds * (1 - phase), _async_start
+            )
+
+        @callback
+        def _async_unsub() -> None:
+            """Stop polling and give the phase back."""
+            unsub()
+            phases.discard(slot)
+
+        return _async_unsub
+
+    @callback
+    def async_record_latency(self, platform: EntityPlatform, seconds: float) -> None:
+        """Record how long a platform took to poll its entities."""
+        key = f"{platform.domain}.{platform.platform_name}"
+        if (histogram := self._latency.get(key)) is None:
+            histogram = self._latency[key] = [0] * len(POLL_LATENCY_BUCKETS)
+        histogram[bisect_left(POLL_LATENCY_BUCKETS, seconds)] += 1
+
+    @callback
+    def async_latency_histograms(self) -> dict[str, dict[float, int]]:
+        """Return the number of polls per latency bucket of each platform.
+
+        The buckets are keyed by their upper bound in seconds.
+        """
+        return {
+            key: dict(zip(POLL_LATENCY_BUCKETS, histogram))
+            for key, histogram in self._latency.items()
+        }
+
+
+@callback
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    return PollingScheduler(hass)
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -137,6 +234,9 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # The interval polling is scheduled at, which is longer than
+        # the scan interval while updates take longer than it
+        self._poll_interval = scan_interval
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -533,11 +633,18 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
+        self._async_schedule_polling(self.scan_interval)
+
+    @callback
+    def _async_schedule_polling(self, interval: timedelta) -> None:
+        """Schedule polling the entities every interval."""
+        self._poll_interval = interval
+        self._async_unsub_polling = async_get_polling_scheduler(
+            self.hass
+        ).async_schedule(
             self._update_entity_states,
-            self.scan_interval,
-            name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
+            interval,
+            f"EntityPlatform poll {self.domain}.{self.platform_name}",
         )
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
@@ -862,32 +969,63 @@ class EntityPlatform:
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
+            self._async_poll_overrun()
             return
 
         async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+            start = self.hass.loop.time()
+            await self._async_poll_entities()
+            seconds = self.hass.loop.time() - start
 
-            if tasks := [
-                entity.async_update_ha_state(True)
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+        async_get_polling_scheduler(self.hass).async_record_latency(self, seconds)
+        # Go back to the scan interval once the updates are fast enough
+        if (
+            self._poll_interval != self.scan_interval
+            and self._async_unsub_polling is not None
+            and seconds < self.scan_interval.total_seconds()
+        ):
+            self.async_unsub_polling()
+            self._async_schedule_polling(self.scan_interval)
+
+    async def _async_poll_entities(self) -> None:
+        """Update the states of all the polling entities."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
+
+        if tasks := [
+            entity.async_update_ha_state(True)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
+
+    @callback
+    def _async_poll_overrun(self) -> None:
+        """Slow down polling when the previous poll has not finished yet."""
+        poll_interval = min(
+            self._poll_interval * 2, self.scan_interval * MAX_POLL_BACKOFF
+        )
+        self.logger.warning(
+            (
+                "Updating %s %s took longer than the scheduled update interval %s,"
+                " polling every %s until the updates are faster"
+            ),
+            self.platform_name,
+            self.domain,
+            self._poll_interval,
+            poll_interval,
+        )
+        if poll_interval != self._poll_interval and self._async_unsub_polling:
+            self.async_unsub_polling()
+            self._async_schedule_polling(poll_interval)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
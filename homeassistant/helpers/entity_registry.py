@@ -9,7 +9,7 @@ timer.
 """
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Callable, Iterable, Mapping, ValuesView
 from datetime import datetime, timedelta
 from enum import StrEnum
@@ -300,6 +300,12 @@ class RegistryEntry:
     @callback
     def write_unavailable_state(self, hass: HomeAssistant) -> None:
         """Write the unavailable state to the state machine."""
+        hass.states.async_set(
+            self.entity_id, STATE_UNAVAILABLE, self.unavailable_state_attributes()
+        )
+
+    def unavailable_state_attributes(self) -> dict[str, Any]:
+        """Return the attributes of the unavailable state."""
         attrs: dict[str, Any] = {ATTR_RESTORED: True}
 
         if self.capabilities is not None:
@@ -323,7 +329,7 @@ class RegistryEntry:
         if self.unit_of_measurement is not None:
             attrs[ATTR_UNIT_OF_MEASUREMENT] = self.unit_of_measurement
 
-        hass.states.async_set(self.entity_id, STATE_UNAVAILABLE, attrs)
+        return attrs
 
 
 @attr.s(slots=True, frozen=True)
@@ -436,9 +442,12 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains five additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - device_id -> entity_ids
+    - area_id -> entity_ids
+    - config_entry_id -> entity_ids
     """
 
     def __init__(self) -> None:
@@ -446,6 +455,9 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dr.RegistryIndexType = defaultdict(dict)
+        self._area_id_index: dr.RegistryIndexType = defaultdict(dict)
+        self._config_entry_id_index: dr.RegistryIndexType = defaultdict(dict)
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -455,19 +467,48 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         """Add an item."""
         data = self.data
         if key in data:
-            old_entry = data[key]
-            del self._entry_ids[old_entry.id]
-            del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            self._unindex_entry(key, data[key], entry)
         data[key] = entry
-        self._entry_ids[entry.id] = entry
-        self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._index_entry(key, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
-        entry = self[key]
+        self._unindex_entry(key, self[key])
+        super().__delitem__(key)
+
+    def _index_entry(self, key: str, entry: RegistryEntry) -> None:
+        """Add an entry to the indexes."""
+        self._entry_ids[entry.id] = entry
+        self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        if (device_id := entry.device_id) is not None:
+            self._device_id_index[device_id][key] = True
+        if (area_id := entry.area_id) is not None:
+            self._area_id_index[area_id][key] = True
+        if (config_entry_id := entry.config_entry_id) is not None:
+            self._config_entry_id_index[config_entry_id][key] = True
+
+    def _unindex_entry(
+        self,
+        key: str,
+        entry: RegistryEntry,
+        replacement_entry: RegistryEntry | None = None,
+    ) -> None:
+        """Remove an entry, which may be replaced by another one, from the indexes."""
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
-        super().__delitem__(key)
+        new_device_id = new_area_id = new_config_entry_id = None
+        if replacement_entry is not None:
+            new_device_id = replacement_entry.device_id
+            new_area_id = replacement_entry.area_id
+            new_config_entry_id = replacement_entry.config_entry_id
+        dr.remove_from_index(self._device_id_index, entry.device_id, key, new_device_id)
+        dr.remove_from_index(self._area_id_index, entry.area_id, key, new_area_id)
+        dr.remove_from_index(
+            self._config_entry_id_index,
+            entry.config_entry_id,
+            key,
+            new_config_entry_id,
+        )
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
@@ -477,6 +518,25 @@ class EntityRegistryItems(UserDict[str, RegistryEntry]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(self, device_id: str) -> list[RegistryEntry]:
+        """Get entries for device."""
+        data = self.data
+        return [data[key] for key in self._device_id_index.get(device_id, ())]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -494,6 +554,7 @@ class EntityRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -1217,9 +1278,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.entities.get_entries_for_device_id(device_id)
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -1228,7 +1288,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -1236,11 +1296,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -1330,11 +1386,16 @@ def _async_setup_entity_restore(hass: HomeAssistant, registry: EntityRegistry) -
         """Make sure state machine contains entry for each registered entity."""
         existing = set(hass.states.async_entity_ids())
 
-        for entry in registry.entities.values():
-            if entry.entity_id in existing or entry.disabled:
-                continue
-
-            entry.write_unavailable_state(hass)
+        # Write the states of all entities in one batch
+        hass.states.async_set_many(
+            (
+                entry.entity_id,
+                STATE_UNAVAILABLE,
+                entry.unavailable_state_attributes(),
+            )
+            for entry in registry.entities.values()
+            if entry.entity_id not in existing and not entry.disabled
+        )
 
     hass.bus.async_listen(EVENT_HOMEASSISTANT_START, _write_unavailable_states)
 
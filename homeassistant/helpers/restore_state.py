@@ -17,7 +17,7 @@ from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
 from .json import JSONEncoder
-from .storage import Store
+from .storage import JournalRecord, Store
 
 DATA_RESTORE_STATE = "restore_state"
 
@@ -29,7 +29,14 @@ STORAGE_VERSION = 1
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
-# How long should a saved state be preserved if the entity no longer exists
+# How long between saving all current states to refresh when they were last
+# seen, states that did not change are only saved again after this long so
+# the saved last_seen can be up to this much older than when it was last seen
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
+# How long should a saved state be preserved if the entity no longer exists,
+# saved states are kept up to STATE_COMPACT_INTERVAL longer since their
+# last_seen is only refreshed that often
 STATE_EXPIRATION = timedelta(days=7)
 
 
@@ -73,6 +80,7 @@ class StoredState:
     def as_dict(self) -> dict[str, Any]:
         """Return a dict representation of the stored state to be JSON serialized."""
         result = {
+            "id": self.state.entity_id,
             "state": self.state.json_fragment,
             "extra_data": self.extra_data.as_dict() if self.extra_data else None,
             "last_seen": self.last_seen,
@@ -134,10 +142,14 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The stored states saved by the last dump and their dict
+        # representation, by entity_id
+        self._dumped: dict[str, tuple[StoredState, JournalRecord]] = {}
+        self._last_compact: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -175,6 +187,9 @@ class RestoreStateData:
         This includes the states of all registered entities, as well as the
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
+
+        The states of entities whose state and extra data did not change
+        since the last dump are returned as they were dumped.
         """
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
@@ -186,16 +201,22 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                current_states_by_entity_id[entity_id],
-                entity.extra_restore_state_data,
-                now,
-            )
-            for entity_id, entity in self.entities.items()
-            if entity_id in current_states_by_entity_id
-        ]
-        expiration_time = now - STATE_EXPIRATION
+        stored_states: list[StoredState] = []
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            extra_data = entity.extra_restore_state_data
+            # A new state object is created every time the state changes
+            if (
+                (dumped := self._dumped.get(entity_id))
+                and dumped[0].state is state
+                and _extra_data_unchanged(dumped[1]["extra_data"], extra_data)
+            ):
+                stored_states.append(dumped[0])
+            else:
+                stored_states.append(StoredState(state, extra_data, now))
+        # The saved last_seen of states that did not change can lag behind
+        expiration_time = now - STATE_EXPIRATION - STATE_COMPACT_INTERVAL
 
         for entity_id, stored_state in self.last_states.items():
             # Don't save old states that have entities in the current run
@@ -215,12 +236,34 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        if (
+            self._last_compact is None
+            or now - self._last_compact >= STATE_COMPACT_INTERVAL
+        ):
+            # Dump all states again to refresh when they were last seen
+            self._dumped = {}
+            self._last_compact = now
+        dumped = self._dumped
+        stored_states = {
+            stored_state.state.entity_id: stored_state
+            for stored_state in self.async_get_stored_states()
+        }
+        # Keep the order of the last dump so the store
+        # only has to save the states that changed
+        entity_ids = [
+            *(entity_id for entity_id in dumped if entity_id in stored_states),
+            *(entity_id for entity_id in stored_states if entity_id not in dumped),
+        ]
+        self._dumped = {}
+        for entity_id in entity_ids:
+            stored_state = stored_states[entity_id]
+            if (last := dumped.get(entity_id)) is None or last[0] is not stored_state:
+                last = (stored_state, JournalRecord(stored_state.as_dict()))
+            self._dumped[entity_id] = last
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [as_dict for _, as_dict in self._dumped.values()]
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
@@ -280,6 +323,19 @@ class RestoreStateData:
         self.entities.pop(entity_id)
 
 
+def _extra_data_unchanged(
+    dumped_extra_data: dict[str, Any] | None, extra_data: ExtraStoredData | None
+) -> bool:
+    """Return if the extra data is the same as the dumped extra data."""
+    if extra_data is None:
+        return dumped_extra_data is None
+    extra_data_dict = extra_data.as_dict()
+    # The same dict may have been changed in place since it was dumped
+    return extra_data_dict is not dumped_extra_data and (
+        extra_data_dict == dumped_extra_data
+    )
+
+
 class RestoreEntity(Entity):
     """Mixin class for restoring previous entity state."""
 
@@ -5,12 +5,14 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from functools import partial
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeVar, cast
 
+from homeassistant.backports.functools import cached_property
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -22,7 +24,7 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
-from homeassistant.util import json as json_util
+from homeassistant.util import json as json_util, ulid as ulid_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 
@@ -35,6 +37,12 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_PRELOAD = "storage_preload"
+
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into a new snapshot once it grows past
+# this fraction of the size of the snapshot
+JOURNAL_COMPACT_RATIO = 0.5
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -79,6 +87,58 @@ async def async_migrator(
     return config
 
 
+@callback
+def async_preload(hass: HomeAssistant, key: str) -> None:
+    """Start reading a storage file before its store loads it.
+
+    The file is read and parsed in the executor in the background and
+    handed to the first store that loads the key instead of reading the
+    file again. A store that writes or removes the key first drops it.
+    """
+    preload: dict[str, asyncio.Future[tuple[Any, bytes | None] | None]]
+    preload = hass.data.setdefault(STORAGE_PRELOAD, {})
+    if key not in preload:
+        preload[key] = hass.async_add_executor_job(
+            _preload_file, hass.config.path(STORAGE_DIR, key)
+        )
+
+
+@callback
+def async_clear_preload(hass: HomeAssistant) -> None:
+    """Drop the preloaded data no store has asked for."""
+    hass.data.pop(STORAGE_PRELOAD, None)
+
+
+def _preload_file(path: str) -> tuple[Any, bytes | None] | None:
+    """Read and parse a storage file and read its journal."""
+    try:
+        with open(path, "rb") as storage_file:
+            data = json_util.json_loads(storage_file.read())
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", "rb") as journal_file:
+                journal: bytes | None = journal_file.read()
+        except FileNotFoundError:
+            journal = None
+    except (OSError, ValueError) as err:
+        # The store will read the file again and handle the error
+        _LOGGER.debug("Could not preload %s: %s", path, err)
+        return None
+    return data, journal
+
+
+class JournalRecord(dict[str, Any]):
+    """A record with an "id" in a journaled store that is only encoded once.
+
+    Saving the same record object again reuses the encoded record, so the
+    record must not be changed once it has been saved.
+    """
+
+    @cached_property
+    def json_bytes(self) -> bytes:
+        """Return the encoded record."""
+        return json_helper.json_bytes(self)
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -94,8 +154,14 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal enabled, changes to data that is a list of records
+        with an "id", or a dict of such lists, are appended to a journal
+        next to the file instead of rewriting the whole file every time.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,12 +175,24 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        # The journal is encoded like the default encoder would
+        self._journal = journal and encoder in (None, json_helper.JSONEncoder)
+        # Identifies the snapshot the entries in the journal apply to
+        self._journal_id: str | None = None
+        # The encoded records and other values the journal applies to,
+        # None until a snapshot has been written
+        self._journal_state: _JournalState | None = None
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -156,10 +234,23 @@ class Store(Generic[_T]):
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
+        elif (preload := self._async_pop_preload()) is not None and (
+            preloaded := await preload
+        ) is not None:
+            data, journal = preloaded
+            if self._journal:
+                if journal is None:
+                    data = self._replay_journal(data, None)
+                else:
+                    data = await self.hass.async_add_executor_job(
+                        self._replay_journal, data, journal
+                    )
         else:
             try:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    self._load_journaled_data
+                    if self._journal
+                    else partial(json_util.load_json, self.path)
                 )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
@@ -348,6 +439,8 @@ class Store(Generic[_T]):
             if self._read_only:
                 return
 
+            # The preloaded data is outdated once the file is written
+            self._async_pop_preload()
             try:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
@@ -360,6 +453,13 @@ class Store(Generic[_T]):
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if self._journal:
+            if self._write_journal(path, data):
+                return
+            self._journal_state = None
+            journal_id = ulid_util.ulid()
+            data = {**data, "journal_id": journal_id}
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -369,6 +469,104 @@ class Store(Generic[_T]):
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal:
+            # The changes in the journal are part of the snapshot now
+            with suppress(FileNotFoundError):
+                os.unlink(f"{path}{JOURNAL_SUFFIX}")
+            self._journal_id = journal_id
+            self._journal_state = _JournalState.from_data(data)
+
+    def _write_journal(self, path: str, data: dict) -> bool:
+        """Append the changes since the last write to the journal.
+
+        Returns False if a new snapshot has to be written instead.
+        """
+        if (old_state := self._journal_state) is None or (
+            new_state := _JournalState.from_data(data)
+        ) is None:
+            return False
+        if (entry := old_state.changes_to(new_state)) is None:
+            return False
+        if not entry:
+            return True
+        line = json_helper.json_bytes({"journal_id": self._journal_id, **entry})
+        journal_size = old_state.journal_size + len(line) + 1
+        if journal_size > old_state.snapshot_size * JOURNAL_COMPACT_RATIO:
+            return False
+
+        _LOGGER.debug("Writing journal for %s to %s", self.key, path)
+        journal_path = f"{path}{JOURNAL_SUFFIX}"
+        try:
+            fd = os.open(
+                journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            with open(fd, "ab") as journal_file:
+                journal_file.write(line + b"\n")
+                journal_file.flush()
+                if self._atomic_writes:
+                    os.fsync(journal_file.fileno())
+        except OSError as err:
+            # Start over with a snapshot as the entry may be incomplete
+            self._journal_state = None
+            _LOGGER.exception("Saving journal failed: %s", journal_path)
+            raise WriteError(err) from err
+        new_state.snapshot_size = old_state.snapshot_size
+        new_state.journal_size = journal_size
+        self._journal_state = new_state
+        return True
+
+    @callback
+    def _async_pop_preload(
+        self,
+    ) -> asyncio.Future[tuple[Any, bytes | None] | None] | None:
+        """Return the read of the preloaded data and journal and remove it."""
+        if (preload := self.hass.data.get(STORAGE_PRELOAD)) is None:
+            return None
+        return cast(
+            asyncio.Future[tuple[Any, bytes | None] | None] | None,
+            preload.pop(self.key, None),
+        )
+
+    def _load_journaled_data(self) -> Any:
+        """Load the snapshot and replay the journal on top of it."""
+        data = json_util.load_json(self.path)
+        try:
+            with open(self.journal_path, "rb") as journal_file:
+                journal = journal_file.read()
+        except FileNotFoundError:
+            journal = None
+        return self._replay_journal(data, journal)
+
+    def _replay_journal(self, data: Any, journal: bytes | None) -> Any:
+        """Replay the journal on top of the snapshot."""
+        if not isinstance(data, dict) or "data" not in data:
+            return data
+        journal_id = data.pop("journal_id", None)
+        if journal is None:
+            return data
+        stored = data["data"]
+        if is_list := isinstance(stored, list):
+            stored = {_RECORD_LIST_KEY: stored}
+        lines = journal.split(b"\n")
+        # The last line is empty unless the last write was interrupted
+        if lines[-1]:
+            _LOGGER.warning("Ignoring incomplete write in %s", self.journal_path)
+        for line in lines[:-1]:
+            try:
+                entry = json_util.json_loads_object(line)
+                # Left behind when writing the last snapshot was interrupted
+                if entry.get("journal_id") != journal_id:
+                    continue
+                _apply_journal_entry(stored, entry)
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.warning("Ignoring invalid write in %s", self.journal_path)
+                break
+        if is_list:
+            data["data"] = stored[_RECORD_LIST_KEY]
+        return data
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -377,6 +575,134 @@ class Store(Generic[_T]):
         """Remove all data."""
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        self._async_pop_preload()
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            self._journal_state = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+# The key data that is a list of records is journaled under
+_RECORD_LIST_KEY = ""
+
+
+def _is_record_list(value: Any) -> bool:
+    """Return if a value is a list of records with an id."""
+    return isinstance(value, list) and all(
+        isinstance(record, dict) and isinstance(record.get("id"), str)
+        for record in value
+    )
+
+
+class _JournalState:
+    """The encoded data a journal of a store applies to."""
+
+    __slots__ = ("version", "records", "values", "snapshot_size", "journal_size")
+
+    def __init__(
+        self,
+        version: tuple[Any, Any],
+        records: dict[str, dict[str, bytes]],
+        values: dict[str, bytes],
+    ) -> None:
+        """Initialize the journal state."""
+        self.version = version
+        self.records = records
+        self.values = values
+        self.snapshot_size = sum(map(len, values.values())) + sum(
+            len(record) for key in records.values() for record in key.values()
+        )
+        self.journal_size = 0
+
+    @classmethod
+    def from_data(cls, data: dict) -> _JournalState | None:
+        """Encode the data of a store, None if it can not be journaled."""
+        if isinstance(stored := data["data"], list):
+            if not _is_record_list(stored):
+                return None
+            stored = {_RECORD_LIST_KEY: stored}
+        elif not isinstance(stored, dict):
+            return None
+        records: dict[str, dict[str, bytes]] = {}
+        values: dict[str, bytes] = {}
+        for key, value in stored.items():
+            if not _is_record_list(value):
+                values[key] = json_helper.json_bytes(value)
+                continue
+            records[key] = {
+                record["id"]: record.json_bytes
+                if isinstance(record, JournalRecord)
+                else json_helper.json_bytes(record)
+                for record in value
+            }
+            # Records with the same id can not be journaled
+            if len(records[key]) != len(value):
+                return None
+        return cls((data["version"], data["minor_version"]), records, values)
+
+    def changes_to(self, new: _JournalState) -> dict[str, Any] | None:
+        """Return the journal entry to get to a new state.
+
+        Returns None if the changes can not be journaled.
+        """
+        if (
+            new.version != self.version
+            or new.records.keys() != self.records.keys()
+            or new.values.keys() != self.values.keys()
+        ):
+            return None
+        entry: dict[str, Any] = {}
+        upsert: dict[str, list[json_helper.json_fragment]] = {}
+        remove: dict[str, list[str]] = {}
+        for key, new_records in new.records.items():
+            old_records = self.records[key]
+            # Replaying keeps the order of existing records and appends
+            # new records, which is how the records are ordered in the
+            # registries
+            if list(new_records) != [
+                *(record_id for record_id in old_records if record_id in new_records),
+                *(
+                    record_id
+                    for record_id in new_records
+                    if record_id not in old_records
+                ),
+            ]:
+                return None
+            if changed := [
+                json_helper.json_fragment(record)
+                for record_id, record in new_records.items()
+                if old_records.get(record_id) != record
+            ]:
+                upsert[key] = changed
+            if removed := [
+                record_id for record_id in old_records if record_id not in new_records
+            ]:
+                remove[key] = removed
+        if values := {
+            key: json_helper.json_fragment(value)
+            for key, value in new.values.items()
+            if self.values[key] != value
+        }:
+            entry["set"] = values
+        if upsert:
+            entry["upsert"] = upsert
+        if remove:
+            entry["remove"] = remove
+        return entry
+
+
+def _apply_journal_entry(stored: dict[str, Any], entry: dict[str, Any]) -> None:
+    """Apply a journal entry to the data of a store."""
+    stored.update(entry.get("set", {}))
+    remove: dict[str, list[str]] = entry.get("remove", {})
+    upsert: dict[str, list[dict[str, Any]]] = entry.get("upsert", {})
+    for key in remove.keys() | upsert.keys():
+        records = {record["id"]: record for record in stored[key]}
+        for record_id in remove.get(key, ()):
+            records.pop(record_id, None)
+        for record in upsert.get(key, ()):
+            records[record["id"]] = record
+        stored[key] = list(records.values())
@@ -13,6 +13,7 @@ from functools import cache, lru_cache, partial, wraps
 import json
 import logging
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -25,6 +26,7 @@ from typing import (
     Any,
     Concatenate,
     Literal,
+    NamedTuple,
     NoReturn,
     ParamSpec,
     TypeVar,
@@ -37,9 +39,10 @@ import weakref
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.meta import find_referenced_templates, find_undeclared_variables
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
-from jinja2.utils import Namespace
+from jinja2.utils import Namespace, generate_lorem_ipsum
 from lru import LRU
 import orjson
 import voluptuous as vol
@@ -92,6 +95,7 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_SHARED_RENDER_CACHE = "template.shared_render_cache"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -123,6 +127,32 @@ DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
 _render_info: ContextVar[RenderInfo | None] = ContextVar("_render_info", default=None)
 
 
+class RenderCacheInfo(NamedTuple):
+    """Statistics of the template render cache."""
+
+    hits: int
+    misses: int
+
+
+class _RenderCacheStats:
+    """Counters of the template render cache."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.hits = 0
+        self.misses = 0
+
+
+_RENDER_CACHE_STATS = _RenderCacheStats()
+
+
+def render_cache_info() -> RenderCacheInfo:
+    """Return the hits and misses of the template render cache."""
+    return RenderCacheInfo(_RENDER_CACHE_STATS.hits, _RENDER_CACHE_STATS.misses)
+
+
 template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "template_cv", default=None
 )
@@ -144,6 +174,9 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+# The number of distinct templates whose last render is shared
+# between all Template objects with the same source
+SHARED_RENDER_CACHE_SIZE = 1024
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
@@ -340,6 +373,7 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "cacheable",
     )
 
     def __init__(self, template: Template) -> None:
@@ -358,6 +392,9 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # Cleared when the template uses something that is not
+        # tracked, such as the registries or random values.
+        self.cacheable = True
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -443,6 +480,119 @@ class RenderInfo:
             self.filter = _false
 
 
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def _referenced_variable_names(
+    env: TemplateEnvironment, source: str
+) -> frozenset[str] | None:
+    """Return the names of the variables a template can reference.
+
+    Returns None if the template includes or imports other templates
+    since those can reference any variable.
+    """
+    try:
+        ast = env.parse(source)
+        if next(iter(find_referenced_templates(ast)), None) is not None:
+            return None
+        return frozenset(find_undeclared_variables(ast))
+    except jinja2.TemplateError:
+        return None
+
+
+def _render_cache_variables(
+    env: TemplateEnvironment, source: str, variables: TemplateVarsType
+) -> dict[str, Any] | None:
+    """Return the variables a render of the template can depend on."""
+    if not variables:
+        return None
+    if (names := _referenced_variable_names(env, source)) is None:
+        return dict(variables)
+    return {name: value for name, value in variables.items() if name in names} or None
+
+
+@singleton(_SHARED_RENDER_CACHE)
+def _get_shared_render_cache(hass: HomeAssistant) -> LRU[str, _RenderCacheEntry]:
+    """Return the last render of each template source."""
+    return LRU(SHARED_RENDER_CACHE_SIZE)
+
+
+class _RenderCacheEntry:
+    """The result of a render with the versions of its dependencies.
+
+    The result can be reused as long as the template is rendered
+    with the same variables and none of the states it depends on
+    have changed. Entries are shared between templates with the
+    same source so identical templates of different entities or
+    automations are only rendered once per change.
+    """
+
+    __slots__ = (
+        "render_info",
+        "variables",
+        "strict",
+        "kwargs",
+        "loader_reload",
+        "entity_states",
+        "domain_versions",
+        "all_states_version",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        render_info: RenderInfo,
+        variables: dict[str, Any] | None,
+        strict: bool,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Capture the versions of the dependencies of a render."""
+        states = hass.states
+        self.render_info = render_info
+        self.variables = variables
+        self.strict = strict
+        self.kwargs = kwargs
+        self.loader_reload = _get_hass_loader(hass).reload_count
+        self.entity_states = tuple(
+            (entity_id, states.get(entity_id)) for entity_id in render_info.entities
+        )
+        self.domain_versions = tuple(
+            (domain, states.async_version(domain))
+            for domain in render_info.domains | render_info.domains_lifecycle
+        )
+        self.all_states_version = (
+            states.async_version()
+            if render_info.all_states or render_info.all_states_lifecycle
+            else None
+        )
+
+    def is_valid(
+        self,
+        hass: HomeAssistant,
+        variables: dict[str, Any] | None,
+        strict: bool,
+        kwargs: dict[str, Any],
+    ) -> bool:
+        """Return if the cached result is still the result of the render."""
+        states = hass.states
+        return (
+            strict == self.strict
+            and variables == self.variables
+            and kwargs == self.kwargs
+            and _get_hass_loader(hass).reload_count == self.loader_reload
+            and (
+                self.all_states_version is None
+                or states.async_version() == self.all_states_version
+            )
+            and all(
+                states.async_version(domain) == version
+                for domain, version in self.domain_versions
+            )
+            and all(
+                states.get(entity_id) is state
+                for entity_id, state in self.entity_states
+            )
+        )
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -459,6 +609,8 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_render_cache",
+        "_native",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -477,6 +629,8 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._render_cache: _RenderCacheEntry | None = None
+        self._native: _NativeTemplate | None = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -564,7 +718,10 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (native := self._native) is not None and native.names.isdisjoint(kwargs):
+                render_result = _render_native_with_context(self.template, native)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -676,7 +833,12 @@ class Template:
         log_fn: Callable[[int, str], None] | None = None,
         **kwargs: Any,
     ) -> RenderInfo:
-        """Render the template and collect an entity filter."""
+        """Render the template and collect an entity filter.
+
+        The result is reused without rendering again when the
+        states the template depends on did not change since the
+        last render with the same variables.
+        """
         self._renders += 1
         assert self.hass and _render_info.get() is None
 
@@ -688,6 +850,17 @@ class Template:
             render_info._freeze_static()
             return render_info
 
+        cache_variables = _render_cache_variables(self._env, self.template, variables)
+        if (
+            cache_entry := self._valid_render_cache_entry(
+                cache_variables, strict, kwargs
+            )
+        ) is not None:
+            _RENDER_CACHE_STATS.hits += 1
+            self._render_cache = cache_entry
+            return cache_entry.render_info
+        _RENDER_CACHE_STATS.misses += 1
+
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(
@@ -699,8 +872,42 @@ class Template:
             _render_info.reset(token)
 
         render_info._freeze()
+        if (
+            render_info.cacheable
+            and not render_info.has_time
+            and render_info.exception is None
+        ):
+            cache_entry = _RenderCacheEntry(
+                self.hass, render_info, cache_variables, strict, kwargs
+            )
+            self._render_cache = cache_entry
+            _get_shared_render_cache(self.hass)[self.template] = cache_entry
+        else:
+            self._render_cache = None
         return render_info
 
+    def _valid_render_cache_entry(
+        self,
+        cache_variables: dict[str, Any] | None,
+        strict: bool,
+        kwargs: dict[str, Any],
+    ) -> _RenderCacheEntry | None:
+        """Return the last render of this or an identical template if still valid."""
+        assert self.hass
+        own_entry = self._render_cache
+        if own_entry is not None and own_entry.is_valid(
+            self.hass, cache_variables, strict, kwargs
+        ):
+            return own_entry
+        shared_entry = _get_shared_render_cache(self.hass).get(self.template)
+        if (
+            shared_entry is not None
+            and shared_entry is not own_entry
+            and shared_entry.is_valid(self.hass, cache_variables, strict, kwargs)
+        ):
+            return shared_entry
+        return None
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -784,6 +991,8 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if not limited:
+            self._native = _compile_native(self.hass, env, self.template)
 
         return self._compiled
 
@@ -1094,20 +1303,19 @@ def _state_generator(
     hass: HomeAssistant, domain: str | None
 ) -> Generator[TemplateState, None, None]:
     """State generator for a domain or all states."""
-    states = hass.states
-    # If domain is None, we want to iterate over all states, but making
-    # a copy of the dict is expensive. So we iterate over the protected
-    # _states dict instead. This is safe because we're not modifying it
-    # and everything is happening in the same thread (MainThread).
+    states = hass.states._states  # pylint: disable=protected-access
+    # Making a copy of the states is expensive. So we iterate over the
+    # protected _states container instead. This is safe because we're not
+    # modifying it and everything is happening in the same thread (MainThread).
     #
     # We do not want to expose this method in the public API though to
     # ensure it does not get misused.
     #
     container: Iterable[State]
     if domain is None:
-        container = states._states.values()  # pylint: disable=protected-access
+        container = states.values()
     else:
-        container = states.async_all(domain)
+        container = states.domain_states(domain)
     for state in container:
         yield _template_state_no_collect(hass, state)
 
@@ -2202,6 +2410,19 @@ def to_json(
     ).decode("utf-8")
 
 
+def _uncacheable(func: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Wrap a function whose result is not tracked by the render info."""
+
+    @wraps(func)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        if (render_info := _render_info.get()) is not None:
+            render_info.cacheable = False
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@_uncacheable
 @pass_context
 def random_every_time(context, values):
     """Choose a random value.
@@ -2309,6 +2530,204 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+class _NotNative(Exception):
+    """Raised when a template node is not supported by the native renderer."""
+
+
+class _NativeTemplate:
+    """A template compiled to a Python closure instead of Jinja code.
+
+    names holds the global functions the template calls, the native
+    render is only used when no variable shadows one of them.
+    """
+
+    __slots__ = ("render", "names")
+
+    def __init__(self, render: Callable[[], str], names: frozenset[str]) -> None:
+        """Initialize the native template."""
+        self.render = render
+        self.names = names
+
+
+_NATIVE_BINARY_OPERATORS: dict[type[jinja2.nodes.Node], Callable[[Any, Any], Any]] = {
+    jinja2.nodes.Add: operator.add,
+    jinja2.nodes.Sub: operator.sub,
+    jinja2.nodes.Mul: operator.mul,
+    jinja2.nodes.Div: operator.truediv,
+    jinja2.nodes.FloorDiv: operator.floordiv,
+}
+_NATIVE_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+}
+_NATIVE_FILTERS: dict[str, Callable[..., Any]] = {
+    "float": forgiving_float_filter,
+    "int": forgiving_int_filter,
+    "round": forgiving_round,
+}
+_NATIVE_CONST_TYPES = (str, int, float, bool, type(None))
+
+
+class _NativeCompiler:
+    """Compile the expressions of a simple template to Python closures.
+
+    Only constants, state lookups, the float, int and round filters,
+    arithmetic, comparisons and boolean operators are supported. They
+    call the same functions as the Jinja code so the render info is
+    collected the same way. Other nodes raise _NotNative.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the compiler."""
+        self.functions: dict[str, Callable[..., Any]] = {
+            "states": AllStates(hass),
+            "is_state": partial(is_state, hass),
+            "is_state_attr": partial(is_state_attr, hass),
+            "state_attr": partial(state_attr, hass),
+            "has_value": partial(has_value, hass),
+        }
+        self.names: set[str] = set()
+
+    def compile(self, node: jinja2.nodes.Node) -> Callable[[], Any]:
+        """Compile an expression node."""
+        if isinstance(node, jinja2.nodes.Const):
+            if not isinstance(node.value, _NATIVE_CONST_TYPES):
+                raise _NotNative
+            value = node.value
+            return lambda: value
+        if isinstance(node, jinja2.nodes.Call):
+            return self._compile_function_call(node)
+        if isinstance(node, jinja2.nodes.Filter):
+            return self._compile_filter(node)
+        if (binary_op := _NATIVE_BINARY_OPERATORS.get(type(node))) is not None:
+            left = self.compile(node.left)  # type: ignore[attr-defined]
+            right = self.compile(node.right)  # type: ignore[attr-defined]
+            return lambda: binary_op(left(), right())
+        if isinstance(node, jinja2.nodes.Compare):
+            return self._compile_compare(node)
+        if isinstance(node, jinja2.nodes.And):
+            left = self.compile(node.left)
+            right = self.compile(node.right)
+            return lambda: left() and right()
+        if isinstance(node, jinja2.nodes.Or):
+            left = self.compile(node.left)
+            right = self.compile(node.right)
+            return lambda: left() or right()
+        if isinstance(node, jinja2.nodes.Not):
+            operand = self.compile(node.node)
+            return lambda: not operand()
+        if isinstance(node, jinja2.nodes.Neg):
+            operand = self.compile(node.node)
+            return lambda: -operand()
+        raise _NotNative
+
+    def _compile_function_call(self, node: jinja2.nodes.Call) -> Callable[[], Any]:
+        """Compile a call of one of the state functions."""
+        if (
+            not isinstance(node.node, jinja2.nodes.Name)
+            or (func := self.functions.get(node.node.name)) is None
+            or node.dyn_args is not None
+            or node.dyn_kwargs is not None
+        ):
+            raise _NotNative
+        self.names.add(node.node.name)
+        return self._compile_call(func, node.args, node.kwargs)
+
+    def _compile_filter(self, node: jinja2.nodes.Filter) -> Callable[[], Any]:
+        """Compile a filter applied to an expression."""
+        if (
+            node.node is None
+            or (func := _NATIVE_FILTERS.get(node.name)) is None
+            or node.dyn_args is not None
+            or node.dyn_kwargs is not None
+        ):
+            raise _NotNative
+        return self._compile_call(
+            func,
+            [node.node, *node.args],
+            cast(list[jinja2.nodes.Keyword], node.kwargs),
+        )
+
+    def _compile_call(
+        self,
+        func: Callable[..., Any],
+        args: list[jinja2.nodes.Expr],
+        kwargs: list[jinja2.nodes.Keyword],
+    ) -> Callable[[], Any]:
+        """Compile a call of a function with the compiled arguments."""
+        compiled_args = [self.compile(arg) for arg in args]
+        if not kwargs:
+            return lambda: func(*[arg() for arg in compiled_args])
+        compiled_kwargs = [(kwarg.key, self.compile(kwarg.value)) for kwarg in kwargs]
+        return lambda: func(
+            *[arg() for arg in compiled_args],
+            **{key: value() for key, value in compiled_kwargs},
+        )
+
+    def _compile_compare(self, node: jinja2.nodes.Compare) -> Callable[[], Any]:
+        """Compile a possibly chained comparison."""
+        first = self.compile(node.expr)
+        ops: list[tuple[Callable[[Any, Any], Any], Callable[[], Any]]] = []
+        for operand in node.ops:
+            if (compare_op := _NATIVE_COMPARE_OPERATORS.get(operand.op)) is None:
+                raise _NotNative
+            ops.append((compare_op, self.compile(operand.expr)))
+
+        def _compare() -> Any:
+            left = first()
+            result: Any = True
+            for compare_op, compiled in ops:
+                right = compiled()
+                if not (result := compare_op(left, right)):
+                    return result
+                left = right
+            return result
+
+        return _compare
+
+
+def _compile_native(
+    hass: HomeAssistant, env: TemplateEnvironment, source: str
+) -> _NativeTemplate | None:
+    """Compile a template made of text and simple expressions to a closure.
+
+    Returns None if the template must be rendered by Jinja.
+    """
+    compiler = _NativeCompiler(hass)
+    parts: list[Callable[[], Any]] = []
+    try:
+        ast = env.parse(source)
+        if len(ast.body) != 1 or not isinstance(
+            output := ast.body[0], jinja2.nodes.Output
+        ):
+            return None
+        for node in output.nodes:
+            if isinstance(node, jinja2.nodes.TemplateData):
+                data = node.data
+                parts.append(lambda data=data: data)  # type: ignore[misc]
+            else:
+                parts.append(compiler.compile(node))
+    except (_NotNative, jinja2.TemplateError):
+        return None
+
+    names = frozenset(compiler.names)
+    if len(parts) == 1:
+        part = parts[0]
+        return _NativeTemplate(lambda: str(part()), names)
+    return _NativeTemplate(lambda: "".join([str(part()) for part in parts]), names)
+
+
+def _render_native_with_context(template_str: str, native: _NativeTemplate) -> str:
+    """Store template being rendered in a ContextVar to aid error handling."""
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        return native.render()
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2334,6 +2753,9 @@ def make_logging_undefined(
         """Log on undefined variables."""
 
         def _log_message(self) -> None:
+            # The warning is logged again by every render
+            if (render_info := _render_info.get()) is not None:
+                render_info.cacheable = False
             _log_fn(logging.WARNING, self._undefined_message)
 
         def _fail_with_undefined_error(self, *args, **kwargs):
@@ -2405,6 +2827,11 @@ class HassLoader(jinja2.BaseLoader):
         self._sources = value
         self._reload += 1
 
+    @property
+    def reload_count(self) -> int:
+        """Return how often the sources were replaced."""
+        return self._reload
+
     def get_source(
         self, environment: jinja2.Environment, template: str
     ) -> tuple[str, str | None, Callable[[], bool] | None]:
@@ -2457,6 +2884,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.filters["median"] = median
         self.filters["statistical_mode"] = statistical_mode
         self.filters["random"] = random_every_time
+        self.globals["lipsum"] = _uncacheable(generate_lorem_ipsum)
         self.filters["base64_encode"] = base64_encode
         self.filters["base64_decode"] = base64_decode
         self.filters["ordinal"] = ordinal
@@ -2549,37 +2977,43 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
             return jinja_context(wrapper)
 
-        self.globals["device_entities"] = hassfunction(device_entities)
+        # Changes to the registries are not tracked so renders
+        # using them are never served from the render cache.
+        self.globals["device_entities"] = _uncacheable(hassfunction(device_entities))
         self.filters["device_entities"] = self.globals["device_entities"]
 
-        self.globals["device_attr"] = hassfunction(device_attr)
+        self.globals["device_attr"] = _uncacheable(hassfunction(device_attr))
         self.filters["device_attr"] = self.globals["device_attr"]
 
-        self.globals["is_device_attr"] = hassfunction(is_device_attr)
-        self.tests["is_device_attr"] = hassfunction(is_device_attr, pass_eval_context)
+        self.globals["is_device_attr"] = _uncacheable(hassfunction(is_device_attr))
+        self.tests["is_device_attr"] = _uncacheable(
+            hassfunction(is_device_attr, pass_eval_context)
+        )
 
-        self.globals["config_entry_id"] = hassfunction(config_entry_id)
+        self.globals["config_entry_id"] = _uncacheable(hassfunction(config_entry_id))
         self.filters["config_entry_id"] = self.globals["config_entry_id"]
 
-        self.globals["device_id"] = hassfunction(device_id)
+        self.globals["device_id"] = _uncacheable(hassfunction(device_id))
         self.filters["device_id"] = self.globals["device_id"]
 
-        self.globals["areas"] = hassfunction(areas)
+        self.globals["areas"] = _uncacheable(hassfunction(areas))
         self.filters["areas"] = self.globals["areas"]
 
-        self.globals["area_id"] = hassfunction(area_id)
+        self.globals["area_id"] = _uncacheable(hassfunction(area_id))
         self.filters["area_id"] = self.globals["area_id"]
 
-        self.globals["area_name"] = hassfunction(area_name)
+        self.globals["area_name"] = _uncacheable(hassfunction(area_name))
         self.filters["area_name"] = self.globals["area_name"]
 
-        self.globals["area_entities"] = hassfunction(area_entities)
+        self.globals["area_entities"] = _uncacheable(hassfunction(area_entities))
         self.filters["area_entities"] = self.globals["area_entities"]
 
-        self.globals["area_devices"] = hassfunction(area_devices)
+        self.globals["area_devices"] = _uncacheable(hassfunction(area_devices))
         self.filters["area_devices"] = self.globals["area_devices"]
 
-        self.globals["integration_entities"] = hassfunction(integration_entities)
+        self.globals["integration_entities"] = _uncacheable(
+            hassfunction(integration_entities)
+        )
         self.filters["integration_entities"] = self.globals["integration_entities"]
 
         if limited:
@@ -2637,12 +3071,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         self.globals["expand"] = hassfunction(expand)
         self.filters["expand"] = self.globals["expand"]
-        self.globals["closest"] = hassfunction(closest)
-        self.filters["closest"] = hassfunction(closest_filter)
-        self.globals["distance"] = hassfunction(distance)
-        self.globals["is_hidden_entity"] = hassfunction(is_hidden_entity)
-        self.tests["is_hidden_entity"] = hassfunction(
-            is_hidden_entity, pass_eval_context
+        self.globals["closest"] = _uncacheable(hassfunction(closest))
+        self.filters["closest"] = _uncacheable(hassfunction(closest_filter))
+        self.globals["distance"] = _uncacheable(hassfunction(distance))
+        self.globals["is_hidden_entity"] = _uncacheable(hassfunction(is_hidden_entity))
+        self.tests["is_hidden_entity"] = _uncacheable(
+            hassfunction(is_hidden_entity, pass_eval_context)
         )
         self.globals["is_state"] = hassfunction(is_state)
         self.tests["is_state"] = hassfunction(is_state, pass_eval_context)
@@ -12,8 +12,12 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
+import stat
 import sys
+import threading
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,7 +29,9 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .core import HomeAssistant, callback
+from .exceptions import HomeAssistantError
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -33,6 +39,7 @@ from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
+from .helpers.json import save_json
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 # Typing imports that create a circular dependency
@@ -48,6 +55,10 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "manifest_cache"
+# DATA_IMPORT_TIME is a dict [str, float], indicating how many seconds
+# it took to import an integration
+DATA_IMPORT_TIME = "import_time"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -60,6 +71,11 @@ CUSTOM_WARNING = (
 _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular dependency
 
 MAX_LOAD_CONCURRENTLY = 4
+MAX_PRE_IMPORT_CONCURRENTLY = 4
+
+# Kept out of .storage since it is not a Store file
+MANIFEST_CACHE_FILE = ".manifest_cache"
+MANIFEST_CACHE_VERSION = 1
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
@@ -168,6 +184,7 @@ class Manifest(TypedDict, total=False):
     dhcp: list[dict[str, bool | str]]
     usb: list[dict[str, str]]
     homekit: dict[str, list[str]]
+    import_executor: bool
     is_built_in: bool
     version: str
     codeowners: list[str]
@@ -179,6 +196,143 @@ def async_setup(hass: HomeAssistant) -> None:
     _async_mount_config_dir(hass)
     hass.data[DATA_COMPONENTS] = {}
     hass.data[DATA_INTEGRATIONS] = {}
+    hass.data[DATA_IMPORT_TIME] = {}
+    hass.data[DATA_MANIFEST_CACHE] = ManifestCache(
+        hass.config.path(MANIFEST_CACHE_FILE)
+    )
+
+
+async def async_save_manifest_cache(hass: HomeAssistant) -> None:
+    """Save the manifest cache if manifests were read from disk."""
+    if (cache := hass.data.get(DATA_MANIFEST_CACHE)) is not None:
+        await hass.async_add_executor_job(cache.save)
+
+
+class ManifestCache:
+    """Cache of the parsed manifests that is persisted between restarts.
+
+    Every manifest.json file is validated against the mtime and size
+    it had when it was parsed, and the list of custom integrations is
+    validated against the mtime of the custom_components directory,
+    so only changed manifests are read again at startup. The cache is
+    loaded with a single read the first time it is used. Entries that
+    were not used since the cache was loaded are dropped when it is saved.
+
+    The cache is only used from the executor.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the manifest cache."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._manifests: dict[str, tuple[int, int, Manifest]] = {}
+        self._directories: dict[str, tuple[int, list[str]]] = {}
+        self._used_manifests: set[str] = set()
+        self._used_directories: set[str] = set()
+
+    def _ensure_loaded(self) -> None:
+        """Load the cache file the first time the cache is used."""
+        if self._loaded:
+            return
+        with self._lock:
+            # Another thread may have loaded it while we waited for the lock
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+
+    def _load(self) -> None:
+        """Load the cache file."""
+        try:
+            data = json_loads(pathlib.Path(self.path).read_bytes())
+        except FileNotFoundError:
+            return
+        except (*JSON_DECODE_EXCEPTIONS, OSError) as err:
+            _LOGGER.warning("Ignoring invalid manifest cache %s: %s", self.path, err)
+            return
+        # Everything is read again after an upgrade
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != MANIFEST_CACHE_VERSION
+            or data.get("ha_version") != __version__
+            or not isinstance(manifests := data.get("manifests"), dict)
+            or not isinstance(directories := data.get("directories"), dict)
+        ):
+            return
+        self._manifests = cast(dict[str, tuple[int, int, Manifest]], manifests)
+        self._directories = cast(dict[str, tuple[int, list[str]]], directories)
+
+    def read_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the manifest at a path or None if there is no manifest.
+
+        Raises one of JSON_DECODE_EXCEPTIONS if the manifest is invalid.
+        """
+        try:
+            stat_result = manifest_path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        self._ensure_loaded()
+        key = str(manifest_path)
+        self._used_manifests.add(key)
+        if (
+            (entry := self._manifests.get(key)) is not None
+            and entry[0] == stat_result.st_mtime_ns
+            and entry[1] == stat_result.st_size
+        ):
+            # Integration adds is_built_in to the manifest it is given
+            return cast(Manifest, dict(entry[2]))
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        if isinstance(manifest, dict):
+            self._manifests[key] = (
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+                cast(Manifest, dict(manifest)),
+            )
+            self._dirty = True
+        return manifest
+
+    def sub_directories(self, path: str) -> list[str]:
+        """Return the names of the sub directories of a path."""
+        mtime = os.stat(path).st_mtime_ns
+        self._ensure_loaded()
+        self._used_directories.add(path)
+        if (entry := self._directories.get(path)) is not None and entry[0] == mtime:
+            return entry[1]
+        names = [entry.name for entry in os.scandir(path) if entry.is_dir()]
+        self._directories[path] = (mtime, names)
+        self._dirty = True
+        return names
+
+    def save(self) -> None:
+        """Write the cache file if it changed.
+
+        Nothing is written when the directory of the cache file does not exist.
+        """
+        # Drop integrations that were removed or were not loaded
+        for key in self._manifests.keys() - self._used_manifests:
+            del self._manifests[key]
+            self._dirty = True
+        for key in self._directories.keys() - self._used_directories:
+            del self._directories[key]
+            self._dirty = True
+        if not self._dirty or not os.path.isdir(os.path.dirname(self.path)):
+            return
+        self._dirty = False
+        try:
+            save_json(
+                self.path,
+                {
+                    "version": MANIFEST_CACHE_VERSION,
+                    "ha_version": __version__,
+                    "manifests": self._manifests,
+                    "directories": self._directories,
+                },
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to save manifest cache %s: %s", self.path, err)
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -204,10 +358,14 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
+    cache: ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        if cache is not None:
+            return [name for path in paths for name in cache.sub_directories(path)]
         return [
-            entry
+            entry.name
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
@@ -221,7 +379,7 @@ async def _async_get_custom_components(
         _resolve_integrations_from_root,
         hass,
         custom_components,
-        [comp.name for comp in dirs],
+        dirs,
     )
     return {
         integration.domain: integration
@@ -565,17 +723,17 @@ class Integration:
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                manifest = _read_manifest(hass, manifest_path)
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
+            if manifest is None:
+                continue
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
@@ -647,6 +805,9 @@ class Integration:
         else:
             self._all_dependencies_resolved = True
             self._all_dependencies = set()
+        # Set when a pre-import is queued and done once it finished
+        self._import_future: asyncio.Future[None] | None = None
+        self._pre_import_started = False
 
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -757,6 +918,15 @@ class Integration:
         """Test if package is a built-in integration."""
         return self.pkg_path.startswith(PACKAGE_BUILTIN)
 
+    @property
+    def import_executor(self) -> bool:
+        """Test if the integration can be imported in the executor.
+
+        Built-in integrations are imported in the executor, custom
+        integrations have to opt in with import_executor in the manifest.
+        """
+        return self.is_built_in or self.manifest.get("import_executor", False)
+
     @property
     def version(self) -> AwesomeVersion | None:
         """Return the version of the integration."""
@@ -811,16 +981,93 @@ class Integration:
 
         return self._all_dependencies_resolved
 
+    async def async_pre_import(
+        self, platform_names: Iterable[str], semaphore: asyncio.Semaphore
+    ) -> None:
+        """Import the component and its platforms in the executor.
+
+        Errors are not reported here. The modules are imported again
+        when the integration is set up, which reports the error.
+        """
+        if self._import_future is not None:
+            return
+        future = self._import_future = self.hass.loop.create_future()
+        try:
+            async with semaphore:
+                # The future is cancelled if the setup started in the meantime
+                if future.done() or self.domain in self.hass.data[DATA_COMPONENTS]:
+                    return
+                self._pre_import_started = True
+                import_time = await self.hass.async_add_executor_job(
+                    self._pre_import, list(platform_names)
+                )
+        finally:
+            if not future.done():
+                future.set_result(None)
+        self.hass.data[DATA_IMPORT_TIME].setdefault(self.domain, import_time)
+
+    def _pre_import(self, platform_names: list[str]) -> float:
+        """Import the component and its platforms, return the seconds it took."""
+        start = time.perf_counter()
+        # The import system raises an error instead of deadlocking
+        # when the event loop imports the same modules in a different
+        # order, so any error is left to the import in the event loop.
+        try:
+            importlib.import_module(self.pkg_path)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to pre-import %s", self.pkg_path, exc_info=True)
+            return time.perf_counter() - start
+        try:
+            file_names = {entry.name for entry in self.file_path.iterdir()}
+        except OSError:
+            return time.perf_counter() - start
+        for platform_name in platform_names:
+            if platform_name == self.domain or f"{platform_name}.py" not in file_names:
+                continue
+            try:
+                importlib.import_module(f"{self.pkg_path}.{platform_name}")
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.debug(
+                    "Unable to pre-import %s.%s",
+                    self.pkg_path,
+                    platform_name,
+                    exc_info=True,
+                )
+        return time.perf_counter() - start
+
+    async def _async_wait_for_pre_import(self) -> None:
+        """Wait for the import of this integration in the executor to finish.
+
+        A pre-import which is still queued is cancelled instead, so its
+        modules are only imported in the event loop.
+        """
+        if (future := self._import_future) is None or future.done():
+            return
+        if not self._pre_import_started:
+            future.cancel()
+            return
+        # Not awaited directly, which would cancel the future with the caller
+        await asyncio.wait((future,))
+
+    async def async_get_component(self) -> ComponentProtocol:
+        """Return the component once it is no longer imported in the executor."""
+        await self._async_wait_for_pre_import()
+        return self.get_component()
+
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform once it is no longer imported in the executor."""
+        await self._async_wait_for_pre_import()
+        return self.get_platform(platform_name)
+
     def get_component(self) -> ComponentProtocol:
         """Return the component."""
         cache: dict[str, ComponentProtocol] = self.hass.data[DATA_COMPONENTS]
         if self.domain in cache:
             return cache[self.domain]
 
+        start = time.perf_counter()
         try:
-            cache[self.domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            cache[self.domain] = cast(ComponentProtocol, _import_module(self.pkg_path))
         except ImportError:
             raise
         except Exception as err:
@@ -829,6 +1076,9 @@ class Integration:
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
+        self.hass.data[DATA_IMPORT_TIME].setdefault(
+            self.domain, time.perf_counter() - start
+        )
         return cache[self.domain]
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -856,13 +1106,63 @@ class Integration:
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return _import_module(f"{self.pkg_path}.{platform_name}")
 
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+@callback
+def async_pre_import_integrations(
+    hass: HomeAssistant,
+    integrations: Iterable[Integration],
+    platform_names: Iterable[str],
+) -> None:
+    """Import integrations and their platforms in the executor.
+
+    This avoids blocking the event loop with the imports when the
+    integrations are set up later.
+    """
+    semaphore = asyncio.Semaphore(MAX_PRE_IMPORT_CONCURRENTLY)
+    platform_names = list(platform_names)
+    for integration in integrations:
+        if not integration.import_executor:
+            continue
+        hass.async_create_background_task(
+            integration.async_pre_import(platform_names, semaphore),
+            f"pre-import {integration.domain}",
+        )
+
+
+def _import_module(name: str) -> ModuleType:
+    """Import a module, retry once if the import system detected a deadlock.
+
+    A deadlock is detected when the executor pre-imports modules in a
+    different order than the event loop. The import in the event loop
+    fails and releases its module locks, so the retry can finish once
+    the executor import released its locks too.
+    """
+    try:
+        return importlib.import_module(name)
+    except RuntimeError as err:
+        # importlib._bootstrap._DeadlockError is not public
+        if type(err).__name__ != "_DeadlockError":
+            raise
+        _LOGGER.debug("Retrying the import of %s after a deadlock: %s", name, err)
+        return importlib.import_module(name)
+
+
+def _read_manifest(hass: HomeAssistant, manifest_path: pathlib.Path) -> Manifest | None:
+    """Read a manifest.json file, return None if it does not exist."""
+    cache: ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+    if cache is not None:
+        return cache.read_manifest(manifest_path)
+    if not manifest_path.is_file():
+        return None
+    return cast(Manifest, json_loads(manifest_path.read_text()))
+
+
 def _resolve_integrations_from_root(
     hass: HomeAssistant, root_module: ModuleType, domains: list[str]
 ) -> dict[str, Integration]:
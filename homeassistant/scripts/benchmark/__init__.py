@@ -12,7 +12,9 @@ from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import device_registry as dr, entity_registry as er, template
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -108,14 +110,91 @@ async def fire_events_with_filter(hass):
 
     hass.bus.async_listen(event_name, listener, event_filter=event_filter)
 
+    # The filter runs while firing so the firing is timed as well
+    start = timer()
+
     for _ in range(events_to_fire):
         hass.bus.async_fire(event_name)
 
+    await hass.async_block_till_done()
+
+    assert count == 0
+
+    return timer() - start
+
+
+@benchmark
+async def fire_state_changed_events_with_filter(hass):
+    """Fire a million state changed events with 1000 entity_id filtered listeners."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**6
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+
+        @core.callback
+        def event_filter(event, filtered_entity_id=f"{entity_id}{idx}"):
+            """Filter event."""
+            return event.data["entity_id"] == filtered_entity_id
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter=event_filter)
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    # Listeners are matched while firing so the firing is timed as well
     start = timer()
 
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
     await hass.async_block_till_done()
 
-    assert count == 0
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_state_changed_events_keyed(hass):
+    """Fire a million state changed events with 1000 keyed listeners."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**6
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.bus.async_listen_keyed(EVENT_STATE_CHANGED, f"{entity_id}{idx}", listener)
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    # Listeners are matched while firing so the firing is timed as well
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
 
     return timer() - start
 
@@ -314,6 +393,190 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def template_render_native(hass):
+    """Render a simple state comparison template 100k times."""
+    hass.states.async_set("sensor.outdoor_temp", "21.5")
+    tpl = template.Template("{{ states('sensor.outdoor_temp') | float > 20 }}", hass)
+
+    start = timer()
+    for _ in range(10**5):
+        tpl.async_render()
+    return timer() - start
+
+
+@benchmark
+async def template_render_jinja(hass):
+    """Render the same comparison through Jinja 100k times.
+
+    The state attribute access is not supported by the native
+    renderer so this is the baseline for template_render_native.
+    """
+    hass.states.async_set("sensor.outdoor_temp", "21.5")
+    tpl = template.Template("{{ states.sensor.outdoor_temp.state | float > 20 }}", hass)
+
+    start = timer()
+    for _ in range(10**5):
+        tpl.async_render()
+    return timer() - start
+
+
+@benchmark
+async def mqtt_message_burst(hass):
+    """Receive 200k MQTT messages from the paho thread with 1000 subscriptions.
+
+    Replays the state and availability messages
+    of 1000 zigbee2mqtt devices 100 times.
+    """
+    # MQTT is only imported here since it needs paho-mqtt to be installed
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant.components.mqtt.client import MQTT
+    from homeassistant.components.mqtt.models import MqttData
+
+    # pylint: enable=import-outside-toplevel
+
+    count = 0
+    devices = 1000
+    messages_to_receive = 100 * 2 * devices
+    received = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+        if count == messages_to_receive:
+            received.set()
+
+    config_entry = ConfigEntry(
+        version=1, minor_version=1, domain="mqtt", title="", data={}, source="user"
+    )
+    client = MQTT(hass, config_entry, {})
+    client.start(MqttData(client=client, config=[]))
+    for idx in range(devices):
+        await client.async_subscribe(f"zigbee2mqtt/device_{idx}", listener, 0)
+    await client.async_subscribe("zigbee2mqtt/+/availability", listener, 0)
+    await client.async_subscribe("zigbee2mqtt/bridge/#", listener, 0)
+
+    messages = []
+    for idx in range(devices):
+        state = MQTTMessage(topic=f"zigbee2mqtt/device_{idx}".encode())
+        state.payload = b'{"state":"ON","brightness":254,"linkquality":120}'
+        availability = MQTTMessage(
+            topic=f"zigbee2mqtt/device_{idx}/availability".encode()
+        )
+        availability.payload = b'{"state":"online"}'
+        messages.extend((state, availability))
+
+    def receive_messages():
+        """Receive the messages like the paho network thread."""
+        for _ in range(100):
+            for msg in messages:
+                client._mqtt_on_message(None, None, msg)
+
+    start = timer()
+
+    await hass.async_add_executor_job(receive_messages)
+    await received.wait()
+
+    client.cleanup()
+
+    return timer() - start
+
+
+@benchmark
+async def registry_lookups(hass):
+    """Look up entities and devices by area, device and config entry 10k times.
+
+    The registries hold 10k entities of 2k devices in 100 areas
+    set up by 100 config entries.
+    """
+    ent_reg = er.EntityRegistry(hass)
+    ent_reg.entities = er.EntityRegistryItems()
+    dev_reg = dr.DeviceRegistry(hass)
+    dev_reg.devices = dr.ActiveDeviceRegistryItems()
+
+    for idx in range(2000):
+        device = dr.DeviceEntry(
+            area_id=f"area_{idx % 100}",
+            config_entries={f"entry_{idx % 100}"},
+            identifiers={("benchmark", str(idx))},
+        )
+        dev_reg.devices[device.id] = device
+        for entity_idx in range(5):
+            entity_id = f"sensor.device_{idx}_{entity_idx}"
+            ent_reg.entities[entity_id] = er.RegistryEntry(
+                entity_id,
+                f"{idx}_{entity_idx}",
+                "benchmark",
+                area_id=device.area_id,
+                config_entry_id=f"entry_{idx % 100}",
+                device_id=device.id,
+            )
+    device_ids = list(dev_reg.devices)
+
+    start = timer()
+    for idx in range(10**4):
+        area_id = f"area_{idx % 100}"
+        config_entry_id = f"entry_{idx % 100}"
+        er.async_entries_for_device(ent_reg, device_ids[idx % 2000])
+        er.async_entries_for_area(ent_reg, area_id)
+        er.async_entries_for_config_entry(ent_reg, config_entry_id)
+        dr.async_entries_for_area(dev_reg, area_id)
+        dr.async_entries_for_config_entry(dev_reg, config_entry_id)
+    return timer() - start
+
+
+@benchmark
+async def recorder_bulk_insert_states(hass):
+    """Insert 10k recorder states of 100 entities into SQLite in one commit.
+
+    Each entity has 100 states linked to the previous one with old_state.
+    """
+    # The recorder is only imported here since it needs SQLAlchemy to be installed
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import Base, States, StatesMeta
+    from homeassistant.components.recorder.table_managers.states import StatesManager
+
+    # pylint: enable=import-outside-toplevel
+
+    def insert_states():
+        """Insert the states like the recorder thread."""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        states_manager = StatesManager()
+        with Session(engine) as session:
+            states_meta = [
+                StatesMeta(entity_id=f"sensor.benchmark_{idx}") for idx in range(100)
+            ]
+            session.add_all(states_meta)
+            old_states = [None] * len(states_meta)
+            for value in range(100):
+                for idx, meta in enumerate(states_meta):
+                    db_state = States(
+                        state=str(value),
+                        last_updated_ts=float(value),
+                        old_state=old_states[idx],
+                        states_meta_rel=meta,
+                    )
+                    old_states[idx] = db_state
+                    states_manager.add_pending_insert(db_state)
+
+            start = timer()
+            states_manager.insert_pending(session)
+            session.commit()
+            runtime = timer() - start
+        engine.dispose()
+        return runtime
+
+    return await hass.async_add_executor_job(insert_states)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
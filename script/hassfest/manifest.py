@@ -263,6 +263,7 @@ INTEGRATION_MANIFEST_SCHEMA = vol.Schema(
         vol.Optional("after_dependencies"): [str],
         vol.Required("codeowners"): [str],
         vol.Optional("loggers"): [str],
+        vol.Optional("import_executor"): bool,
         vol.Optional("disabled"): str,
         vol.Optional("iot_class"): vol.In(SUPPORTED_IOT_CLASSES),
     }
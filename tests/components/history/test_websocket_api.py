@@ -1,7 +1,7 @@
 """The tests the History component websocket_api."""
 import asyncio
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -171,6 +171,185 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sending the states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now - timedelta(minutes=10)) as freezer:
+        hass.states.async_set("sensor.one", "1")
+        hass.states.async_set("sensor.two", "1")
+        await async_recorder_block_till_done(hass)
+        freezer.move_to(now + timedelta(minutes=30))
+        hass.states.async_set("sensor.one", "2")
+        await async_recorder_block_till_done(hass)
+        # Exactly at the start of the second window
+        freezer.move_to(now + timedelta(hours=1))
+        hass.states.async_set("sensor.one", "3")
+        hass.states.async_set("sensor.two", "3")
+        await async_recorder_block_till_done(hass)
+        freezer.move_to(now + timedelta(minutes=90))
+        hass.states.async_set("sensor.two", "4")
+        await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_CHUNK_MAX_ENTITIES", 1), patch.object(
+        websocket_api, "HISTORY_CHUNK_TIME_WINDOW", timedelta(hours=1)
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "end_time": (now + timedelta(hours=2)).isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "minimal_response": True,
+                "no_attributes": True,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+
+        chunks = []
+        while not (response := await client.receive_json())["event"].get("complete"):
+            assert response["type"] == "event"
+            chunks.append(response["event"]["states"])
+
+    assert response["event"]["end_time"] == (now + timedelta(hours=2)).timestamp()
+    assert [
+        {entity_id: [state["s"] for state in states]}
+        for chunk in chunks
+        for entity_id, states in chunk.items()
+    ] == [
+        {"sensor.one": ["1", "2"]},
+        {"sensor.two": ["1"]},
+        {"sensor.one": ["3"]},
+        {"sensor.two": ["3", "4"]},
+    ]
+
+
+async def test_history_during_period_chunked_error(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test an error while sending the chunks ends them with an error event."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    hass.states.async_set("sensor.one", "1")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(
+        websocket_api, "_generate_history_chunk", side_effect=ValueError("boom")
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": (now - timedelta(hours=1)).isoformat(),
+                "entity_ids": ["sensor.one"],
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+
+        response = await client.receive_json()
+
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    assert response["event"]["complete"] is True
+    assert response["event"]["states"] == {}
+    assert response["event"]["error"] == {
+        "code": "unknown_error",
+        "message": "Unknown error",
+    }
+
+    # No second result is sent for the command
+    await client.send_json({"id": 2, "type": "ping"})
+    response = await client.receive_json()
+    assert response == {"id": 2, "type": "pong"}
+
+
+async def test_history_during_period_chunked_cancelled_on_close(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the chunks are no longer sent once the connection is closed."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    hass.states.async_set("sensor.one", "1")
+    await async_wait_recording_done(hass)
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def _send_history_chunks(*args):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    client = await hass_ws_client()
+    with patch.object(
+        websocket_api, "_async_send_history_chunks", _send_history_chunks
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": (now - timedelta(hours=1)).isoformat(),
+                "entity_ids": ["sensor.one"],
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        await started.wait()
+        await client.close()
+        await asyncio.wait_for(cancelled.wait(), 5)
+
+
+async def test_history_chunks_stop_when_connection_closed(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test no more chunks are fetched once the drained connection is closed."""
+    now = dt_util.utcnow()
+    connection = Mock(closed=False)
+
+    async def _drain_and_close():
+        connection.closed = True
+
+    connection.async_drain = AsyncMock(side_effect=_drain_and_close)
+    with patch.object(
+        websocket_api, "_generate_history_chunk", return_value="chunk"
+    ) as generate_chunk, patch.object(websocket_api, "HISTORY_CHUNK_MAX_ENTITIES", 1):
+        await websocket_api._async_send_history_chunks(
+            hass,
+            connection,
+            1,
+            now - timedelta(hours=1),
+            now,
+            ["sensor.one", "sensor.two"],
+            True,
+            True,
+            False,
+            False,
+            None,
+        )
+
+    assert generate_chunk.call_count == 1
+    connection.send_message.assert_called_once_with("chunk")
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
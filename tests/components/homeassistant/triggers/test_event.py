@@ -202,6 +202,43 @@ async def test_if_fires_on_event_with_data_and_context(
     assert len(calls) == 1
 
 
+async def test_if_fires_on_event_with_entity_id(hass: HomeAssistant, calls) -> None:
+    """Test events with an entity_id in the event data are routed by entity_id."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "test_event",
+                    "event_data": {"entity_id": "light.kitchen", "action": "on"},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    assert hass.bus.async_listeners()["test_event"] == 1
+
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen", "action": "on"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen", "action": "off"})
+    hass.bus.async_fire("test_event", {"entity_id": "light.bowl", "action": "on"})
+    hass.bus.async_fire("test_event", {"action": "on"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert "test_event" not in hass.bus.async_listeners()
+
+
 async def test_if_fires_on_event_with_templated_data_and_context(
     hass: HomeAssistant, calls, context_with_user
 ) -> None:
@@ -528,6 +528,54 @@ async def test_logbook_describe_event(
     assert event["domain"] == "test_domain"
 
 
+async def test_logbook_describe_context_origin_once(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the origin of a context is only described once for all its rows."""
+    describe = Mock(return_value={"name": "Test Name", "message": "tested a message"})
+
+    hass.config.components.add("fake_integration")
+    mock_platform(
+        hass,
+        "fake_integration.logbook",
+        Mock(
+            async_describe_events=(
+                lambda hass, async_describe_event: async_describe_event(
+                    "test_domain",
+                    "some_event",
+                    describe,
+                )
+            ),
+        ),
+    )
+
+    assert await async_setup_component(hass, "logbook", {})
+    entity_ids = ("light.one", "light.two", "light.three")
+    context = ha.Context()
+    with freeze_time(dt_util.utcnow() - timedelta(seconds=5)):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, STATE_OFF)
+        hass.bus.async_fire("some_event", context=context)
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, STATE_ON, context=context)
+        await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day, tzinfo=dt_util.UTC)
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    results = await response.json()
+
+    assert [result.get("context_name") for result in results] == [
+        None,
+        "Test Name",
+        "Test Name",
+        "Test Name",
+    ]
+    # Once for the event entry and once for the context of the states
+    assert describe.call_count == 2
+
+
 async def test_exclude_described_event(
     recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
@@ -25,6 +25,7 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
 
@@ -576,6 +577,50 @@ async def test_non_duplicate_discovery(
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
 
 
+@patch("homeassistant.components.mqtt.PLATFORMS", [Platform.BINARY_SENSOR])
+async def test_discovery_burst_adds_entities_at_once(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test entities discovered in a burst are added to the platform at once."""
+    await mqtt_mock_entry()
+    with patch(
+        "homeassistant.helpers.entity_platform.EntityPlatform.async_add_entities",
+        autospec=True,
+        side_effect=EntityPlatform.async_add_entities,
+    ) as mock_add_entities:
+        for name in ("Beer", "Milk", "Water"):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/{name.lower()}/config",
+                json.dumps({"name": name, "state_topic": "test-topic"}),
+            )
+        # The same retained message received twice is only queued once
+        for _ in range(2):
+            async_fire_mqtt_message(
+                hass,
+                "homeassistant/binary_sensor/beer/config",
+                '{ "name": "Beer", "state_topic": "test-topic", "icon": "mdi:beer" }',
+            )
+        await hass.async_block_till_done()
+
+    assert mock_add_entities.call_count == 1
+    assert [entity.name for entity in mock_add_entities.call_args[0][1]] == [
+        "Beer",
+        "Milk",
+        "Water",
+    ]
+    for entity_id in (
+        "binary_sensor.beer",
+        "binary_sensor.milk",
+        "binary_sensor.water",
+    ):
+        assert hass.states.get(entity_id) is not None
+    assert hass.states.get("binary_sensor.beer").attributes["icon"] == "mdi:beer"
+    assert "Ignoring duplicate update for component: binary_sensor beer" in caplog.text
+
+
 @patch("homeassistant.components.mqtt.PLATFORMS", [Platform.BINARY_SENSOR])
 async def test_removal(
     hass: HomeAssistant,
@@ -1290,6 +1290,80 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0].payload == "test-payload"
 
 
+async def test_subscribe_wildcard_topic_after_message_received(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test subscriptions added and removed after a topic was matched."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/bier/on", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "$test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    unsub_level = await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+    unsub_subtree = await mqtt.async_subscribe(hass, "+/#", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    # $ topics are not matched by a wildcard at the first level
+    async_fire_mqtt_message(hass, "$test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert [call.subscribed_topic for call in calls[1:]] == [
+        "test-topic/bier/on",
+        "test-topic/+/on",
+        "+/#",
+    ]
+
+    unsub_level()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert [call.subscribed_topic for call in calls[4:]] == [
+        "test-topic/bier/on",
+        "+/#",
+    ]
+
+    unsub_subtree()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 7
+
+
+@patch("homeassistant.components.mqtt.client.RECEIVE_BATCH_SIZE", 2)
+async def test_receive_messages_in_batches(
+    hass: HomeAssistant,
+    mqtt_client_mock: MqttMockPahoClient,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test messages received by the paho thread are handled in batches."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon_threadsafe:
+        for idx in range(5):
+            msg = MQTTMessage(topic=f"test-topic/{idx}".encode())
+            msg.payload = str(idx).encode()
+            mqtt_client_mock.on_message(mqtt_client_mock, None, msg)
+        # Each iteration of the event loop handles a batch
+        for handled in (2, 4, 5):
+            await asyncio.sleep(0)
+            assert len(calls) == handled
+
+    # The event loop is only woken up once for the burst of messages
+    assert mock_call_soon_threadsafe.call_count == 1
+    assert [(call.topic, call.payload) for call in calls] == [
+        (f"test-topic/{idx}", str(idx)) for idx in range(5)
+    ]
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
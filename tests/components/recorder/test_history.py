@@ -708,6 +708,58 @@ def test_get_significant_states_only(
     )
 
 
+def test_get_significant_states_max_points(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test significant states are downsampled to min/max buckets with max_points."""
+    hass = hass_recorder()
+    entity_id = "sensor.test"
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=2
+    )
+    end = start + timedelta(hours=1)
+
+    with freeze_time(start) as freezer:
+        for minute in range(1, 60):
+            freezer.move_to(start + timedelta(minutes=minute))
+            if minute == 20:
+                hass.states.set(entity_id, "unavailable")
+            elif minute == 40:
+                hass.states.set(entity_id, "100")
+            else:
+                hass.states.set(entity_id, str(minute % 7))
+    wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass, start, end, [entity_id], include_start_time_state=False
+    )
+    assert len(hist[entity_id]) == 59
+
+    # Buckets of 15 minutes keep the lowest and highest state,
+    # the first and last states and non-numeric states are always kept
+    hist = history.get_significant_states(
+        hass, start, end, [entity_id], include_start_time_state=False, max_points=8
+    )
+    assert [
+        (state.state, int((state.last_updated - start).total_seconds() // 60))
+        for state in hist[entity_id]
+    ] == [
+        ("1", 1),
+        ("6", 6),
+        ("0", 7),
+        ("1", 15),
+        ("5", 19),
+        ("unavailable", 20),
+        ("0", 21),
+        ("6", 27),
+        ("0", 35),
+        ("100", 40),
+        ("6", 48),
+        ("0", 49),
+        ("3", 59),
+    ]
+
+
 async def test_get_significant_states_only_minimal_response(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -341,6 +342,138 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_many_states_in_one_commit(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states written in the same commit are inserted in bulk."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    assert instance._bulk_insert_states is True
+    states_inserts: list[str] = []
+
+    def _count_states_inserts(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO states "):
+            states_inserts.append(statement)
+
+    sqlalchemy_event.listen(
+        instance.engine, "before_cursor_execute", _count_states_inserts
+    )
+    for state in ("on", "off", "on"):
+        for idx in range(100):
+            hass.states.async_set(f"test.recorder_{idx}", state)
+    await async_wait_recording_done(hass)
+    sqlalchemy_event.remove(
+        instance.engine, "before_cursor_execute", _count_states_inserts
+    )
+
+    # One INSERT per state of each entity instead of one per row
+    assert len(states_inserts) == 3
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = {db_state.state_id: db_state for db_state in session.query(States)}
+        assert len(db_states) == 300
+        for db_state in db_states.values():
+            if db_state.old_state_id is None:
+                assert db_state.state == "on"
+                continue
+            old_state = db_states[db_state.old_state_id]
+            assert old_state.metadata_id == db_state.metadata_id
+            assert old_state.state != db_state.state
+
+
+async def test_saving_many_states_fails_in_later_insert(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states are inserted again if a later bulk insert fails."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    states_inserts: list[str] = []
+
+    def _fail_second_states_insert(conn, cursor, statement, *args):
+        if not statement.startswith("INSERT INTO states "):
+            return
+        states_inserts.append(statement)
+        if len(states_inserts) == 2:
+            # Lose the rows of the first insert like a dropped connection
+            cursor.connection.rollback()
+            raise OperationalError(statement, {}, "forced to fail")
+
+    sqlalchemy_event.listen(
+        instance.engine, "before_cursor_execute", _fail_second_states_insert
+    )
+    with patch("time.sleep"):
+        for state in ("on", "off"):
+            for idx in range(3):
+                hass.states.async_set(f"test.recorder_{idx}", state)
+        await async_wait_recording_done(hass)
+    sqlalchemy_event.remove(
+        instance.engine, "before_cursor_execute", _fail_second_states_insert
+    )
+
+    # Both inserts are done again after the failed one
+    assert len(states_inserts) == 4
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = {db_state.state_id: db_state for db_state in session.query(States)}
+        assert len(db_states) == 6
+        for db_state in db_states.values():
+            if db_state.state == "on":
+                assert db_state.old_state_id is None
+                continue
+            old_state = db_states[db_state.old_state_id]
+            assert old_state.metadata_id == db_state.metadata_id
+            assert old_state.state == "on"
+
+
+async def test_saving_states_fails_after_earlier_commit(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states link to the states of an earlier commit after a failed insert."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    for idx in range(3):
+        hass.states.async_set(f"test.recorder_{idx}", "on")
+    await async_wait_recording_done(hass)
+
+    states_inserts: list[str] = []
+
+    def _fail_first_states_insert(conn, cursor, statement, *args):
+        if not statement.startswith("INSERT INTO states "):
+            return
+        states_inserts.append(statement)
+        if len(states_inserts) == 1:
+            raise OperationalError(statement, {}, "forced to fail")
+
+    sqlalchemy_event.listen(
+        instance.engine, "before_cursor_execute", _fail_first_states_insert
+    )
+    with patch("time.sleep"):
+        for state in ("off", "unknown"):
+            for idx in range(3):
+                hass.states.async_set(f"test.recorder_{idx}", state)
+        await async_wait_recording_done(hass)
+    sqlalchemy_event.remove(
+        instance.engine, "before_cursor_execute", _fail_first_states_insert
+    )
+
+    assert len(states_inserts) == 3
+
+    expected_old_state = {"off": "on", "unknown": "off"}
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = {db_state.state_id: db_state for db_state in session.query(States)}
+        assert len(db_states) == 9
+        for db_state in db_states.values():
+            if db_state.state == "on":
+                assert db_state.old_state_id is None
+                continue
+            old_state = db_states[db_state.old_state_id]
+            assert old_state.metadata_id == db_state.metadata_id
+            assert old_state.state == expected_old_state[db_state.state]
+
+
 async def test_saving_state_with_intermixed_time_changes(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -377,17 +510,16 @@ def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    states_manager = get_instance(hass).states_manager
+    insert_pending = states_manager.insert_pending
+
+    def _throw_if_state_pending(session):
+        if states_manager._pending_inserts:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        insert_pending(session)
 
     with patch("time.sleep"), patch.object(
-        get_instance(hass).event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        states_manager, "insert_pending", side_effect=_throw_if_state_pending
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -407,6 +539,68 @@ def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+async def test_events_are_spooled_while_database_is_unreachable(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test events are spooled to disk and written once the database is back."""
+    spool_path = tmp_path / "recorder.spool"
+    with patch.object(recorder.core, "SPOOL_FILENAME", str(spool_path)), patch.object(
+        recorder.core, "SPOOL_MAX_BUFFER_SIZE", 0
+    ):
+        instance = await async_setup_recorder_instance(
+            hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+        )
+    instance.db_retry_wait = 0.01
+    states_manager = instance.states_manager
+    insert_pending = states_manager.insert_pending
+    database_is_reachable = False
+
+    def _throw_if_unreachable(session):
+        if not database_is_reachable:
+            raise OperationalError("insert the state", "fake params", "unreachable")
+        insert_pending(session)
+
+    def _get_states():
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(session.query(States).order_by(States.state_id))
+
+    with patch.object(
+        states_manager, "insert_pending", side_effect=_throw_if_unreachable
+    ), patch.object(
+        instance,
+        "_database_is_reachable",
+        side_effect=lambda: database_is_reachable,
+    ):
+        hass.states.async_set("test.one", "on", {"attr": 1})
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(instance.block_till_done)
+        hass.states.async_set("test.two", "on")
+        hass.states.async_set("test.one", "off", {"attr": 2})
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(instance.block_till_done)
+
+        assert spool_path.exists()
+        assert await instance.async_add_executor_job(_get_states) == []
+
+        database_is_reachable = True
+        # Tasks other than WaitTask are deferred until the spool is replayed
+        await instance.async_block_till_done()
+
+    assert not spool_path.exists()
+    db_states = await instance.async_add_executor_job(_get_states)
+    assert [db_state.state for db_state in db_states] == ["on", "on", "off"]
+    assert db_states[2].old_state_id == db_states[0].state_id
+    assert db_states[2].metadata_id == db_states[0].metadata_id
+
+    hass.states.async_set("test.two", "off")
+    await async_wait_recording_done(hass)
+    db_states = await instance.async_add_executor_job(_get_states)
+    assert db_states[3].state == "off"
+    assert db_states[3].old_state_id == db_states[1].state_id
+
+
 def test_saving_state_with_sqlalchemy_exception(
     hass_recorder: Callable[..., HomeAssistant],
     hass: HomeAssistant,
@@ -419,17 +613,16 @@ def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    states_manager = get_instance(hass).states_manager
+    insert_pending = states_manager.insert_pending
+
+    def _throw_if_state_pending(session):
+        if states_manager._pending_inserts:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        insert_pending(session)
 
     with patch("time.sleep"), patch.object(
-        get_instance(hass).event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        states_manager, "insert_pending", side_effect=_throw_if_state_pending
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
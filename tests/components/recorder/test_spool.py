@@ -0,0 +1,177 @@
+"""Test the recorder spool."""
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from homeassistant.components.recorder.spool import RecorderSpool
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+import homeassistant.util.dt as dt_util
+
+MAX_SIZE = 1024 * 1024
+
+
+def _state_changed_event(state: State) -> Event:
+    """Return a state changed event for a state."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": state.entity_id, "old_state": None, "new_state": state},
+        time_fired=state.last_updated,
+        context=state.context,
+    )
+
+
+def test_spool_round_trip(tmp_path: Path) -> None:
+    """Test events read back from the spool match the spooled events."""
+    spool = RecorderSpool(str(tmp_path / "recorder.spool"), 0, MAX_SIZE)
+    assert not spool.pending
+    last_changed = dt_util.utcnow()
+    state = State(
+        "sensor.one",
+        "on",
+        {"unit": "W", "secret": "x"},
+        last_changed,
+        last_changed + timedelta(seconds=1),
+        Context(user_id="abc"),
+        state_info={"unrecorded_attributes": frozenset({"secret"})},
+    )
+    removed = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.two", "old_state": None, "new_state": None},
+    )
+    custom = Event(
+        "custom_event", {"value": 5}, EventOrigin.remote, context=Context(id="xyz")
+    )
+    for event in (_state_changed_event(state), removed, custom):
+        spool.append(event)
+    assert spool.pending
+
+    events = spool.read_batch(10)
+    assert len(events) == 3
+    new_state = events[0].data["new_state"]
+    assert new_state.entity_id == "sensor.one"
+    assert new_state.state == "on"
+    assert new_state.attributes == {"unit": "W"}
+    assert new_state.last_changed == state.last_changed
+    assert new_state.last_updated == state.last_updated
+    assert new_state.context.as_dict() == state.context.as_dict()
+    assert events[0].context.as_dict() == state.context.as_dict()
+    assert events[1].data == removed.data
+    assert events[1].context.id == removed.context.id
+    assert events[2].event_type == "custom_event"
+    assert events[2].data == {"value": 5}
+    assert events[2].origin == EventOrigin.remote
+    assert events[2].time_fired == custom.time_fired
+    assert events[2].context.id == "xyz"
+
+    spool.ack()
+    assert not spool.pending
+    assert not (tmp_path / "recorder.spool").exists()
+
+
+def test_spool_buffers_in_memory(tmp_path: Path) -> None:
+    """Test events are only written to disk past the buffer size."""
+    spool_path = tmp_path / "recorder.spool"
+    spool = RecorderSpool(str(spool_path), 1024, MAX_SIZE)
+    spool.append(Event("custom_event", {"value": 1}))
+    assert spool.pending
+    assert not spool_path.exists()
+    spool.append(Event("custom_event", {"value": "x" * 1024}))
+    assert spool_path.exists()
+    assert [event.data for event in spool.read_batch(10)] == [
+        {"value": 1},
+        {"value": "x" * 1024},
+    ]
+
+
+def test_spool_resumes_after_restart(tmp_path: Path) -> None:
+    """Test a spool left behind is replayed from the last acknowledged event."""
+    spool_path = str(tmp_path / "recorder.spool")
+    spool = RecorderSpool(spool_path, 1024, MAX_SIZE)
+    for value in range(5):
+        spool.append(Event("custom_event", {"value": value}))
+    spool.flush()
+    assert [event.data["value"] for event in spool.read_batch(2)] == [0, 1]
+    spool.ack()
+    # Read but not acknowledged
+    assert [event.data["value"] for event in spool.read_batch(2)] == [2, 3]
+
+    spool = RecorderSpool(spool_path, 1024, MAX_SIZE)
+    spool.load()
+    assert spool.pending
+    assert [event.data["value"] for event in spool.read_batch(10)] == [2, 3, 4]
+    spool.ack()
+    assert not spool.pending
+
+
+def test_spool_skips_truncated_record(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a record that was not completely written is skipped."""
+    spool_path = tmp_path / "recorder.spool"
+    spool = RecorderSpool(str(spool_path), 0, MAX_SIZE)
+    spool.append(Event("custom_event", {"value": 1}))
+    spool.append(Event("custom_event", {"value": 2}))
+    spool_path.write_bytes(spool_path.read_bytes()[:-3])
+
+    spool = RecorderSpool(str(spool_path), 0, MAX_SIZE)
+    spool.load()
+    assert [event.data for event in spool.read_batch(10)] == [{"value": 1}]
+    assert "Skipping truncated record" in caplog.text
+    spool.ack()
+    assert not spool.pending
+
+
+def test_spool_skips_unserializable_event(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an event that cannot be serialized is not spooled."""
+    spool = RecorderSpool(str(tmp_path / "recorder.spool"), 0, MAX_SIZE)
+    spool.append(Event("custom_event", {"value": object()}))
+    assert not spool.pending
+    assert "Event is not JSON serializable" in caplog.text
+
+
+def test_spool_drops_oldest_events(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the oldest events are dropped once the spool reaches its maximum size."""
+    spool_path = tmp_path / "recorder.spool"
+    spool = RecorderSpool(str(spool_path), 0, 1024)
+    for value in range(3):
+        spool.append(Event("custom_event", {"value": value, "pad": "x" * 100}))
+    assert [event.data["value"] for event in spool.read_batch(1)] == [0]
+    spool.ack()
+    # Read but not acknowledged when the events are dropped
+    assert [event.data["value"] for event in spool.read_batch(1)] == [1]
+    assert "maximum size" not in caplog.text
+
+    for value in range(3, 12):
+        spool.append(Event("custom_event", {"value": value, "pad": "x" * 100}))
+    assert "reached its maximum size of 1024 bytes" in caplog.text
+    assert spool_path.stat().st_size <= 1024
+
+    spool.ack()
+    values = [event.data["value"] for event in spool.read_batch(20)]
+    assert values == list(range(values[0], 12))
+    assert values[0] > 2
+    spool.ack()
+    assert not spool.pending
+
+
+def test_spool_skips_record_not_an_object(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a record that is not a JSON object is skipped as invalid."""
+    spool_path = tmp_path / "recorder.spool"
+    spool = RecorderSpool(str(spool_path), 0, MAX_SIZE)
+    spool.append(Event("custom_event", {"value": 1}))
+    record = b"[1,2]"
+    with spool_path.open("ab") as spool_file:
+        spool_file.write(len(record).to_bytes(4, "big") + record)
+
+    spool = RecorderSpool(str(spool_path), 0, MAX_SIZE)
+    spool.load()
+    assert [event.data for event in spool.read_batch(10)] == [{"value": 1}]
+    assert "Skipping invalid record" in caplog.text
@@ -1743,6 +1743,169 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+def test_daily_statistics_rollup_cache(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test days which have ended are reduced only once."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    today = dt_util.start_of_local_day()
+    day1 = today - timedelta(days=2)
+    day2 = today - timedelta(days=1)
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    external_statistics = [
+        {"start": day1, "state": 0, "sum": 2},
+        {"start": day1 + timedelta(hours=1), "state": 1, "sum": 3},
+        {"start": day2, "state": 2, "sum": 4},
+        {"start": today, "state": 3, "sum": 5},
+    ]
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    def _day(start, value):
+        return {
+            "start": start.timestamp(),
+            "end": (start + timedelta(days=1)).timestamp(),
+            "sum": pytest.approx(value),
+        }
+
+    stats = statistics_during_period(
+        hass,
+        day1,
+        period="day",
+        statistic_ids={"test:total_energy_import"},
+        types={"sum"},
+    )
+    assert stats == {
+        "test:total_energy_import": [_day(day1, 3), _day(day2, 4), _day(today, 5)]
+    }
+
+    # Only the hourly statistics of today are fetched again
+    with patch.object(
+        statistics,
+        "_generate_statistics_during_period_stmt",
+        wraps=_generate_statistics_during_period_stmt,
+    ) as generate_stmt:
+        stats = statistics_during_period(
+            hass,
+            day1,
+            period="day",
+            statistic_ids={"test:total_energy_import"},
+            units={"energy": "Wh"},
+            types={"sum"},
+        )
+    assert generate_stmt.call_count == 1
+    assert generate_stmt.call_args[0][0] == today
+    assert stats == {
+        "test:total_energy_import": [
+            _day(day1, 3000),
+            _day(day2, 4000),
+            _day(today, 5000),
+        ]
+    }
+
+    # Changing the statistics of a day which has ended drops it from the cache
+    async_add_external_statistics(
+        hass, external_metadata, [{"start": day2, "state": 2, "sum": 10}]
+    )
+    wait_recording_done(hass)
+    stats = statistics_during_period(
+        hass,
+        day2,
+        period="day",
+        statistic_ids={"test:total_energy_import"},
+        types={"sum"},
+    )
+    assert stats == {"test:total_energy_import": [_day(day2, 10), _day(today, 5)]}
+
+
+def test_daily_statistics_rollup_cache_later_start(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test a request starting after the cached days does not leave a gap."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    today = dt_util.start_of_local_day()
+    day1 = today - timedelta(days=3)
+    day2 = today - timedelta(days=2)
+    day3 = today - timedelta(days=1)
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    external_statistics = [
+        {"start": day1, "state": 0, "sum": 2},
+        {"start": day2, "state": 1, "sum": 3},
+        {"start": day3, "state": 2, "sum": 4},
+        {"start": today, "state": 3, "sum": 5},
+    ]
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    def _day(start, value):
+        return {
+            "start": start.timestamp(),
+            "end": (start + timedelta(days=1)).timestamp(),
+            "sum": pytest.approx(value),
+        }
+
+    # Cache day1 only, the end time is rounded up to the end of day1
+    stats = statistics_during_period(
+        hass,
+        day1,
+        day1,
+        period="day",
+        statistic_ids={"test:total_energy_import"},
+        types={"sum"},
+    )
+    assert stats == {"test:total_energy_import": [_day(day1, 2)]}
+
+    # The cached day1 ends before day3, so it is not extended with day3
+    with patch.object(
+        statistics,
+        "_generate_statistics_during_period_stmt",
+        wraps=_generate_statistics_during_period_stmt,
+    ) as generate_stmt:
+        stats = statistics_during_period(
+            hass,
+            day3,
+            period="day",
+            statistic_ids={"test:total_energy_import"},
+            types={"sum"},
+        )
+    assert generate_stmt.call_args[0][0] == day3
+    assert stats == {"test:total_energy_import": [_day(day3, 4), _day(today, 5)]}
+
+    stats = statistics_during_period(
+        hass,
+        day1,
+        period="day",
+        statistic_ids={"test:total_energy_import"},
+        types={"sum"},
+    )
+    assert stats == {
+        "test:total_energy_import": [
+            _day(day1, 2),
+            _day(day2, 3),
+            _day(day3, 4),
+            _day(today, 5),
+        ]
+    }
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -33,7 +33,12 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
-from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
+from homeassistant.components.sensor.recorder import _StateAccumulator
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
@@ -2148,6 +2153,87 @@ def test_compile_hourly_statistics_unchanged(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_hourly_statistics_accumulated_states(
+    hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiling statistics from the accumulated states of the period."""
+    zero = dt_util.utcnow()
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    # Compiling the first period starts accumulating the sensor states
+    do_adhoc_statistics(hass, start=zero - timedelta(minutes=5))
+    wait_recording_done(hass)
+
+    start = zero + timedelta(minutes=1)
+    with freeze_time(start - timedelta(seconds=30)) as freezer:
+        hass.states.set("sensor.test1", "10", POWER_SENSOR_ATTRIBUTES)
+        freezer.move_to(start + timedelta(minutes=1))
+        hass.states.set("sensor.test1", "20", POWER_SENSOR_ATTRIBUTES)
+        freezer.move_to(start + timedelta(minutes=3))
+        hass.states.set("sensor.test1", "30", POWER_SENSOR_ATTRIBUTES)
+        wait_recording_done(hass)
+
+        with patch(
+            "homeassistant.components.sensor.recorder.history.get_full_significant_states_with_session"
+        ) as get_states:
+            do_adhoc_statistics(hass, start=start)
+            wait_recording_done(hass)
+    assert not get_states.called
+
+    stats = statistics_during_period(hass, start, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(start).timestamp(),
+                "end": process_timestamp(start + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(22.0),
+                "min": pytest.approx(10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+async def test_state_accumulator_state_class(hass: HomeAssistant) -> None:
+    """Test only sensors with a state class are accumulated until the stop."""
+    hass.states.async_set("sensor.power", "1", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.text", "a")
+    accumulator = _StateAccumulator(hass)
+    accumulator.async_start()
+    start = dt_util.utcnow()
+
+    hass.states.async_set("sensor.text", "b")
+    hass.states.async_set("sensor.energy", "1", ENERGY_SENSOR_ATTRIBUTES)
+    # Accumulated sensors are kept when they lose their state class
+    hass.states.async_set("sensor.power", STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+    states = accumulator.get_states_during_period(
+        start, dt_util.utcnow() + timedelta(seconds=1), ["sensor.power"], []
+    )
+    assert [state.state for state in states["sensor.power"]] == [
+        "1",
+        STATE_UNAVAILABLE,
+    ]
+    assert accumulator._states.keys() == {"sensor.power", "sensor.energy"}
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.energy", "2", ENERGY_SENSOR_ATTRIBUTES)
+    await hass.async_block_till_done()
+    assert not accumulator._states
+    assert (
+        accumulator.get_states_during_period(
+            start, dt_util.utcnow(), ["sensor.energy"], []
+        )
+        is None
+    )
+
+
 def test_compile_hourly_statistics_partially_unavailable(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
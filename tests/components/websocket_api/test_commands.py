@@ -20,7 +20,7 @@ from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAG
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_platform
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
@@ -670,6 +670,46 @@ async def test_subscribe_unsubscribe_events(
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_identical_subscriptions_share_listener(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test identical subscriptions of different connections share a bus listener."""
+    client1 = await hass_ws_client(hass)
+    client2 = await hass_ws_client(hass)
+
+    for client, msg_id in ((client1, 5), (client2, 8)):
+        await client.send_json(
+            {"id": msg_id, "type": "subscribe_events", "event_type": "test_event"}
+        )
+        msg = await client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+    assert hass.bus.async_listeners().get("test_event") == 1
+
+    hass.bus.async_fire("test_event", {"hello": "world"})
+    for client, msg_id in ((client1, 5), (client2, 8)):
+        async with asyncio.timeout(3):
+            msg = await client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+        assert msg["event"]["data"] == {"hello": "world"}
+
+    await client1.send_json({"id": 6, "type": "unsubscribe_events", "subscription": 5})
+    msg = await client1.receive_json()
+    assert msg["success"]
+    assert hass.bus.async_listeners().get("test_event") == 1
+
+    hass.bus.async_fire("test_event", {"hello": "again"})
+    async with asyncio.timeout(3):
+        msg = await client2.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"]["data"] == {"hello": "again"}
+
+    await client2.close()
+    await hass.async_block_till_done()
+    assert "test_event" not in hass.bus.async_listeners()
+
+
 async def test_get_states(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -1260,6 +1300,59 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_batch(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the states of a batch are sent in one message per subscription."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.removed", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {
+            "entities": {
+                "entity_ids": {
+                    "light.permitted": True,
+                    "light.removed": True,
+                    "light.new": True,
+                }
+            }
+        }
+    )
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert set(msg["event"]["a"]) == {"light.permitted", "light.removed"}
+
+    with hass.states.async_batch():
+        hass.states.async_set("light.permitted", "on")
+        hass.states.async_set("light.not_permitted", "on")
+        hass.states.async_set("light.new", "on")
+    hass.states.async_remove("light.removed")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.new": {"s": "on", "a": {}, "c": ANY, "lc": ANY}},
+        "c": {"light.permitted": {"+": {"s": "on", "c": ANY, "lc": ANY}}},
+    }
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {"r": ["light.removed"]}
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2508,6 +2601,42 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_poll_latency(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the poll latency histograms of the polling platforms."""
+    scheduler = entity_platform.async_get_polling_scheduler(hass)
+    platform = Mock(domain="light", platform_name="hue")
+    scheduler.async_record_latency(platform, 0.05)
+    scheduler.async_record_latency(platform, 0.3)
+    scheduler.async_record_latency(platform, 120)
+    await websocket_client.send_json({"id": 7, "type": "integration/poll_latency"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "platform": "light.hue",
+            "buckets": [
+                {"seconds": 0.1, "count": 1},
+                {"seconds": 0.25, "count": 0},
+                {"seconds": 0.5, "count": 1},
+                {"seconds": 1.0, "count": 0},
+                {"seconds": 2.5, "count": 0},
+                {"seconds": 5.0, "count": 0},
+                {"seconds": 10.0, "count": 0},
+                {"seconds": 30.0, "count": 0},
+                {"seconds": 60.0, "count": 0},
+                {"seconds": None, "count": 1},
+            ],
+        }
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
@@ -9,6 +9,7 @@ import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -16,6 +17,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -45,6 +47,31 @@ async def test_pending_msg_overflow(
     assert msg.type == WSMsgType.close
 
 
+async def test_drain_before_pending_msg_overflow(
+    hass: HomeAssistant, mock_low_queue, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test waiting for the messages to be written avoids an overflow."""
+
+    @websocket_command({"type": "send_many"})
+    @async_response
+    async def send_many(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(msg["id"])
+        for idx in range(10):
+            await connection.async_drain()
+            connection.send_event(msg["id"], idx)
+
+    async_register_command(hass, send_many)
+
+    await websocket_client.send_json({"id": 1, "type": "send_many"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "result"
+    for idx in range(10):
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == idx
+
+
 async def test_cleanup_on_cancellation(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -431,6 +458,41 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_messages_sent_as_text_frames(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the encoded messages are sent as text frames."""
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+
+    hass.states.async_set("light.kitchen", "on", {"friendly_name": "Küche"})
+    await websocket_client.send_json({"id": 2, "type": "get_states"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert json_loads(msg.data)["result"][0]["attributes"] == {"friendly_name": "Küche"}
+
+    # Coalesced messages are joined into one text frame
+    await websocket_client.send_json({"id": 3, "type": "subscribe_events"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    hass.bus.async_fire("test_event", {"name": "Küche"})
+    hass.bus.async_fire("test_event", {"name": "Bad"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert [message["event"]["data"]["name"] for message in json_loads(msg.data)] == [
+        "Küche",
+        "Bad",
+    ]
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
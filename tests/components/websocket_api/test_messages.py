@@ -6,9 +6,12 @@ from homeassistant.components.websocket_api.messages import (
     _state_diff_event,
     cached_event_message,
     message_to_json,
+    message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -300,3 +303,28 @@ async def test_message_to_json(caplog: pytest.LogCaptureFixture) -> None:
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
+    """Test we can serialize websocket messages to bytes."""
+    assert (
+        message_to_json_bytes({"id": 1, "message": "xyz"})
+        == b'{"id":1,"message":"xyz"}'
+    )
+    assert (
+        message_to_json_bytes({"id": 1, "message": _Unserializeable()})
+        == b'{"id":1,"type":"result","success":false,"error":{"code":"unknown_error","message":"Invalid JSON in response"}}'
+    )
+    assert "Unable to serialize to JSON" in caplog.text
+
+
+async def test_cached_event_message_bytes(hass: HomeAssistant) -> None:
+    """Test cached event messages are bytes with the id appended."""
+    event = Event("test_event", {"message": "ümlaut"})
+    message = cached_event_message(5, event)
+    assert isinstance(message, bytes)
+    assert json_loads(message) == {
+        "type": "event",
+        "event": json_loads(json_dumps(event)),
+        "id": 5,
+    }
@@ -1113,6 +1113,13 @@ def mock_network() -> Generator[None, None, None]:
         yield
 
 
+@pytest.fixture(autouse=True, scope="session")
+def mock_save_manifest_cache() -> Generator[None, None, None]:
+    """Mock saving the manifest cache into the test config dir."""
+    with patch("homeassistant.loader.async_save_manifest_cache"):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def mock_get_source_ip() -> Generator[None, None, None]:
     """Mock network util's async_get_source_ip."""
@@ -2031,3 +2031,50 @@ def test_deprecated_constants(
 ) -> None:
     """Test deprecated constants."""
     import_and_test_deprecated_constant_enum(caplog, dr, enum, "DISABLED_", "2025.1")
+
+
+async def test_entries_for_area_and_config_entry(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test looking up devices by area and config entry."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+
+    device_1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id, identifiers={("bla", "1")}
+    )
+    device_2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id, identifiers={("bla", "2")}
+    )
+    device_2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id, identifiers={("bla", "2")}
+    )
+    device_1 = device_registry.async_update_device(device_1.id, area_id="kitchen")
+
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [device_1]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [device_1, device_2]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [device_2]
+
+    device_2 = device_registry.async_update_device(
+        device_2.id, area_id="kitchen", remove_config_entry_id=config_entry_1.entry_id
+    )
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [
+        device_1,
+        device_2,
+    ]
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_1.entry_id
+    ) == [device_1]
+
+    device_registry.async_remove_device(device_1.id)
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [device_2]
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_1.entry_id)
+        == []
+    )
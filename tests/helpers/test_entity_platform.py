@@ -1,10 +1,10 @@
 """Tests for the EntityPlatform helper."""
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Callable, Coroutine, Iterable
 from datetime import timedelta
 import logging
 from typing import Any
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 
@@ -76,6 +76,138 @@ async def test_polling_only_updates_entities_it_should_poll(
     assert poll_ent.async_update.called
 
 
+async def test_polling_platforms_spread_over_interval(hass: HomeAssistant) -> None:
+    """Test platforms polling at the same interval are given different phases."""
+    scheduler = entity_platform.async_get_polling_scheduler(hass)
+    first_polls = []
+    second_polls = []
+
+    async def poll_first(now: Any) -> None:
+        first_polls.append(now)
+
+    async def poll_second(now: Any) -> None:
+        second_polls.append(now)
+
+    now = dt_util.utcnow()
+    unsub_first = scheduler.async_schedule(poll_first, timedelta(seconds=20), "first")
+    unsub_second = scheduler.async_schedule(
+        poll_second, timedelta(seconds=20), "second"
+    )
+
+    # The second platform polls 0.382 of the interval in
+    async_fire_time_changed(hass, now + timedelta(seconds=8))
+    await hass.async_block_till_done()
+    assert not first_polls
+    assert len(second_polls) == 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert len(first_polls) == 1
+
+    unsub_first()
+    unsub_second()
+
+
+async def test_polling_phase_given_back(hass: HomeAssistant) -> None:
+    """Test the phase of a platform that stops polling is used again."""
+    scheduler = entity_platform.async_get_polling_scheduler(hass)
+    polls: list[str] = []
+
+    def _poll(name: str) -> Callable[[Any], Coroutine[Any, Any, None]]:
+        async def _async_poll(now: Any) -> None:
+            polls.append(name)
+
+        return _async_poll
+
+    now = dt_util.utcnow()
+    unsub_first = scheduler.async_schedule(
+        _poll("first"), timedelta(seconds=20), "first"
+    )
+    unsub_second = scheduler.async_schedule(
+        _poll("second"), timedelta(seconds=20), "second"
+    )
+    unsub_second()
+    unsub_third = scheduler.async_schedule(
+        _poll("third"), timedelta(seconds=20), "third"
+    )
+
+    # The third platform polls at the phase the second one gave back
+    async_fire_time_changed(hass, now + timedelta(seconds=8))
+    await hass.async_block_till_done()
+    assert polls == ["third"]
+
+    unsub_first()
+    unsub_third()
+
+
+async def test_polling_phase_kept_on_reload(hass: HomeAssistant) -> None:
+    """Test a reloaded platform polls at the phase it had before."""
+    scan_interval = timedelta(seconds=20)
+    first = MockEntityPlatform(hass, platform_name="first", scan_interval=scan_interval)
+    await first.async_add_entities([MockEntity(should_poll=True)])
+    second = MockEntityPlatform(
+        hass, platform_name="second", scan_interval=scan_interval
+    )
+    entity = MockEntity(should_poll=True, entity_id="test_domain.second")
+    entity.async_update = AsyncMock()
+    await second.async_add_entities([entity])
+
+    for _ in range(3):
+        await second.async_reset()
+        entity = MockEntity(should_poll=True, entity_id="test_domain.second")
+        entity.async_update = AsyncMock()
+        await second.async_add_entities([entity])
+
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(seconds=8))
+    await hass.async_block_till_done()
+    assert entity.async_update.called
+
+    await first.async_reset()
+    await second.async_reset()
+
+
+async def test_polling_slows_down_while_updates_overrun(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test polling slows down while updates take longer than the interval."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=10))
+    updates = []
+    update_done = asyncio.Event()
+
+    async def async_update() -> None:
+        updates.append(None)
+        await update_done.wait()
+
+    entity = MockEntity(should_poll=True)
+    entity.async_update = async_update
+    await platform.async_add_entities([entity])
+
+    update_task = hass.async_create_task(
+        platform._update_entity_states(dt_util.utcnow())
+    )
+    await asyncio.sleep(0)
+    await platform._update_entity_states(dt_util.utcnow())
+    await platform._update_entity_states(dt_util.utcnow())
+    assert len(updates) == 1
+    assert platform._poll_interval == timedelta(seconds=40)
+    assert (
+        "Updating test_platform test_domain took longer than the scheduled update"
+        " interval 0:00:20, polling every 0:00:40" in caplog.text
+    )
+
+    update_done.set()
+    await update_task
+    assert platform._poll_interval == timedelta(seconds=10)
+    assert platform._async_unsub_polling is not None
+
+    histograms = entity_platform.async_get_polling_scheduler(
+        hass
+    ).async_latency_histograms()
+    assert sum(histograms["test_domain.test_platform"].values()) == 1
+    assert histograms["test_domain.test_platform"][0.1] == 1
+
+
 async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     """Test the polling of only updated entities."""
     entity_platform = MockEntityPlatform(hass)
@@ -920,6 +920,9 @@ async def test_restore_states(
         "friendly_name": "Mock Original Name",
         "icon": "hass:original-icon",
     }
+    # The states are written in one batch
+    assert all_info_set.context is simple.context
+    assert all_info_set.last_updated == simple.last_updated
 
     entity_registry.async_remove("light.disabled")
     entity_registry.async_remove("light.simple")
@@ -1476,6 +1479,48 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_lookup_indexes() -> None:
+    """Test the lookup indexes of the EntityRegistryItems container."""
+    entities = er.EntityRegistryItems()
+    assert entities.get_entries_for_device_id("device") == []
+
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="entry",
+        device_id="device",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2", "2345", "hue", config_entry_id="entry", device_id="device"
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry") == [entry1, entry2]
+
+    updated = attr.evolve(entry1, area_id="living_room", device_id=None)
+    entities["test.entity1"] = updated
+    assert entities.get_entries_for_device_id("device") == [entry2]
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("living_room") == [updated]
+    # Entries keep their order
+    assert entities.get_entries_for_config_entry_id("entry") == [updated, entry2]
+
+    del entities["test.entity1"]
+    entities.pop("test.entity2")
+    assert entities.get_entries_for_device_id("device") == []
+    assert entities.get_entries_for_area_id("living_room") == []
+    assert entities.get_entries_for_config_entry_id("entry") == []
+    # Empty groups are not kept around
+    assert not entities._device_id_index
+    assert not entities._area_id_index
+    assert not entities._config_entry_id_index
+
+
 async def test_disabled_by_str_not_allowed(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
 ) -> None:
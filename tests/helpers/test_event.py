@@ -44,7 +44,11 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
     track_point_in_utc_time,
 )
-from homeassistant.helpers.template import Template, result_as_boolean
+from homeassistant.helpers.template import (
+    Template,
+    render_cache_info,
+    result_as_boolean,
+)
 from homeassistant.helpers.typing import EventType
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -1737,6 +1741,37 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_identical_templates(hass: HomeAssistant) -> None:
+    """Test identical templates of different trackers are rendered once per change."""
+    template_str = "{{ states('sensor.outdoor_temp') | float > 20 }}"
+    results: list[list[bool]] = [[], []]
+    hass.states.async_set("sensor.outdoor_temp", "15")
+
+    for index, this in enumerate(("automation.one", "automation.two")):
+
+        @callback
+        def _result_listener(
+            event: EventType[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+            index: int = index,
+        ) -> None:
+            results[index].append(updates.pop().result)
+
+        info = async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), {"this": this})],
+            _result_listener,
+        )
+        info.async_refresh()
+    await hass.async_block_till_done()
+
+    hits, misses = render_cache_info()
+    hass.states.async_set("sensor.outdoor_temp", "25")
+    await hass.async_block_till_done()
+    assert render_cache_info() == (hits + 1, misses + 1)
+    assert results == [[False, True], [False, True]]
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -5,6 +5,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -16,7 +17,10 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STATE_COMPACT_INTERVAL,
+    STATE_EXPIRATION,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -352,6 +356,107 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+class _ExtraDataRestoreEntity(RestoreEntity):
+    """A restore entity with extra data."""
+
+    def __init__(self, entity_id: str, same_dict: bool = False) -> None:
+        """Initialize the entity."""
+        self.entity_id = entity_id
+        self.extra = {"value": 1}
+        self.same_dict = same_dict
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData:
+        """Return the extra data."""
+        return RestoredExtraData(self.extra if self.same_dict else dict(self.extra))
+
+
+async def test_dump_changes(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states that did not change are dumped as they were dumped last."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = [_ExtraDataRestoreEntity(f"input_boolean.b{idx}") for idx in range(3)]
+    await platform.async_add_entities(entities)
+    data = async_get(hass)
+
+    async def _async_dump() -> list[dict[str, Any]]:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        return mock_write_data.mock_calls[0][1][0]
+
+    first = await _async_dump()
+    assert [stored["id"] for stored in first] == [
+        "input_boolean.b0",
+        "input_boolean.b1",
+        "input_boolean.b2",
+    ]
+
+    freezer.tick(timedelta(minutes=15))
+    hass.states.async_set("input_boolean.b0", "on")
+    entities[1].extra["value"] = 2
+    await platform.async_add_entities(
+        [_ExtraDataRestoreEntity("input_boolean.b3", same_dict=True)]
+    )
+
+    second = await _async_dump()
+    # The order of the last dump is kept
+    assert [stored["id"] for stored in second] == [
+        "input_boolean.b0",
+        "input_boolean.b1",
+        "input_boolean.b2",
+        "input_boolean.b3",
+    ]
+    assert json_round_trip(second[0])["state"]["state"] == "on"
+    assert second[1]["extra_data"] == {"value": 2}
+    for stored in (second[0], second[1], second[3]):
+        assert stored["last_seen"] == dt_util.utcnow()
+    assert second[2] is first[2]
+
+    # Nothing changed
+    freezer.tick(timedelta(minutes=15))
+    third = await _async_dump()
+    assert all(new is old for new, old in zip(third[:3], second))
+    # The same extra data dict may have been changed in place
+    assert third[3]["last_seen"] == dt_util.utcnow()
+    assert third[3]["extra_data"] == second[3]["extra_data"]
+
+    # All states are dumped again once in a while
+    freezer.tick(STATE_COMPACT_INTERVAL)
+    compacted = await _async_dump()
+    assert [stored["id"] for stored in compacted] == [stored["id"] for stored in second]
+    for stored in compacted:
+        assert stored["last_seen"] == dt_util.utcnow()
+
+
+async def test_dump_expiration_after_compact_interval(hass: HomeAssistant) -> None:
+    """Test saved states expire only after their last_seen could be refreshed."""
+    data = async_get(hass)
+    now = dt_util.utcnow()
+    data.last_states = {
+        "input_boolean.b0": StoredState(
+            State("input_boolean.b0", "off"),
+            None,
+            now - STATE_EXPIRATION - STATE_COMPACT_INTERVAL + timedelta(minutes=1),
+        ),
+        "input_boolean.b1": StoredState(
+            State("input_boolean.b1", "off"),
+            None,
+            now - STATE_EXPIRATION - STATE_COMPACT_INTERVAL - timedelta(minutes=1),
+        ),
+    }
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+
+    written_states = mock_write_data.mock_calls[0][1][0]
+    assert [stored["id"] for stored in written_states] == ["input_boolean.b0"]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -1,8 +1,11 @@
 """Tests for the storage helper."""
 import asyncio
+from copy import deepcopy
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
+import threading
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -16,7 +19,8 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.color import RGBColor
 
 from tests.common import async_fire_time_changed, async_test_home_assistant
@@ -733,3 +737,311 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+def _journal_store(hass: HomeAssistant) -> storage.Store:
+    """Return a store with a journal."""
+    return storage.Store(hass, MOCK_VERSION, MOCK_KEY, atomic_writes=True, journal=True)
+
+
+def _journal_data(count: int, name: str = "entity") -> dict[str, Any]:
+    """Return data with records that can be journaled."""
+    return {
+        "entities": [{"id": str(idx), "name": f"{name} {idx}"} for idx in range(count)],
+        "deleted_entities": [],
+    }
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and replayed when loading."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = _journal_store(hass)
+    data = _journal_data(100)
+    await store.async_save(data)
+    snapshot = await hass.async_add_executor_job(Path(store.path).read_text)
+    assert not os.path.exists(store.journal_path)
+
+    data["entities"][5] = {"id": "5", "name": "renamed"}
+    del data["entities"][7]
+    data["entities"].append({"id": "new", "name": "added"})
+    data["deleted_entities"].append({"id": "7", "name": "entity 7"})
+    await store.async_save(data)
+    # Saving the same data does not add to the journal
+    await store.async_save(data)
+
+    assert await hass.async_add_executor_job(Path(store.path).read_text) == snapshot
+    journal = (
+        await hass.async_add_executor_job(Path(store.journal_path).read_text)
+    ).splitlines()
+    assert len(journal) == 1
+    assert json.loads(journal[0])["upsert"] == {
+        "entities": [{"id": "5", "name": "renamed"}, {"id": "new", "name": "added"}],
+        "deleted_entities": [{"id": "7", "name": "entity 7"}],
+    }
+
+    assert await _journal_store(hass).async_load() == data
+
+    # Records that change order are written to a new snapshot
+    data["entities"].reverse()
+    await store.async_save(data)
+    assert not os.path.exists(store.journal_path)
+    assert await _journal_store(hass).async_load() == data
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_record_list(tmpdir: py.path.local) -> None:
+    """Test changes to data that is a list of records are journaled."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    def _store() -> storage.Store:
+        return storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, encoder=JSONEncoder, journal=True
+        )
+
+    store = _store()
+    now = dt_util.utcnow()
+    data = [{"id": str(idx), "last_seen": now} for idx in range(100)]
+    await store.async_save(data)
+    data[3] = {"id": "3", "last_seen": now + timedelta(seconds=1)}
+    await store.async_save(data)
+
+    journal = await hass.async_add_executor_job(Path(store.journal_path).read_text)
+    assert json.loads(journal)["upsert"] == {
+        "": [{"id": "3", "last_seen": data[3]["last_seen"].isoformat()}]
+    }
+    assert await _store().async_load() == json.loads(json.dumps(data, cls=JSONEncoder))
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_record_encoded_once(tmpdir: py.path.local) -> None:
+    """Test journal records are only encoded once however often they are saved."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = _journal_store(hass)
+    records = [
+        storage.JournalRecord(id=str(idx), name=f"entity {idx}") for idx in range(100)
+    ]
+    await store.async_save({"entities": records})
+    records[5] = storage.JournalRecord(id="5", name="renamed")
+    with patch.object(
+        storage.json_helper, "json_bytes", wraps=storage.json_helper.json_bytes
+    ) as mock_json_bytes:
+        await store.async_save({"entities": records})
+
+    # The changed record and the journal entry
+    assert mock_json_bytes.call_count == 2
+    assert await _journal_store(hass).async_load() == {"entities": records}
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_compacted(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into a snapshot when it grows too large."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = _journal_store(hass)
+    await store.async_save(_journal_data(10))
+    await store.async_save(_journal_data(10, "renamed"))
+    assert not os.path.exists(store.journal_path)
+
+    data = _journal_data(100)
+    await store.async_save(data)
+    for idx in range(20):
+        data["entities"][idx]["name"] = "renamed"
+        await store.async_save(data)
+        if not os.path.exists(store.journal_path):
+            break
+    else:
+        pytest.fail("Journal was not compacted")
+    assert idx > 1
+    assert await _journal_store(hass).async_load() == data
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_incomplete_write(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an interrupted write and a stale journal are ignored when loading."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = _journal_store(hass)
+    data = _journal_data(100)
+    await store.async_save(data)
+    data["entities"][0]["name"] = "renamed"
+    await store.async_save(data)
+    expected = deepcopy(data)
+    data["entities"][1]["name"] = "renamed"
+    await store.async_save(data)
+
+    def _truncate_last_write() -> None:
+        with open(store.journal_path, "rb+") as journal_file:
+            journal_file.truncate(os.path.getsize(store.journal_path) - 5)
+
+    await hass.async_add_executor_job(_truncate_last_write)
+    assert await _journal_store(hass).async_load() == expected
+    assert "Ignoring incomplete write" in caplog.text
+
+    # A journal left behind when writing a snapshot was interrupted
+    journal = await hass.async_add_executor_job(Path(store.journal_path).read_bytes)
+    # The first save of a store writes a snapshot
+    await _journal_store(hass).async_save(_journal_data(100))
+
+    await hass.async_add_executor_job(Path(store.journal_path).write_bytes, journal)
+    assert await _journal_store(hass).async_load() == _journal_data(100)
+
+    await hass.async_stop(force=True)
+
+
+async def test_preload(tmpdir: py.path.local) -> None:
+    """Test stores load the files read by the preload."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_save(MOCK_DATA)
+    journal_store = storage.Store(hass, MOCK_VERSION, "journaled", journal=True)
+    data = _journal_data(100)
+    await journal_store.async_save(data)
+    data["entities"][0]["name"] = "renamed"
+    await journal_store.async_save(data)
+    corrupt_path = hass.config.path(storage.STORAGE_DIR, "corrupt")
+    await hass.async_add_executor_job(Path(corrupt_path).write_text, "{")
+
+    for key in (MOCK_KEY, "journaled", "corrupt", "missing"):
+        storage.async_preload(hass, key)
+    await hass.async_block_till_done()
+    # Files that could not be preloaded are left to the store to read
+    preload = hass.data[storage.STORAGE_PRELOAD]
+    assert preload["corrupt"].result() is None
+    assert preload["missing"].result() is None
+
+    # The files are not read again
+    for path in (journal_store.path, journal_store.journal_path):
+        await hass.async_add_executor_job(os.unlink, path)
+    assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == MOCK_DATA
+    assert (
+        await storage.Store(hass, MOCK_VERSION, "journaled", journal=True).async_load()
+        == data
+    )
+    # The preloaded data is only handed out once
+    assert await storage.Store(hass, MOCK_VERSION, "journaled").async_load() is None
+    assert await storage.Store(hass, MOCK_VERSION, "missing").async_load() is None
+    assert set(hass.data[storage.STORAGE_PRELOAD]) == {"corrupt"}
+
+    # Writing a file discards the preloaded data
+    storage.async_preload(hass, MOCK_KEY)
+    await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_save(MOCK_DATA2)
+    assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == MOCK_DATA2
+
+    # Removing a store discards the preloaded data
+    storage.async_preload(hass, MOCK_KEY)
+    await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_remove()
+    assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() is None
+
+    storage.async_preload(hass, MOCK_KEY)
+    storage.async_clear_preload(hass)
+    assert storage.STORAGE_PRELOAD not in hass.data
+
+    await hass.async_stop(force=True)
+
+
+async def test_preload_does_not_block(tmpdir: py.path.local) -> None:
+    """Test the preload reads the file while other stores load."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_save(MOCK_DATA)
+    await storage.Store(hass, MOCK_VERSION, "other").async_save(MOCK_DATA2)
+
+    reading = threading.Event()
+    release = threading.Event()
+    preload_file = storage._preload_file
+
+    def _slow_preload_file(*args: Any) -> Any:
+        reading.set()
+        release.wait()
+        return preload_file(*args)
+
+    with patch(
+        "homeassistant.helpers.storage._preload_file", _slow_preload_file
+    ), patch(
+        "homeassistant.helpers.storage.json_util.load_json",
+        wraps=json_util.load_json,
+    ) as mock_load_json:
+        storage.async_preload(hass, MOCK_KEY)
+        await hass.async_add_executor_job(reading.wait)
+        # Other stores load while the preloaded file is being read
+        assert await storage.Store(hass, MOCK_VERSION, "other").async_load() == (
+            MOCK_DATA2
+        )
+        load_task = hass.async_create_task(
+            storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load()
+        )
+        await asyncio.sleep(0)
+        assert not load_task.done()
+        release.set()
+        assert await load_task == MOCK_DATA
+
+    # Only the other store read its file
+    assert mock_load_json.call_count == 1
+
+    await hass.async_stop(force=True)
+
+
+async def test_preload_write_while_reading(tmpdir: py.path.local) -> None:
+    """Test a file written while it is preloaded is not handed out."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_save(MOCK_DATA)
+
+    reading = threading.Event()
+    written = threading.Event()
+    preload_file = storage._preload_file
+
+    def _slow_preload_file(*args: Any) -> Any:
+        reading.set()
+        written.wait()
+        return preload_file(*args)
+
+    with patch("homeassistant.helpers.storage._preload_file", _slow_preload_file):
+        storage.async_preload(hass, MOCK_KEY)
+        await hass.async_add_executor_job(reading.wait)
+        await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_save(MOCK_DATA2)
+        written.set()
+        await hass.async_block_till_done()
+
+    assert hass.data[storage.STORAGE_PRELOAD] == {}
+    assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == MOCK_DATA2
+
+    await hass.async_stop(force=True)
@@ -4863,6 +4863,154 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_cache(hass: HomeAssistant) -> None:
+    """Test renders are reused until a dependency of the template changes."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("light.one", "on")
+    tmp = template.Template(
+        "{{ states('sensor.one') }} {{ states.light | count }} {{ value }}", hass
+    )
+
+    def _render(value: int) -> template.RenderInfo:
+        info = tmp.async_render_to_info({"value": value})
+        assert info.result() == f"{hass.states.get('sensor.one').state} 1 {value}"
+        return info
+
+    info = _render(1)
+    hits, misses = template.render_cache_info()
+    assert _render(1) is info
+    assert template.render_cache_info() == (hits + 1, misses)
+
+    # Different variables
+    assert _render(2) is not info
+    info = _render(2)
+    assert _render(2) is info
+
+    # Tracked entity changed
+    hass.states.async_set("sensor.one", "2")
+    assert _render(2) is not info
+    info = _render(2)
+
+    # Unrelated state changed
+    hass.states.async_set("switch.one", "on")
+    assert _render(2) is info
+
+    # Tracked domain changed
+    hass.states.async_set("light.one", "off")
+    assert _render(2) is not info
+
+
+async def test_render_to_info_cache_shared(hass: HomeAssistant) -> None:
+    """Test identical templates share renders when the used variables match."""
+    hass.states.async_set("sensor.one", "1")
+    template_str = "{{ states('sensor.one') }} {{ value }}"
+    info = template.Template(template_str, hass).async_render_to_info(
+        {"value": 1, "this": "one"}
+    )
+    other = template.Template(template_str, hass)
+    # The variable this is not used by the template
+    assert other.async_render_to_info({"value": 1, "this": "two"}) is info
+    assert other.async_render_to_info({"value": 2, "this": "two"}) is not info
+
+    # Included templates can use any variable
+    include = template.Template("{% include 'x.jinja' ignore missing %}", hass)
+    info = include.async_render_to_info({"this": "one"})
+    assert include.async_render_to_info({"this": "one"}) is info
+    assert include.async_render_to_info({"this": "two"}) is not info
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ now() }}",
+        "{{ area_entities('kitchen') }}",
+        "{{ [1, 2, 3] | random }}",
+        "{{ states('sensor.one') | float }}",
+        "{{ my_unknown_var }}",
+    ],
+)
+async def test_render_to_info_not_cached(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test renders with untracked dependencies, warnings or errors are not reused."""
+    hass.states.async_set("sensor.one", "unknown")
+    tmp = template.Template(template_str, hass)
+    assert tmp.async_render_to_info() is not tmp.async_render_to_info()
+
+
+@pytest.mark.parametrize(
+    ("template_str", "expected"),
+    [
+        ("{{ states('sensor.temp') }}", 21.5),
+        ("{{ states('sensor.temp') | float > 20 }}", True),
+        ("{{ states('sensor.temp') | float(0) * 2 - 1 }}", 42.0),
+        ("{{ (states('sensor.temp') | float / 2) | round(1) }}", 10.8),
+        ("{{ states('sensor.temp') | int(base=10, default=7) }}", 21),
+        ("{{ 1 < states('sensor.temp') | float < 30 }}", True),
+        ("{{ is_state('light.kitchen', 'on') and not has_value('sensor.x') }}", True),
+        ("{{ state_attr('light.kitchen', 'brightness') // 2 }}", 50),
+        ("{{ is_state_attr('light.kitchen', 'brightness', 100) or 0 }}", True),
+        ("{{ states('sensor.missing') }}", "unknown"),
+        ("{{ states('sensor.temp') }} °C", "21.5 °C"),
+        ("{{ -state_attr('light.kitchen', 'brightness') }}", -100),
+    ],
+)
+async def test_native_render(
+    hass: HomeAssistant, template_str: str, expected: Any
+) -> None:
+    """Test simple templates are rendered without Jinja."""
+    hass.states.async_set("sensor.temp", "21.5")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    tmp = template.Template(template_str, hass)
+    info = tmp.async_render_to_info()
+    assert tmp._native is not None
+    assert info.result() == expected
+    # The same result as rendering with Jinja
+    with patch.object(template, "_compile_native", return_value=None):
+        jinja_tmp = template.Template(template_str, hass)
+        assert jinja_tmp.async_render() == expected
+        assert jinja_tmp._native is None
+    assert info.entities == jinja_tmp.async_render_to_info().entities
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ value }}",
+        "{{ states.sensor.temp.state }}",
+        "{% if is_state('light.kitchen', 'on') %}on{% endif %}",
+        "{{ -1.5 | abs }}",
+        "{{ 2 ** 3 }}",
+        "{{ [1, 2] }}",
+        "{{ now() }}",
+    ],
+)
+async def test_native_render_not_supported(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates outside of the native subset are rendered with Jinja."""
+    tmp = template.Template(template_str, hass)
+    tmp.async_render({"value": 1})
+    assert tmp._native is None
+
+
+async def test_native_render_shadowed_function(hass: HomeAssistant) -> None:
+    """Test variables shadowing a function are passed to Jinja."""
+    hass.states.async_set("sensor.temp", "21.5")
+    tmp = template.Template("{{ states('sensor.temp') }}", hass)
+    assert tmp.async_render() == 21.5
+    assert tmp._native is not None
+    assert tmp.async_render({"states": lambda entity_id: "shadowed"}) == "shadowed"
+
+
+async def test_native_render_error(hass: HomeAssistant) -> None:
+    """Test errors of native renders are raised as template errors."""
+    tmp = template.Template("{{ states('sensor.missing') | float }}", hass)
+    with pytest.raises(TemplateError, match="no default was specified"):
+        tmp.async_render()
+    assert tmp._native is not None
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
@@ -11,8 +11,8 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import update_coordinator
 from homeassistant.util.dt import utcnow
@@ -489,6 +489,56 @@ async def test_async_set_updated_data(
     remove_callbacks()
 
 
+async def test_async_update_listeners_batch(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the states written by the listeners are only batched if enabled."""
+    events = []
+    batches = []
+    seen_states = []
+
+    @callback
+    def listener(event):
+        events.append(event)
+
+    @callback
+    def batch_listener(events):
+        batches.append(events)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener, batch_listener=batch_listener)
+
+    def _listener(idx: int) -> None:
+        hass.states.async_set(f"sensor.test_{idx}", crd.data)
+        seen_states.append(hass.states.get(f"sensor.test_{idx}"))
+
+    remove_callbacks = [
+        crd.async_add_listener(lambda idx=idx: _listener(idx)) for idx in range(3)
+    ]
+
+    # The listeners see the states they wrote by default
+    crd.async_set_updated_data(100)
+    await hass.async_block_till_done()
+    assert len(events) == 3
+    assert batches == []
+    assert [state.state for state in seen_states] == ["100"] * 3
+
+    events.clear()
+    seen_states.clear()
+    crd.batch_state_writes = True
+    crd.async_set_updated_data(200)
+    await hass.async_block_till_done()
+    assert events == []
+    assert len(batches) == 1
+    assert [event.data["new_state"].state for event in batches[0]] == ["200"] * 3
+    # The states are only written once all listeners were called
+    assert [state.state for state in seen_states] == ["100"] * 3
+
+    # Remove callbacks to avoid lingering timers
+    for remove_callback in remove_callbacks:
+        remove_callback()
+
+
 async def test_stop_refresh_on_ha_stop(
     hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
 ) -> None:
@@ -0,0 +1,24 @@
+"""Test the benchmark script."""
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy.engine import Engine
+
+from homeassistant.core import HomeAssistant
+from homeassistant.scripts import benchmark
+
+
+async def test_recorder_bulk_insert_states(hass: HomeAssistant) -> None:
+    """Test the recorder states benchmark inserts one generation per statement."""
+    states_inserts: list[str] = []
+
+    def _count_states_inserts(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO states "):
+            states_inserts.append(statement)
+
+    sqlalchemy_event.listen(Engine, "before_cursor_execute", _count_states_inserts)
+    try:
+        runtime = await benchmark.BENCHMARKS["recorder_bulk_insert_states"](hass)
+    finally:
+        sqlalchemy_event.remove(Engine, "before_cursor_execute", _count_states_inserts)
+
+    assert runtime > 0
+    assert len(states_inserts) == 100
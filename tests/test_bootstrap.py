@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, runner
+from homeassistant import bootstrap, loader, runner
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -128,6 +128,26 @@ async def test_setting_up_config(hass: HomeAssistant) -> None:
     assert "group" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_integration_startup_report(hass: HomeAssistant) -> None:
+    """Test integrations are imported in the executor and their times reported."""
+    with patch.object(
+        Integration, "_pre_import", autospec=True, side_effect=Integration._pre_import
+    ) as mock_pre_import:
+        await bootstrap._async_set_up_integrations(
+            hass, {"group hello": {}, "homeassistant": {}}
+        )
+
+    assert "group" in hass.config.components
+    # homeassistant was already imported when hass was set up
+    assert [call.args[0].domain for call in mock_pre_import.mock_calls] == ["group"]
+    report = bootstrap.async_get_integration_startup_report(hass)
+    assert report["group"]["import"] == hass.data[loader.DATA_IMPORT_TIME]["group"]
+    assert report["group"]["setup"] > 0
+    totals = [times["import"] + times["setup"] for times in report.values()]
+    assert totals == sorted(totals)
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_all_present(hass: HomeAssistant) -> None:
     """Test after_dependencies when all present."""
@@ -56,6 +56,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers.json import json_dumps
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -930,6 +931,91 @@ async def test_eventbus_run_immediately_not_callback(hass: HomeAssistant) -> Non
         hass.bus.async_listen("test", listener, run_immediately=True)
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can listen for events by entity_id."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    listeners_before = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_keyed(
+        "test", ["light.kitchen", "light.bowl", "light.kitchen"], listener
+    )
+    assert hass.bus.async_listeners()["test"] == listeners_before + 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert calls[0].data["entity_id"] == "light.kitchen"
+    assert calls[1].data["entity_id"] == "light.bowl"
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == listeners_before
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+
+
+async def test_eventbus_keyed_listener_run_immediately(hass: HomeAssistant) -> None:
+    """Test keyed listeners can be called immediately."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "light.kitchen", listener, run_immediately=True
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    # No async_block_till_done here
+    assert len(calls) == 1
+
+    unsub()
+
+    def not_callback_listener(event):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(
+            "test", "light.kitchen", not_callback_listener, run_immediately=True
+        )
+
+
+async def test_eventbus_keyed_listener_remove_twice(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test removing a keyed listener twice logs an exception."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    unsub = hass.bus.async_listen_keyed("test", "light.kitchen", listener)
+    unsub()
+    unsub()
+
+    assert "Unable to remove unknown job listener" in caplog.text
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1249,6 +1335,313 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    kitchen_state = hass.states.get("light.kitchen")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    states_when_fired = []
+
+    @ha.callback
+    def state_listener(event):
+        """Record the states seen when the first event fires."""
+        states_when_fired.append(
+            (hass.states.get("light.bowl").state, hass.states.get("switch.AC").state)
+        )
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, state_listener, run_immediately=True)
+    context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ("light.bowl", "off", {"brightness": 100}),
+            ("light.kitchen", "off", None),
+            ("SWITCH.AC", "on", None),
+            ("switch.ac", "off", None),
+        ],
+        context=context,
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == ["light.bowl", "switch.ac"]
+    assert all(event.context is context for event in events)
+    assert states_when_fired == [("off", "off"), ("off", "off")]
+    assert hass.states.get("light.kitchen") is kitchen_state
+    bowl_state = hass.states.get("light.bowl")
+    ac_state = hass.states.get("switch.ac")
+    assert bowl_state.attributes == {"brightness": 100}
+    assert bowl_state.last_updated == ac_state.last_updated
+    assert [event.data["new_state"] for event in events] == [bowl_state, ac_state]
+
+
+async def test_statemachine_set_many_is_atomic(hass: HomeAssistant) -> None:
+    """Test an invalid state does not apply any part of the batch."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [("light.bowl", "on", None), ("invalid_entity_id", "on", None)]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl") is None
+    assert len(events) == 0
+
+
+async def test_statemachine_set_many_no_changes(hass: HomeAssistant) -> None:
+    """Test a batch without changes does not fire anything."""
+    hass.states.async_set("light.bowl", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many([])
+    hass.states.async_set_many([("light.bowl", "on", None)])
+    await hass.async_block_till_done()
+
+    assert len(events) == 0
+
+    hass.states.async_set_many([("light.bowl", "on", None)], force_update=True)
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+
+
+async def test_statemachine_set_many_batch_listener(hass: HomeAssistant) -> None:
+    """Test batch-aware listeners get the events of a batch in one call."""
+    events = []
+    batches = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        events.append(event)
+
+    @ha.callback
+    def batch_listener(batch):
+        """Mock batch listener."""
+        batches.append(batch)
+
+    unsub = hass.bus.async_listen(
+        EVENT_STATE_CHANGED, listener, batch_listener=batch_listener
+    )
+    hass.states.async_set_many([("light.bowl", "on", None), ("switch.ac", "off", None)])
+    await hass.async_block_till_done()
+
+    assert events == []
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        "light.bowl",
+        "switch.ac",
+    ]
+
+    # Single writes are still delivered to the listener
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert len(batches) == 1
+
+    unsub()
+    hass.states.async_set_many([("light.bowl", "on", None)])
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert len(batches) == 1
+
+
+async def test_eventbus_keyed_batch_listener(hass: HomeAssistant) -> None:
+    """Test keyed batch-aware listeners only get the events of their keys."""
+    batches = []
+    other_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    @ha.callback
+    def batch_listener(batch):
+        """Mock batch listener."""
+        batches.append(batch)
+
+    hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED,
+        ["light.bowl", "light.kitchen"],
+        listener,
+        batch_listener=batch_listener,
+    )
+    hass.states.async_set_many(
+        [
+            ("light.bowl", "on", None),
+            ("light.kitchen", "on", None),
+            ("switch.ac", "on", None),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        "light.bowl",
+        "light.kitchen",
+    ]
+    # Listeners without a batch_listener get every event
+    assert len(other_events) == 3
+
+
+async def test_eventbus_batch_listener_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test batch listener errors are logged and must be callbacks."""
+
+    def not_callback_listener(batch):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(
+            "test_event", lambda event: None, batch_listener=not_callback_listener
+        )
+
+    @ha.callback
+    def bad_listener(batch):
+        """Mock listener that raises."""
+        raise ValueError("boom")
+
+    batches = []
+
+    @ha.callback
+    def batch_listener(batch):
+        """Mock batch listener."""
+        batches.append(batch)
+
+    hass.bus.async_listen("test_event", lambda event: None, batch_listener=bad_listener)
+    hass.bus.async_listen(
+        "test_event", lambda event: None, batch_listener=batch_listener
+    )
+    hass.bus.async_fire_batch("test_event", [({}, None, None), ({}, None, None)])
+
+    assert "Error running batch listener" in caplog.text
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+
+
+async def test_statemachine_batch(hass: HomeAssistant) -> None:
+    """Test states set in a batch block are written when it exits."""
+    hass.states.async_set("light.bowl", "on")
+    bowl_state = hass.states.get("light.bowl")
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batches = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    @ha.callback
+    def batch_listener(batch):
+        """Mock batch listener."""
+        batches.append(batch)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener, batch_listener=batch_listener)
+
+    with hass.states.async_batch():
+        hass.states.async_set("light.bowl", "dim", {"brightness": 10})
+        with hass.states.async_batch():
+            hass.states.async_set("light.bowl", "off")
+        hass.states.async_set("switch.ac", "on")
+        hass.states.async_set("switch.removed", "on")
+        assert hass.states.async_remove("switch.removed")
+        with pytest.raises(InvalidEntityFormatError):
+            hass.states.async_set("invalid", "on")
+        # The states are not written before the block exits
+        assert hass.states.get("light.bowl") is bowl_state
+        assert hass.states.get("switch.ac") is None
+
+    await hass.async_block_till_done()
+    assert hass.states.get("light.bowl").state == "off"
+    assert hass.states.get("light.bowl").attributes == {}
+    assert hass.states.get("switch.ac").state == "on"
+    assert hass.states.get("switch.removed") is None
+    assert [
+        (event.data["old_state"], event.data["new_state"].state) for event in events
+    ] == [(bowl_state, "off"), (None, "on")]
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+
+
+async def test_statemachine_all_json(hass: HomeAssistant) -> None:
+    """Test the serialized snapshot of all states."""
+    assert hass.states.async_all_json() == "[]"
+    assert hass.states.async_all_compressed_json() == "{}"
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("switch.ac", "off")
+    hass.states.async_set("light.kitchen", "off")
+
+    def _expected_json() -> tuple[list[dict], dict[str, dict]]:
+        states = sorted(hass.states.async_all(), key=lambda state: state.domain)
+        return (
+            [json_loads(state.as_dict_json) for state in states],
+            {
+                state.entity_id: json_loads(json_dumps(state.as_compressed_state))
+                for state in states
+            },
+        )
+
+    expected_all, expected_compressed = _expected_json()
+    assert json_loads(hass.states.async_all_json()) == expected_all
+    assert json_loads(hass.states.async_all_compressed_json()) == expected_compressed
+
+    # Domains that did not change are not serialized again
+    states_container = hass.states._states
+    switch_json = states_container._domain_json["switch"]
+    hass.states.async_set("light.bowl", "off")
+    assert "light" not in states_container._domain_json
+    assert "light" not in states_container._domain_compressed_json
+    expected_all, expected_compressed = _expected_json()
+    assert json_loads(hass.states.async_all_json()) == expected_all
+    assert json_loads(hass.states.async_all_compressed_json()) == expected_compressed
+    assert states_container._domain_json["switch"] is switch_json
+
+    hass.states.async_remove("switch.ac")
+    assert "switch" not in states_container._domain_json
+    expected_all, expected_compressed = _expected_json()
+    assert json_loads(hass.states.async_all_json()) == expected_all
+    assert json_loads(hass.states.async_all_compressed_json()) == expected_compressed
+
+
+async def test_statemachine_version(hass: HomeAssistant) -> None:
+    """Test the version of the states increases with every change."""
+    assert hass.states.async_version() == 0
+    assert hass.states.async_version("light") == 0
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.ac", "off")
+    version = hass.states.async_version()
+    light_version = hass.states.async_version("light")
+    assert version > light_version > 0
+
+    hass.states.async_set("switch.ac", "on")
+    assert hass.states.async_version() > version
+    assert hass.states.async_version("light") == light_version
+
+    # Setting the same state is not a change
+    version = hass.states.async_version()
+    hass.states.async_set("switch.ac", "on")
+    assert hass.states.async_version() == version
+
+    hass.states.async_remove("light.bowl")
+    assert hass.states.async_version("light") > light_version
+    assert hass.states.async_version("unknown") == 0
+
+
+async def test_statemachine_all_json_unserializable(hass: HomeAssistant) -> None:
+    """Test the serialized snapshot raises with unserializable states."""
+    hass.states.async_set("light.bowl", "on", {"bad": object()})
+
+    with pytest.raises(TypeError):
+        hass.states.async_all_json()
+    with pytest.raises(TypeError):
+        hass.states.async_all_compressed_json()
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1,4 +1,9 @@
 """Test to verify that we can load components."""
+import asyncio
+import importlib
+import os
+from pathlib import Path
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -512,6 +517,212 @@ async def test_get_custom_components(
         mock_get.assert_called_once_with(hass)
 
 
+def test_manifest_cache(tmp_path: Path) -> None:
+    """Test manifests are only parsed again when they changed."""
+    cache_path = str(tmp_path / loader.MANIFEST_CACHE_FILE)
+    components = tmp_path / "custom_components"
+    (components / "test_1").mkdir(parents=True)
+    manifest_path = components / "test_1" / "manifest.json"
+    manifest_path.write_text('{"domain": "test_1", "version": "1.0.0"}')
+
+    cache = loader.ManifestCache(cache_path)
+    assert cache.sub_directories(str(components)) == ["test_1"]
+    assert cache.read_manifest(manifest_path) == {
+        "domain": "test_1",
+        "version": "1.0.0",
+    }
+    assert cache.read_manifest(components / "test_2" / "manifest.json") is None
+    cache.save()
+
+    cache = loader.ManifestCache(cache_path)
+    with patch("homeassistant.loader.json_loads", wraps=loader.json_loads) as loads:
+        manifest = cache.read_manifest(manifest_path)
+        assert manifest == {"domain": "test_1", "version": "1.0.0"}
+        # The cached manifest is not changed by the integration using it
+        manifest["is_built_in"] = False
+        assert "is_built_in" not in cache.read_manifest(manifest_path)
+        assert cache.sub_directories(str(components)) == ["test_1"]
+    # Only the cache file was parsed
+    assert len(loads.mock_calls) == 1
+
+    manifest_path.write_text('{"domain": "test_1", "version": "1.0.1"}')
+    (components / "test_2").mkdir()
+    assert cache.read_manifest(manifest_path) == {
+        "domain": "test_1",
+        "version": "1.0.1",
+    }
+    assert sorted(cache.sub_directories(str(components))) == ["test_1", "test_2"]
+
+    # A cache written by another version is not used
+    cache.save()
+    with patch("homeassistant.loader.__version__", "0.1"):
+        cache = loader.ManifestCache(cache_path)
+        with patch("homeassistant.loader.json_loads", wraps=loader.json_loads) as loads:
+            cache.read_manifest(manifest_path)
+        assert len(loads.mock_calls) == 2
+
+
+def test_manifest_cache_prunes_unused_entries(tmp_path: Path) -> None:
+    """Test manifests that were not read again are dropped from the cache."""
+    cache_path = str(tmp_path / loader.MANIFEST_CACHE_FILE)
+    manifest_paths = []
+    for domain in ("test_1", "test_2"):
+        (tmp_path / domain).mkdir()
+        manifest_path = tmp_path / domain / "manifest.json"
+        manifest_path.write_text(f'{{"domain": "{domain}"}}')
+        manifest_paths.append(manifest_path)
+
+    cache = loader.ManifestCache(cache_path)
+    for manifest_path in manifest_paths:
+        cache.read_manifest(manifest_path)
+    cache.save()
+
+    cache = loader.ManifestCache(cache_path)
+    assert cache.read_manifest(manifest_paths[0]) == {"domain": "test_1"}
+    cache.save()
+
+    cached = loader.json_loads(Path(cache_path).read_bytes())
+    assert list(cached["manifests"]) == [str(manifest_paths[0])]
+
+
+def test_manifest_cache_not_saved_without_directory(tmp_path: Path) -> None:
+    """Test the manifest cache is not written when its directory is missing."""
+    cache_path = str(tmp_path / "config" / loader.MANIFEST_CACHE_FILE)
+    (tmp_path / "test_1").mkdir()
+    cache = loader.ManifestCache(cache_path)
+    assert cache.sub_directories(str(tmp_path)) == ["test_1"]
+    cache.save()
+    assert not os.path.exists(cache_path)
+
+
+async def test_pre_import(hass: HomeAssistant) -> None:
+    """Test the component waits for the import in the executor."""
+    integration = await loader.async_get_integration(hass, "demo")
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        wraps=importlib.import_module,
+    ) as mock_import:
+        loader.async_pre_import_integrations(
+            hass, [integration], ["light", "not_a_platform"]
+        )
+        await asyncio.sleep(0)
+        component = await integration.async_get_component()
+
+    assert component.__name__ == "homeassistant.components.demo"
+    assert [call.args[0] for call in mock_import.mock_calls] == [
+        "homeassistant.components.demo",
+        "homeassistant.components.demo.light",
+        # Imported again from the event loop where errors are reported
+        "homeassistant.components.demo",
+    ]
+    assert hass.data[loader.DATA_IMPORT_TIME]["demo"] > 0
+
+
+async def test_pre_import_queued(hass: HomeAssistant) -> None:
+    """Test a queued import in the executor is cancelled by the setup."""
+    integration = await loader.async_get_integration(hass, "demo")
+    semaphore = asyncio.Semaphore(1)
+    await semaphore.acquire()
+    with patch.object(integration, "_pre_import") as mock_pre_import:
+        pre_import_task = hass.async_create_task(
+            integration.async_pre_import(["light"], semaphore)
+        )
+        await asyncio.sleep(0)
+        component = await integration.async_get_component()
+        semaphore.release()
+        await pre_import_task
+
+    assert component.__name__ == "homeassistant.components.demo"
+    assert not mock_pre_import.called
+
+
+async def test_pre_import_custom_integration_opt_in(hass: HomeAssistant) -> None:
+    """Test custom integrations are only imported in the executor if they opt in."""
+    integrations = [
+        loader.Integration(
+            hass,
+            f"custom_components.{domain}",
+            None,
+            {"name": domain, "domain": domain, **manifest},
+        )
+        for domain, manifest in (
+            ("test_no_opt_in", {}),
+            ("test_opt_in", {"import_executor": True}),
+        )
+    ]
+    with patch.object(
+        loader.Integration, "_pre_import", autospec=True, return_value=0.0
+    ) as mock_pre_import:
+        loader.async_pre_import_integrations(hass, integrations, [])
+        await hass.async_block_till_done()
+
+    assert [call.args[0].domain for call in mock_pre_import.mock_calls] == [
+        "test_opt_in"
+    ]
+
+
+async def test_pre_import_waits_for_own_import(hass: HomeAssistant) -> None:
+    """Test the component only waits for its own import in the executor."""
+    integration = await loader.async_get_integration(hass, "demo")
+    other = await loader.async_get_integration(hass, "group")
+    semaphore = asyncio.Semaphore(2)
+    demo_importing = threading.Event()
+    release_demo = threading.Event()
+    release_other = threading.Event()
+
+    def _mock_pre_import(self: loader.Integration, platform_names: list[str]) -> float:
+        if self is integration:
+            demo_importing.set()
+            release_demo.wait()
+        else:
+            release_other.wait()
+        return 0.0
+
+    with patch.object(
+        loader.Integration, "_pre_import", autospec=True, side_effect=_mock_pre_import
+    ):
+        demo_task = hass.async_create_task(integration.async_pre_import([], semaphore))
+        other_task = hass.async_create_task(other.async_pre_import([], semaphore))
+        await hass.async_add_executor_job(demo_importing.wait)
+
+        get_component_task = hass.async_create_task(integration.async_get_component())
+        await asyncio.sleep(0)
+        assert not get_component_task.done()
+
+        # The import of the other integration is still running
+        release_demo.set()
+        component = await get_component_task
+        assert component.__name__ == "homeassistant.components.demo"
+        assert not other_task.done()
+
+        release_other.set()
+        await asyncio.gather(demo_task, other_task)
+
+
+async def test_import_retried_after_deadlock(hass: HomeAssistant) -> None:
+    """Test an import is retried when the import system detected a deadlock."""
+
+    class _DeadlockError(RuntimeError):
+        """Mock the error of the import system."""
+
+    integration = await loader.async_get_integration(hass, "demo")
+    module = importlib.import_module(integration.pkg_path)
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        side_effect=[_DeadlockError("deadlock detected"), module],
+    ) as mock_import:
+        component = integration.get_component()
+
+    assert component.__name__ == "homeassistant.components.demo"
+    assert len(mock_import.mock_calls) == 2
+
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        side_effect=RuntimeError("boom"),
+    ), pytest.raises(ImportError):
+        integration.get_platform("light")
+
+
 async def test_get_config_flows(hass: HomeAssistant) -> None:
     """Verify that custom components with config_flow are available."""
     test_1_integration = _get_test_integration(hass, "test_1", False)